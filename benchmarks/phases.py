@@ -0,0 +1,197 @@
+"""
+Benchmarks the parsing phases on the SWF fixtures in tests/swf.
+
+For every fixture and phase the best wall time of several runs, the throughput of
+the bytes the phase consumes and the peak memory traced during one extra run are
+reported. If a baseline was stored with --save, the results are compared against it,
+phases that got slower by more than the threshold are marked and make the script exit
+with 1. No baseline is committed, timings are only comparable on the same machine.
+
+Usage:
+    python benchmarks/phases.py [--runs 5] [--threshold 0.1] [--save] [fixture ...]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from pyfdec.abc.ABCFile import ABCFile
+from pyfdec.extended_buffer import ExtendedBufferView
+from pyfdec.swf import Swf, SwfHeader
+from pyfdec.tag_registry import TAG_REGISTRY
+from pyfdec.tags.Tag import Tag
+from pyfdec.util.export.svg_exporter import SvgExporter
+
+FIXTURES = ['tests/swf/BrawlhallaAir.swf', 'tests/swf/Gfx_Ahsoka_Sword.swf', 'tests/swf/test_Export.swf']
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+SHAPE_TAG_TYPES = (Tag.TagTypes.DefineShape, Tag.TagTypes.DefineShape2, Tag.TagTypes.DefineShape3, Tag.TagTypes.DefineShape4)
+ABC_TAG_TYPES = (Tag.TagTypes.DoABC, Tag.TagTypes.DoABC2)
+
+# A phase prepares its input outside of the measurement and returns it with the number of bytes it consumes
+Phase = Callable[[bytes], tuple[Callable[[], Any], int]]
+
+
+def header_phase(data: bytes) -> tuple[Callable[[], Any], int]:
+    return (lambda: SwfHeader.from_buffer(ExtendedBufferView(data))), len(data)
+
+
+def tag_list_phase(data: bytes) -> tuple[Callable[[], Any], int]:
+    _, body = SwfHeader.from_buffer(ExtendedBufferView(data))
+    offset = body.tell()
+    body_data = body.getvalue()
+
+    def run():
+        buffer = ExtendedBufferView(body_data)
+        buffer.seek(offset)
+        for _ in Swf.get_tag_list(buffer):
+            pass
+
+    return run, len(body_data) - offset
+
+
+def _raw_tags(data: bytes, tag_types: tuple[Tag.TagTypes, ...]) -> list[Any]:
+    swf = Swf.from_buffer(ExtendedBufferView(data), exclude=tag_types)
+    return [tag for tag in swf.tags if tag.tag_type in tag_types]
+
+
+def abc_phase(data: bytes) -> tuple[Callable[[], Any], int]:
+    bodies = []
+    for tag in _raw_tags(data, ABC_TAG_TYPES):
+        if tag.tag_type == Tag.TagTypes.DoABC2:
+            # Skip the flags and the name in front of the ABC data
+            tag.data.read_ui32()
+            tag.data.read_string()
+        bodies.append(tag.data.read())
+
+    def run():
+        for body in bodies:
+            ABCFile.from_buffer(ExtendedBufferView(body))
+
+    return run, sum(len(body) for body in bodies)
+
+
+def shape_records_phase(data: bytes) -> tuple[Callable[[], Any], int]:
+    shapes = []
+    size = 0
+    for tag in _raw_tags(data, SHAPE_TAG_TYPES):
+        body = tag.data.read()
+        buffer = ExtendedBufferView(body)
+        shape = TAG_REGISTRY.decode(tag.tag_type, buffer)
+        shapes.append((type(shape.shapes), buffer, buffer.tell()))  # type: ignore
+        size += len(body)
+
+    def run():
+        for shape_with_style, buffer, position in shapes:
+            buffer.seek(position)
+            for _ in shape_with_style._read_shape_records(buffer):
+                pass
+
+    return run, size
+
+
+def svg_phase(data: bytes) -> tuple[Callable[[], Any], int]:
+    shapes = []
+    size = 0
+    for tag in _raw_tags(data, SHAPE_TAG_TYPES):
+        size += tag.data.bytes_left()
+        shape = TAG_REGISTRY.decode(tag.tag_type, tag.data)
+        shape.shapes.shapeRecords = list(shape.shapes.shapeRecords)  # type: ignore
+        shapes.append(shape)
+
+    def run():
+        for shape in shapes:
+            SvgExporter(shape).getSvgString()
+
+    return run, size
+
+
+PHASES: dict[str, Phase] = {
+    'SwfHeader.from_buffer': header_phase,
+    'Swf.get_tag_list': tag_list_phase,
+    'ABCFile.from_buffer': abc_phase,
+    'DefineShape._read_shape_records': shape_records_phase,
+    'SvgExporter': svg_phase,
+}
+
+
+def measure(phase: Phase, data: bytes, runs: int) -> dict[str, float]:
+    """
+    Returns the best wall time, the throughput and the peak traced memory of `phase`.
+    """
+    run, size = phase(data)
+    seconds = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        run()
+        seconds = min(seconds, time.perf_counter() - start)
+
+    # Tracing slows everything down, so memory is measured in a separate run
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'seconds': seconds,
+        'megabytes_per_second': size / seconds / 1e6 if seconds > 0 else 0.0,
+        'peak_memory': peak,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('fixtures', nargs='*', default=FIXTURES, help='SWF files to benchmark')
+    parser.add_argument('--runs', type=int, default=5, help='runs per phase, the fastest one is reported')
+    parser.add_argument('--threshold', type=float, default=0.1, help='relative slowdown reported as regression')
+    parser.add_argument('--baseline', default=BASELINE, help='baseline JSON to compare against')
+    parser.add_argument('--save', action='store_true', help='store the results as the new baseline')
+    args = parser.parse_args()
+
+    baseline: dict[str, dict[str, dict[str, float]]] = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+
+    results: dict[str, dict[str, dict[str, float]]] = {}
+    regressions = 0
+    print(f'{"fixture":<24} {"phase":<32} {"ms":>10} {"MB/s":>10} {"peak KiB":>10} {"vs baseline":>12}')
+    for fixture in args.fixtures:
+        if not os.path.exists(fixture):
+            print(f'{fixture} does not exist, skipped', file=sys.stderr)
+            continue
+        with open(fixture, 'rb') as file:
+            data = file.read()
+        name = os.path.basename(fixture)
+        results[name] = {}
+        for phase_name, phase in PHASES.items():
+            result = measure(phase, data, args.runs)
+            results[name][phase_name] = result
+
+            comparison = ''
+            previous = baseline.get(name, {}).get(phase_name)
+            if previous is not None and previous['seconds'] > 0:
+                change = result['seconds'] / previous['seconds'] - 1
+                comparison = f'{change:+.1%}'
+                if change > args.threshold:
+                    comparison += ' !'
+                    regressions += 1
+            print(
+                f'{name:<24} {phase_name:<32} {result["seconds"] * 1000:10.2f} {result["megabytes_per_second"]:10.2f} '
+                f'{result["peak_memory"] / 1024:10.1f} {comparison:>12}'
+            )
+
+    if args.save:
+        with open(args.baseline, 'w') as file:
+            json.dump(results, file, indent=2)
+            file.write('\n')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,46 @@
+"""
+Measures how long a fresh interpreter takes to import pyfdec modules.
+
+Every sample starts a new process, so the numbers include what short-lived CLI
+invocations and worker processes pay before they can read the first byte. The
+interpreter startup itself is measured separately and subtracted.
+
+Usage:
+    python benchmarks/startup.py [--runs 20] [module ...]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+DEFAULT_MODULES = ['pyfdec.swf', 'pyfdec.tag_registry', 'pyfdec.tags.DoABC']
+
+
+def measure(statement: str, runs: int) -> float:
+    """
+    Returns the median wall time in seconds of running `statement` in a new interpreter.
+    """
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', statement], check=True)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('modules', nargs='*', default=DEFAULT_MODULES, help='modules to import')
+    parser.add_argument('--runs', type=int, default=20, help='processes to start per measurement')
+    args = parser.parse_args()
+
+    baseline = measure('pass', args.runs)
+    print(f'{"interpreter":<24} {baseline * 1000:8.1f} ms')
+    for module in args.modules:
+        elapsed = measure(f'import {module}', args.runs)
+        print(f'{module:<24} {(elapsed - baseline) * 1000:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
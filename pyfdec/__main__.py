@@ -0,0 +1,5 @@
+import sys
+
+from pyfdec.cli import main
+
+sys.exit(main())
@@ -1,9 +1,15 @@
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
 from enum import Enum, IntFlag
 
+from pyfdec.abc.ABCIndex import ABCIndex
 from pyfdec.abc.ConstantKind import ConstantKind
+from pyfdec.abc.ConstantPool import MultinamePool, NamespaceSetPool, StringPool
+from pyfdec.abc.ControlFlowGraph import ControlFlowGraph
+from pyfdec.abc.CrossReferences import CrossReferences
 from pyfdec.abc.Instructions import Instruction
-from pyfdec.abc.Multinames import BaseMultiname, Multiname, MultinameL, QName, RTQName, RTQNameL, TypeName
+from pyfdec.abc.InstructionStream import InstructionStream
+from pyfdec.abc.NameResolver import NameResolver
 from pyfdec.abc.Traits import TraitInfo
 from pyfdec.extended_buffer import ExtendedBuffer
 
@@ -35,68 +41,34 @@ class ABCFile:
                 name = buffer.read_encoded_u30()
                 return cls(kind, name)
 
-        ints: list[int]
-        uints: list[int]
-        doubles: list[float]
-        strings: list[str]
+        ints: array
+        uints: array
+        doubles: array
+        strings: StringPool
         namespaces: list[NamespaceInfo]
-        namespace_sets: list[list[int]]
-        multinames: list[BaseMultiname]
+        namespace_sets: NamespaceSetPool
+        multinames: MultinamePool
 
         @classmethod
         def from_buffer(cls, buffer: ExtendedBuffer) -> 'ABCFile.CPoolInfo':
             int_count = buffer.read_encoded_u30()
-            ints: list[int] = []
-            [ints.append(buffer.read_encoded_si32()) for _ in range(int_count - 1)]  # type: ignore
+            ints = array('i', buffer.read_encoded_si32_array(max(int_count - 1, 0)))
             uint_count = buffer.read_encoded_u30()
-            uints: list[int] = []
-            [uints.append(buffer.read_encoded_u32()) for _ in range(uint_count - 1)]  # type: ignore
+            uints = array('I', buffer.read_encoded_u32_array(max(uint_count - 1, 0)))
             double_count = buffer.read_encoded_u30()
-            doubles: list[float] = []
-            [doubles.append(buffer.read_f64()) for _ in range(double_count - 1)]  # type: ignore
+            doubles = array('d', buffer.read_f64_array(max(double_count - 1, 0)))
             string_count = buffer.read_encoded_u30()
-            strings: list[str] = []
-            [strings.append(cls.read_abc_string(buffer)) for _ in range(string_count - 1)]  # type: ignore
+            strings = StringPool.from_buffer(buffer, max(string_count - 1, 0))
             namespace_count = buffer.read_encoded_u30()
             namespaces: list['ABCFile.CPoolInfo.NamespaceInfo'] = []
             [namespaces.append(cls.NamespaceInfo.from_buffer(buffer)) for _ in range(namespace_count - 1)]  # type: ignore
             namespace_set_count = buffer.read_encoded_u30()
-            namespace_sets: list[list[int]] = []
-            for _ in range(namespace_set_count - 1):
-                count = buffer.read_ui8()
-                namespace_sets.append([buffer.read_encoded_u30() for _ in range(count)])
-
+            namespace_sets = NamespaceSetPool.from_buffer(buffer, max(namespace_set_count - 1, 0))
             multiname_count = buffer.read_encoded_u30()
-            multinames: list[BaseMultiname] = []
-            [multinames.append(cls.read_multiname(buffer)) for _ in range(multiname_count - 1)]  # type: ignore
+            multinames = MultinamePool.from_buffer(buffer, max(multiname_count - 1, 0))
 
             return cls(ints, uints, doubles, strings, namespaces, namespace_sets, multinames)
 
-        @staticmethod
-        def read_abc_string(buffer: ExtendedBuffer) -> str:
-            length = buffer.read_encoded_u30()
-            data = buffer.read(length)
-            return data.decode('utf-8')
-
-        @staticmethod
-        def read_multiname(buffer: ExtendedBuffer) -> BaseMultiname:
-            kind = BaseMultiname.MultinameKind(buffer.read_ui8())
-            match kind:
-                case BaseMultiname.MultinameKind.QName | BaseMultiname.MultinameKind.QNameA:
-                    return QName.from_buffer(buffer)
-                case BaseMultiname.MultinameKind.RTQName | BaseMultiname.MultinameKind.RTQNameA:
-                    return RTQName.from_buffer(buffer)
-                case BaseMultiname.MultinameKind.RTQNameL | BaseMultiname.MultinameKind.RTQNameLA:
-                    return RTQNameL.from_buffer(buffer)
-                case BaseMultiname.MultinameKind.Multiname | BaseMultiname.MultinameKind.MultinameA:
-                    return Multiname.from_buffer(buffer)
-                case BaseMultiname.MultinameKind.MultinameL | BaseMultiname.MultinameKind.MultinameLA:
-                    return MultinameL.from_buffer(buffer)
-                case BaseMultiname.MultinameKind.TypeName:
-                    return TypeName.from_buffer(buffer)
-                case _:
-                    raise NotImplementedError(f'Unimplemented multiname type: {kind}')
-
     @dataclass
     class MethodInfo:
 
@@ -141,7 +113,7 @@ class ABCFile:
         def from_buffer(cls, buffer: ExtendedBuffer) -> 'ABCFile.MethodInfo':
             param_count = buffer.read_encoded_u30()
             return_type = buffer.read_encoded_u30()
-            param_types = [buffer.read_encoded_u30() for _ in range(param_count)]
+            param_types = buffer.read_encoded_u30_array(param_count)
 
             name = buffer.read_encoded_u30()
             flags = cls.MethodFlags(buffer.read_ui8())
@@ -152,7 +124,7 @@ class ABCFile:
 
             param_names = None
             if flags & cls.MethodFlags.HasParamNames:
-                param_names = [buffer.read_encoded_u30() for _ in range(param_count)]
+                param_names = buffer.read_encoded_u30_array(param_count)
 
             return cls(return_type, param_types, name, flags, options, param_names)
 
@@ -205,7 +177,7 @@ class ABCFile:
                 protected_ns = buffer.read_encoded_u30()
 
             interface_count = buffer.read_encoded_u30()
-            interfaces = [buffer.read_encoded_u30() for _ in range(interface_count)]
+            interfaces = buffer.read_encoded_u30_array(interface_count)
             init = buffer.read_encoded_u30()
             trait_count = buffer.read_encoded_u30()
             traits = [TraitInfo.from_buffer(buffer) for _ in range(trait_count)]
@@ -263,9 +235,44 @@ class ABCFile:
         init_scope_depth: int
         max_scope_depth: int
 
-        code: list[Instruction]
+        # The undecoded code, a view into the buffer the body was read from
+        code_data: memoryview | bytes = field(repr=False)
         exceptions: list[ExceptionInfo]
         traits: list[TraitInfo]
+        _code: list[Instruction] | None = field(default=None, init=False, repr=False, compare=False)
+        _instructions: InstructionStream | None = field(default=None, init=False, repr=False, compare=False)
+        _control_flow_graph: ControlFlowGraph | None = field(default=None, init=False, repr=False, compare=False)
+
+        @property
+        def code(self) -> list[Instruction]:
+            """
+            The instructions of the body as Instruction objects, decoded from `code_data` on first access.
+            """
+            if self._code is None:
+                self._code = self.instructions.to_instructions()
+            return self._code
+
+        @property
+        def instructions(self) -> InstructionStream:
+            """
+            The instructions of the body packed into arrays, decoded from `code_data` on first access.
+            """
+            if self._instructions is None:
+                self._instructions = InstructionStream.from_bytes(self.code_data)
+            return self._instructions
+
+        @property
+        def control_flow_graph(self) -> ControlFlowGraph:
+            """
+            The basic blocks of the body, built on first access.
+            """
+            if self._control_flow_graph is None:
+                self._control_flow_graph = ControlFlowGraph.from_stream(self.instructions, self.exceptions)
+            return self._control_flow_graph
+
+        def __getstate__(self):
+            # Memoryviews can not be pickled, the instructions are decoded again when needed
+            return dict(self.__dict__, code_data=bytes(self.code_data), _code=None, _instructions=None, _control_flow_graph=None)
 
         @classmethod
         def from_buffer(cls, buffer: ExtendedBuffer) -> 'ABCFile.MethodBodyInfo':
@@ -276,10 +283,7 @@ class ABCFile:
             max_scope_depth = buffer.read_encoded_u30()
 
             code_length = buffer.read_encoded_u30()
-            instruction_buffer = buffer.subbuffer(code_length)
-            code = []
-            while instruction_buffer.bytes_left():
-                code.append(Instruction.from_buffer(instruction_buffer))
+            code_data = buffer.subbuffer(code_length).getbuffer()
 
             exception_count = buffer.read_encoded_u30()
             exceptions = [cls.ExceptionInfo.from_buffer(buffer) for _ in range(exception_count)]
@@ -292,7 +296,7 @@ class ABCFile:
                 local_count,
                 init_scope_depth,
                 max_scope_depth,
-                code,
+                code_data,
                 exceptions,
                 traits,
             )
@@ -306,6 +310,38 @@ class ABCFile:
     classes: list[ClassInfo]
     scripts: list[ScriptInfo]
     method_bodies: list[MethodBodyInfo]
+    _names: NameResolver | None = field(default=None, init=False, repr=False, compare=False)
+    _index: ABCIndex | None = field(default=None, init=False, repr=False, compare=False)
+    _cross_references: CrossReferences | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def names(self) -> NameResolver:
+        """
+        Resolves the names of the constant pool, created on first access and reused afterwards.
+        """
+        if self._names is None:
+            self._names = NameResolver(self.cpool)
+        return self._names
+
+    def index(self) -> ABCIndex:
+        """
+        Returns the lookup indexes of the methods, classes and scripts, they are built on first use.
+        """
+        if self._index is None:
+            self._index = ABCIndex.from_abc(self)
+        return self._index
+
+    def cross_references(self) -> CrossReferences:
+        """
+        Returns the instructions that refer to each string, multiname, class and method, they are indexed on first use.
+        """
+        if self._cross_references is None:
+            self._cross_references = CrossReferences.from_abc(self)
+        return self._cross_references
+
+    def __getstate__(self):
+        # The resolved names and the indexes are cheap to build again
+        return dict(self.__dict__, _names=None, _index=None, _cross_references=None)
 
     @classmethod
     def from_buffer(cls, buffer: ExtendedBuffer) -> 'ABCFile':
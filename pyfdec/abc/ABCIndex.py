@@ -0,0 +1,82 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable
+
+from pyfdec.abc.Traits import ClassTrait, TraitInfo
+
+if TYPE_CHECKING:
+    from pyfdec.abc.ABCFile import ABCFile
+
+
+@dataclass
+class ABCIndex:
+    """
+    Hash indexes over the methods, classes and scripts of an ABC file.
+
+    Class and trait names are the ones of `ABCFile.names`, for example `flash.display::MovieClip`.
+    If an obfuscated file defines a class name twice, the first class is indexed. Getters
+    and setters share their name, so the traits of a name are a list.
+
+    Attributes:
+        bodies (dict[int, MethodBodyInfo]): Body of every method index that has one.
+        classes (dict[str, int]): Class index of every class name.
+        instance_traits (list[dict[str, list[TraitInfo]]]): Instance traits of every class by name.
+        class_traits (list[dict[str, list[TraitInfo]]]): Static traits of every class by name.
+        script_classes (list[list[int]]): Class indexes every script defines.
+    """
+    abc: 'ABCFile' = field(repr=False, compare=False)
+    bodies: dict[int, 'ABCFile.MethodBodyInfo'] = field(repr=False)
+    classes: dict[str, int]
+    instance_traits: list[dict[str, list[TraitInfo]]]
+    class_traits: list[dict[str, list[TraitInfo]]]
+    script_classes: list[list[int]]
+
+    @classmethod
+    def from_abc(cls, abc: 'ABCFile') -> 'ABCIndex':
+        """
+        Builds all indexes in one pass over the method bodies, the classes and the scripts.
+        """
+        names = abc.names
+        # Reversed, so the first body of a method wins like the first class of a name does
+        bodies = {body.method: body for body in reversed(abc.method_bodies)}
+
+        classes: dict[str, int] = {}
+        instance_traits = []
+        class_traits = []
+        for class_index, (instance, class_info) in enumerate(zip(abc.instances, abc.classes)):
+            classes.setdefault(names.multiname(instance.name), class_index)
+            instance_traits.append(cls._traits_by_name(instance.traits, names.multiname))
+            class_traits.append(cls._traits_by_name(class_info.traits, names.multiname))
+
+        script_classes = []
+        for script in abc.scripts:
+            script_classes.append([trait.trait.class_index for trait in script.traits if isinstance(trait.trait, ClassTrait)])
+
+        return cls(abc, bodies, classes, instance_traits, class_traits, script_classes)
+
+    @staticmethod
+    def _traits_by_name(traits: list[TraitInfo], multiname: Callable[[int], str]) -> dict[str, list[TraitInfo]]:
+        by_name: dict[str, list[TraitInfo]] = {}
+        for trait in traits:
+            by_name.setdefault(multiname(trait.name), []).append(trait)
+        return by_name
+
+    def body(self, method: int) -> 'ABCFile.MethodBodyInfo | None':
+        """
+        Returns the body of the method with index `method`, None for native and interface methods.
+        """
+        return self.bodies.get(method)
+
+    def find_class(self, name: str) -> 'tuple[ABCFile.InstanceInfo, ABCFile.ClassInfo] | None':
+        """
+        Returns the InstanceInfo and ClassInfo of the class called `name`, or None if there is none.
+        """
+        class_index = self.classes.get(name)
+        if class_index is None:
+            return None
+        return self.abc.instances[class_index], self.abc.classes[class_index]
+
+    def traits(self, class_index: int, name: str, static: bool = False) -> list[TraitInfo]:
+        """
+        Returns the traits called `name` of a class, its static traits if `static` is set.
+        """
+        return (self.class_traits if static else self.instance_traits)[class_index].get(name, [])
@@ -0,0 +1,249 @@
+from abc import ABC, abstractmethod
+from array import array
+from typing import Sequence
+
+from pyfdec.abc.Multinames import BaseMultiname, Multiname, MultinameL, QName, RTQName, RTQNameL, TypeName
+from pyfdec.extended_buffer import ExtendedBuffer
+
+# Number of operands that follow the kind byte of a multiname, TypeName has a variable count
+_MULTINAME_OPERANDS: dict[int, int] = {
+    BaseMultiname.MultinameKind.QName.value: 2,
+    BaseMultiname.MultinameKind.QNameA.value: 2,
+    BaseMultiname.MultinameKind.RTQName.value: 1,
+    BaseMultiname.MultinameKind.RTQNameA.value: 1,
+    BaseMultiname.MultinameKind.RTQNameL.value: 0,
+    BaseMultiname.MultinameKind.RTQNameLA.value: 0,
+    BaseMultiname.MultinameKind.Multiname.value: 2,
+    BaseMultiname.MultinameKind.MultinameA.value: 2,
+    BaseMultiname.MultinameKind.MultinameL.value: 1,
+    BaseMultiname.MultinameKind.MultinameLA.value: 1,
+}
+
+_MULTINAME_CLASSES: dict[int, type[BaseMultiname]] = {
+    BaseMultiname.MultinameKind.QName.value: QName,
+    BaseMultiname.MultinameKind.QNameA.value: QName,
+    BaseMultiname.MultinameKind.RTQName.value: RTQName,
+    BaseMultiname.MultinameKind.RTQNameA.value: RTQName,
+    BaseMultiname.MultinameKind.RTQNameL.value: RTQNameL,
+    BaseMultiname.MultinameKind.RTQNameLA.value: RTQNameL,
+    BaseMultiname.MultinameKind.Multiname.value: Multiname,
+    BaseMultiname.MultinameKind.MultinameA.value: Multiname,
+    BaseMultiname.MultinameKind.MultinameL.value: MultinameL,
+    BaseMultiname.MultinameKind.MultinameLA.value: MultinameL,
+    BaseMultiname.MultinameKind.TypeName.value: TypeName,
+}
+
+_QNAME_KINDS = frozenset((BaseMultiname.MultinameKind.QName.value, BaseMultiname.MultinameKind.QNameA.value))
+_MULTINAME_KINDS = frozenset((BaseMultiname.MultinameKind.Multiname.value, BaseMultiname.MultinameKind.MultinameA.value))
+_RTQNAME_KINDS = frozenset((BaseMultiname.MultinameKind.RTQName.value, BaseMultiname.MultinameKind.RTQNameA.value))
+_MULTINAMEL_KINDS = frozenset((BaseMultiname.MultinameKind.MultinameL.value, BaseMultiname.MultinameKind.MultinameLA.value))
+
+
+class _PackedPool(ABC):
+    """
+    Base of the pools that store their entries in flat arrays instead of one object per entry.
+
+    Like the lists they replace, position 0 holds the entry with constant pool index 1.
+    Slicing returns a list of the materialized entries.
+    """
+    __slots__ = ()
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """
+        Returns the number of entries, the entry at constant pool index 0 is not stored.
+        """
+
+    @abstractmethod
+    def _entry(self, position: int):
+        """
+        Materializes the entry at `position`, which is already checked to be in range.
+        """
+
+    def _start(self, position: int) -> int:
+        return self.ends[position - 1] if position else 0  # type: ignore
+
+    def _position(self, position: int) -> int:
+        length = len(self)
+        if position < 0:
+            position += length
+        if not 0 <= position < length:
+            raise IndexError(f'{type(self).__name__} index out of range')
+        return position
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self._entry(index) for index in range(*position.indices(len(self)))]
+        return self._entry(self._position(position))
+
+    def __iter__(self):
+        for position in range(len(self)):
+            yield self._entry(position)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({list(self)!r})'
+
+
+class StringPool(_PackedPool, Sequence[str]):
+    """
+    The strings of the constant pool, stored as one UTF-8 blob and decoded on access.
+    """
+    __slots__ = ('data', 'ends')
+
+    def __init__(self, data: bytes = b'', ends: array | None = None):
+        self.data: bytes = data
+        # End of every string in `data`, a string starts where the previous one ends
+        self.ends: array = array('I') if ends is None else ends
+
+    @classmethod
+    def from_buffer(cls, buffer: ExtendedBuffer, count: int) -> 'StringPool':
+        data = bytearray()
+        ends = array('I')
+        for _ in range(count):
+            length = buffer.read_encoded_u30()
+            data += buffer.read(length)
+            ends.append(len(data))
+        return cls(bytes(data), ends)
+
+    def __len__(self) -> int:
+        return len(self.ends)
+
+    def _entry(self, position: int) -> str:
+        start = self._start(position)
+        return self.data[start:self.ends[position]].decode('utf-8')
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, StringPool):
+            return self.data == other.data and self.ends == other.ends
+        return NotImplemented
+
+
+class NamespaceSetPool(_PackedPool, Sequence[list[int]]):
+    """
+    The namespace sets of the constant pool, the namespace indexes of all sets are stored in one array.
+    """
+    __slots__ = ('ends', 'namespaces')
+
+    def __init__(self, ends: array | None = None, namespaces: array | None = None):
+        # End of every set in `namespaces`, a set starts where the previous one ends
+        self.ends: array = array('I') if ends is None else ends
+        self.namespaces: array = array('I') if namespaces is None else namespaces
+
+    @classmethod
+    def from_buffer(cls, buffer: ExtendedBuffer, count: int) -> 'NamespaceSetPool':
+        ends = array('I')
+        namespaces = array('I')
+        for _ in range(count):
+            namespace_count = buffer.read_ui8()
+            namespaces.extend(buffer.read_encoded_u30_array(namespace_count))
+            ends.append(len(namespaces))
+        return cls(ends, namespaces)
+
+    def __len__(self) -> int:
+        return len(self.ends)
+
+    def _entry(self, position: int) -> list[int]:
+        start = self._start(position)
+        return self.namespaces[start:self.ends[position]].tolist()
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, NamespaceSetPool):
+            return self.ends == other.ends and self.namespaces == other.namespaces
+        return NotImplemented
+
+
+class MultinamePool(_PackedPool, Sequence[BaseMultiname]):
+    """
+    The multinames of the constant pool, stored as a kind byte and the operands of every multiname.
+
+    Indexing returns the same QName, Multiname, ... objects the pool used to hold, the
+    accessors read single fields without creating them. The operands are the ones in
+    the file: (namespace, name) for QNames, (name) for RTQNames, (name, namespace_set)
+    for Multinames, (namespace_set) for MultinameLs and (name, *params) for TypeNames.
+    """
+    __slots__ = ('kinds', 'ends', 'operands')
+
+    def __init__(self, kinds: bytes = b'', ends: array | None = None, operands: array | None = None):
+        # The raw kind byte, unlike the multiname classes it keeps the attribute variants apart
+        self.kinds: bytes = kinds
+        # End of the operands of every multiname in `operands`
+        self.ends: array = array('I') if ends is None else ends
+        self.operands: array = array('I') if operands is None else operands
+
+    @classmethod
+    def from_buffer(cls, buffer: ExtendedBuffer, count: int) -> 'MultinamePool':
+        kinds = bytearray()
+        ends = array('I')
+        operands = array('I')
+        type_name = BaseMultiname.MultinameKind.TypeName.value
+        for _ in range(count):
+            kind = buffer.read_ui8()
+            operand_count = _MULTINAME_OPERANDS.get(kind)
+            if operand_count is None:
+                if kind != type_name:
+                    # MultinameKind raises a ValueError for unknown kinds, like reading them did before
+                    raise NotImplementedError(f'Unimplemented multiname type: {BaseMultiname.MultinameKind(kind)}')
+                operands.append(buffer.read_encoded_u30())
+                operand_count = buffer.read_encoded_u30()
+            operands.extend(buffer.read_encoded_u30_array(operand_count))
+            kinds.append(kind)
+            ends.append(len(operands))
+        return cls(bytes(kinds), ends, operands)
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def _entry(self, position: int) -> BaseMultiname:
+        operands = self.operands[self._start(position):self.ends[position]]
+        multiname_class = _MULTINAME_CLASSES[self.kinds[position]]
+        if multiname_class is TypeName:
+            return TypeName(operands[0], operands[1:].tolist())
+        return multiname_class(*operands)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, MultinamePool):
+            return self.kinds == other.kinds and self.ends == other.ends and self.operands == other.operands
+        return NotImplemented
+
+    def kind(self, position: int) -> BaseMultiname.MultinameKind:
+        return BaseMultiname.MultinameKind(self.kinds[self._position(position)])
+
+    def operands_of(self, position: int) -> array:
+        position = self._position(position)
+        start = self._start(position)
+        return self.operands[start:self.ends[position]]
+
+    def name(self, position: int) -> int:
+        """
+        Returns the string index of the name of a QName, RTQName or Multiname, 0 for the other kinds.
+        """
+        position = self._position(position)
+        kind = self.kinds[position]
+        start = self._start(position)
+        if kind in _QNAME_KINDS:
+            return self.operands[start + 1]
+        if kind in _RTQNAME_KINDS or kind in _MULTINAME_KINDS:
+            return self.operands[start]
+        return 0
+
+    def namespace(self, position: int) -> int:
+        """
+        Returns the namespace index of a QName, 0 for the other kinds.
+        """
+        position = self._position(position)
+        if self.kinds[position] in _QNAME_KINDS:
+            return self.operands[self._start(position)]
+        return 0
+
+    def namespace_set(self, position: int) -> int:
+        """
+        Returns the namespace set index of a Multiname or MultinameL, 0 for the other kinds.
+        """
+        position = self._position(position)
+        kind = self.kinds[position]
+        start = self._start(position)
+        if kind in _MULTINAME_KINDS:
+            return self.operands[start + 1]
+        if kind in _MULTINAMEL_KINDS:
+            return self.operands[start]
+        return 0
@@ -0,0 +1,133 @@
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Sequence
+
+from pyfdec.abc.InstructionStream import BRANCH_OPCODES, LOOKUPSWITCH, TERMINATOR_OPCODES, InstructionStream
+
+if TYPE_CHECKING:
+    from pyfdec.abc.ABCFile import ABCFile
+
+
+@dataclass
+class BasicBlock:
+    """
+    A run of instructions that is only entered at its first and only left after its last instruction.
+
+    Attributes:
+        start (int): Index of the first instruction.
+        end (int): Index after the last instruction.
+        successors (list[int]): Blocks execution can continue with, the next block first if execution falls through.
+        predecessors (list[int]): Blocks that can continue with this block.
+        handlers (list[int]): Blocks of the exception handlers that cover instructions of this block.
+    """
+    start: int
+    end: int
+    successors: list[int] = field(default_factory=list)
+    predecessors: list[int] = field(default_factory=list)
+    handlers: list[int] = field(default_factory=list)
+
+
+@dataclass
+class ControlFlowGraph:
+    """
+    Basic blocks of a method body and the edges between them.
+
+    Blocks are numbered in code order, block 0 is the entry. Branch targets that are not
+    the start of an instruction have no edge.
+    """
+    blocks: list[BasicBlock]
+    # Block of every instruction
+    block_of: array
+
+    @classmethod
+    def from_stream(
+        cls,
+        stream: InstructionStream,
+        exceptions: Sequence['ABCFile.MethodBodyInfo.ExceptionInfo'] = (),
+    ) -> 'ControlFlowGraph':
+        """
+        Builds the graph in one pass over the instructions to find the block boundaries and one over the blocks to connect them.
+
+        Args:
+            stream (InstructionStream): The instructions of the body.
+            exceptions (Sequence[ExceptionInfo]): The exception handlers of the body, their ranges start new blocks.
+        """
+        if len(stream) == 0:
+            return cls([], array('I'))
+        blocks, block_of = cls._blocks(stream, cls._leaders(stream, exceptions))
+        cls._connect(stream, blocks, block_of)
+        cls._attach_handlers(stream, exceptions, blocks, block_of)
+        return cls(blocks, block_of)
+
+    @staticmethod
+    def _leaders(stream: InstructionStream, exceptions: Sequence['ABCFile.MethodBodyInfo.ExceptionInfo']) -> bytearray:
+        # Marks the instructions that start a block: the entry, branch targets, the instructions
+        # after branches and terminators, and the bounds and targets of the exception handlers
+        count = len(stream)
+        opcodes = stream.opcodes
+        leaders = bytearray(count)
+        leaders[0] = 1
+        for index in range(count):
+            opcode = opcodes[index]
+            if opcode in BRANCH_OPCODES or opcode == LOOKUPSWITCH:
+                for target in stream.targets(index):
+                    if target >= 0:
+                        leaders[target] = 1
+            if (opcode in BRANCH_OPCODES or opcode in TERMINATOR_OPCODES) and index + 1 < count:
+                leaders[index + 1] = 1
+        for exception in exceptions:
+            for offset in (exception.from_pos, exception.to_pos, exception.target):
+                index = stream.index_of(offset)
+                if index >= 0:
+                    leaders[index] = 1
+        return leaders
+
+    @staticmethod
+    def _blocks(stream: InstructionStream, leaders: bytearray) -> tuple[list[BasicBlock], array]:
+        # Splits the instructions into blocks at the leaders
+        count = len(stream)
+        blocks: list[BasicBlock] = []
+        block_of = array('I', [0]) * count
+        for index in range(count):
+            if leaders[index]:
+                if blocks:
+                    blocks[-1].end = index
+                blocks.append(BasicBlock(index, count))
+            block_of[index] = len(blocks) - 1
+        return blocks, block_of
+
+    @staticmethod
+    def _connect(stream: InstructionStream, blocks: list[BasicBlock], block_of: array) -> None:
+        # Adds the fall through and branch edges
+        count = len(stream)
+        for block_index, block in enumerate(blocks):
+            last = block.end - 1
+            successors = block.successors
+            if stream.opcodes[last] not in TERMINATOR_OPCODES and block.end < count:
+                successors.append(block_index + 1)
+            seen = set(successors)
+            for target in stream.targets(last):
+                if target >= 0 and block_of[target] not in seen:
+                    seen.add(block_of[target])
+                    successors.append(block_of[target])
+            for successor in successors:
+                blocks[successor].predecessors.append(block_index)
+
+    @staticmethod
+    def _attach_handlers(
+        stream: InstructionStream,
+        exceptions: Sequence['ABCFile.MethodBodyInfo.ExceptionInfo'],
+        blocks: list[BasicBlock],
+        block_of: array,
+    ) -> None:
+        # Adds the handler of every exception to the blocks its range covers
+        for exception in exceptions:
+            handler = stream.index_of(exception.target)
+            first = bisect_left(stream.offsets, exception.from_pos)
+            end = bisect_left(stream.offsets, exception.to_pos)
+            if handler < 0 or first >= end:
+                continue
+            for block_index in range(block_of[first], block_of[end - 1] + 1):
+                if block_of[handler] not in blocks[block_index].handlers:
+                    blocks[block_index].handlers.append(block_of[handler])
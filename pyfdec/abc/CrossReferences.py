@@ -0,0 +1,125 @@
+from array import array
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from pyfdec.abc.Instructions import Instruction
+from pyfdec.abc.InstructionStream import InstructionStream
+
+if TYPE_CHECKING:
+    from pyfdec.abc.ABCFile import ABCFile
+
+# Operand types that refer to an entry of the constant pool, a class or a method
+REFERENCE_TYPES = (Instruction.ArgType.String, Instruction.ArgType.Multiname, Instruction.ArgType.Class, Instruction.ArgType.Method)
+
+
+def _reference_slots(arg_types: tuple[Instruction.ArgType, ...]) -> tuple[tuple[int, int], ...]:
+    # Position in the operands of the instruction and reference type of every reference operand
+    slots = []
+    slot = 0
+    for arg_type in arg_types:
+        if arg_type in REFERENCE_TYPES:
+            slots.append((slot, REFERENCE_TYPES.index(arg_type)))
+        if arg_type != Instruction.ArgType.Unknown:
+            slot += 1
+    return tuple(slots)
+
+
+_REFERENCE_SLOTS: tuple[tuple[tuple[int, int], ...], ...] = tuple(_reference_slots(arg_types) for _, arg_types in Instruction.OPCODES)
+
+
+@dataclass
+class ReferenceTable:
+    """
+    The uses of all entries of one reference type, grouped by the referenced index.
+
+    The uses of index `i` are the entries `starts[i]` to `starts[i + 1]` of `bodies`, the
+    position of the method body in `ABCFile.method_bodies`, and `offsets`, the byte offset
+    of the instruction in the code of the body.
+    """
+    starts: array
+    bodies: array
+    offsets: array
+
+    @classmethod
+    def from_uses(cls, values: array, bodies: array, offsets: array, size: int) -> 'ReferenceTable':
+        """
+        Groups the uses by their value with a counting sort, uses of the same value stay in order.
+        """
+        if values:
+            size = max(size, max(values) + 1)
+        starts = array('I', [0]) * (size + 1)
+        for value in values:
+            starts[value + 1] += 1
+        for index in range(size):
+            starts[index + 1] += starts[index]
+
+        positions = starts[:-1]
+        sorted_bodies = array('I', [0]) * len(values)
+        sorted_offsets = array('I', [0]) * len(values)
+        for value, body, offset in zip(values, bodies, offsets):
+            position = positions[value]
+            sorted_bodies[position] = body
+            sorted_offsets[position] = offset
+            positions[value] = position + 1
+        return cls(starts, sorted_bodies, sorted_offsets)
+
+    def uses(self, index: int) -> list[tuple[int, int]]:
+        """
+        Returns the (method body position, instruction offset) pairs that refer to `index`.
+        """
+        if not 0 <= index < len(self.starts) - 1:
+            return []
+        start, end = self.starts[index], self.starts[index + 1]
+        return list(zip(self.bodies[start:end], self.offsets[start:end]))
+
+    def count(self, index: int) -> int:
+        if not 0 <= index < len(self.starts) - 1:
+            return 0
+        return self.starts[index + 1] - self.starts[index]
+
+
+@dataclass
+class CrossReferences:
+    """
+    Inverted index from strings, multinames, classes and methods to the instructions that refer to them.
+
+    Indexes are the ones of the instruction operands, constant pool indexes for strings and
+    multinames, positions in `ABCFile.instances` for classes and in `ABCFile.methods` for
+    methods. Only direct operands are indexed, a method that is reached through a trait
+    or a multiname is not a use of the method.
+    """
+    strings: ReferenceTable
+    multinames: ReferenceTable
+    classes: ReferenceTable
+    methods: ReferenceTable
+
+    @classmethod
+    def from_abc(cls, abc: 'ABCFile') -> 'CrossReferences':
+        """
+        Builds the index in one pass over the code of all method bodies.
+
+        Bodies whose instructions were not decoded yet are decoded without keeping the result.
+        """
+        values = [array('I') for _ in REFERENCE_TYPES]
+        bodies = [array('I') for _ in REFERENCE_TYPES]
+        offsets = [array('I') for _ in REFERENCE_TYPES]
+        reference_slots = _REFERENCE_SLOTS
+
+        for body_position, body in enumerate(abc.method_bodies):
+            stream = body._instructions or InstructionStream.from_bytes(body.code_data)
+            opcodes = stream.opcodes
+            operand_starts = stream.operand_starts
+            operands = stream.operands
+            instruction_offsets = stream.offsets
+            for index in range(len(opcodes)):
+                slots = reference_slots[opcodes[index]]
+                if not slots:
+                    continue
+                start = operand_starts[index]
+                for slot, reference_type in slots:
+                    values[reference_type].append(operands[start + slot])
+                    bodies[reference_type].append(body_position)
+                    offsets[reference_type].append(instruction_offsets[index])
+
+        sizes = (len(abc.cpool.strings) + 1, len(abc.cpool.multinames) + 1, len(abc.instances), len(abc.methods))
+        return cls(*(ReferenceTable.from_uses(values[position], bodies[position], offsets[position], size) for position, size in enumerate(sizes)))
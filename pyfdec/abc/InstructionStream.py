@@ -0,0 +1,277 @@
+from array import array
+from bisect import bisect_left
+from typing import Iterator, Sequence
+
+from pyfdec.abc.Instructions import Instruction
+
+# How an operand is encoded in the code, and stored in `InstructionStream.operands`
+_NONE, _S8, _U8, _S32, _U32, _U30, _S24, _SWITCH = range(8)
+
+_ENCODINGS: dict[Instruction.ArgType, int] = {
+    Instruction.ArgType.ByteLiteral: _S8,
+    Instruction.ArgType.UByteLiteral: _U8,
+    Instruction.ArgType.IntLiteral: _S32,
+    Instruction.ArgType.UintLiteral: _U32,
+    Instruction.ArgType.Int: _U30,
+    Instruction.ArgType.Uint: _U30,
+    Instruction.ArgType.Double: _U30,
+    Instruction.ArgType.String: _U30,
+    Instruction.ArgType.Namespace: _U30,
+    Instruction.ArgType.Multiname: _U30,
+    Instruction.ArgType.Class: _U30,
+    Instruction.ArgType.Method: _U30,
+    Instruction.ArgType.JumpTarget: _S24,
+    Instruction.ArgType.SwitchDefaultTarget: _S24,
+    Instruction.ArgType.SwitchTargets: _SWITCH,
+    Instruction.ArgType.Unknown: _NONE,
+}
+
+LOOKUPSWITCH = 0x1B
+# jump and the conditional branches, their only operand is the target
+BRANCH_OPCODES = frozenset(opcode for opcode, (_, arg_types) in enumerate(Instruction.OPCODES) if arg_types == (Instruction.ArgType.JumpTarget,))
+JUMP = 0x10
+# Instructions after which execution does not continue with the next instruction
+TERMINATOR_OPCODES = frozenset((JUMP, LOOKUPSWITCH, 0x03, 0x47, 0x48))  # jump, lookupswitch, throw, returnvoid, returnvalue
+
+_LAYOUTS: tuple[tuple[int, ...], ...] = tuple(tuple(_ENCODINGS[arg_type] for arg_type in arg_types) for _, arg_types in Instruction.OPCODES)
+
+
+def _read_u32(code: memoryview, position: int) -> tuple[int, int]:
+    # Decodes the EncodedU32 at `position`, returns it and the position after it
+    byte = code[position]
+    position += 1
+    value = byte & 0x7F
+    shift = 7
+    while byte & 0x80:
+        byte = code[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+    if value >> 32:
+        raise ValueError('EncodedU32 value is too large')
+    return value, position
+
+
+def _read_switch(code: memoryview, position: int, start: int, operands: array, branch_operands: array) -> int:
+    # Appends the case count and the targets of the lookupswitch at `start`, returns the position after them
+    case_count, position = _read_u32(code, position)
+    # There is one more target than cases
+    target_count = (case_count & 0x3FFFFFFF) + 1
+    operands.append(target_count)
+    for _ in range(target_count):
+        value = code[position] | code[position + 1] << 8 | code[position + 2] << 16
+        position += 3
+        branch_operands.append(len(operands))
+        operands.append(start + (value - 0x1000000 if value & 0x800000 else value))
+    return position
+
+
+class InstructionView:
+    """
+    One instruction of an InstructionStream, reading its fields from the arrays of the stream.
+    """
+    __slots__ = ('stream', 'index')
+
+    def __init__(self, stream: 'InstructionStream', index: int):
+        self.stream: InstructionStream = stream
+        self.index: int = index
+
+    @property
+    def offset(self) -> int:
+        return self.stream.offsets[self.index]
+
+    @property
+    def opcode(self) -> int:
+        return self.stream.opcodes[self.index]
+
+    @property
+    def name(self) -> str:
+        return Instruction.OPCODES[self.opcode][0]
+
+    @property
+    def operands(self) -> array:
+        stream = self.stream
+        return stream.operands[stream.operand_starts[self.index]:stream.operand_starts[self.index + 1]]
+
+    @property
+    def arguments(self) -> list[tuple[Instruction.ArgType, int | list[int] | None]]:
+        """
+        The operands in the form of `Instruction.arguments`.
+        """
+        stream = self.stream
+        operands = stream.operands
+        position = stream.operand_starts[self.index]
+        arguments: list[tuple[Instruction.ArgType, int | list[int] | None]] = []
+        for arg_type in Instruction.OPCODES[stream.opcodes[self.index]][1]:
+            encoding = _ENCODINGS[arg_type]
+            value: int | list[int] | None = None
+            if encoding == _SWITCH:
+                target_count = operands[position]
+                value = operands[position + 1:position + 1 + target_count].tolist()
+                position += 1 + target_count
+            elif encoding == _U32:
+                value = operands[position] & 0xFFFFFFFF
+                position += 1
+            elif encoding != _NONE:
+                value = operands[position]
+                position += 1
+            arguments.append((arg_type, value))
+        return arguments
+
+    @property
+    def targets(self) -> list[int]:
+        """
+        Indexes of the instructions this instruction can branch to, -1 for targets that are not the start of an instruction.
+        """
+        return self.stream.targets(self.index)
+
+    def to_instruction(self) -> Instruction:
+        return Instruction(self.opcode, self.arguments)
+
+    def __repr__(self) -> str:
+        return f'InstructionView(offset={self.offset}, name={self.name!r}, operands={self.operands.tolist()})'
+
+
+class InstructionStream(Sequence[InstructionView]):
+    """
+    The instructions of a method body packed into flat arrays.
+
+    Instruction `i` starts at byte `offsets[i]` of the code and has the opcode
+    `opcodes[i]`. Its operands are `operands[operand_starts[i]:operand_starts[i + 1]]`
+    in the order of its layout in `Instruction.OPCODES`: one value per operand,
+    UintLiterals wrapped to signed 32 bit, and for a lookupswitch the number of case
+    targets followed by the targets. Branch targets are stored as the index of the
+    target instruction, or -1 if no instruction starts at the target. Unknown operands
+    take no space.
+
+    Indexing and iterating hand out InstructionViews, loops over the arrays themselves
+    allocate nothing per instruction.
+    """
+    __slots__ = ('offsets', 'opcodes', 'operand_starts', 'operands')
+
+    def __init__(self, offsets: array, opcodes: bytes, operand_starts: array, operands: array):
+        self.offsets: array = offsets
+        self.opcodes: bytes = opcodes
+        self.operand_starts: array = operand_starts
+        self.operands: array = operands
+
+    @classmethod
+    def from_bytes(cls, data) -> 'InstructionStream':
+        """
+        Decodes the code of a method body.
+
+        Args:
+            data (bytes | memoryview): The code.
+
+        Raises:
+            ValueError: If the last instruction is truncated or an operand is too large.
+        """
+        code = memoryview(data).cast('B')
+        end = len(code)
+        offsets = array('I')
+        opcodes = bytearray()
+        operand_starts = array('I')
+        operands = array('i')
+        append_operand = operands.append
+        # Instruction index by byte offset and the operands that hold a branch target, to
+        # turn the target byte offsets into instruction indexes once all are known
+        index_by_offset = array('i', [-1]) * end
+        branch_operands = array('I')
+        layouts = _LAYOUTS
+        position = 0
+        try:
+            while position < end:
+                index_by_offset[position] = len(offsets)
+                start = position
+                offsets.append(position)
+                operand_starts.append(len(operands))
+                opcode = code[position]
+                position += 1
+                opcodes.append(opcode)
+                for encoding in layouts[opcode]:
+                    if encoding == _U30 or encoding == _U32 or encoding == _S32:
+                        value, position = _read_u32(code, position)
+                        if encoding == _U30:
+                            value &= 0x3FFFFFFF
+                        elif value & 0x80000000:
+                            value -= 0x100000000
+                        append_operand(value)
+                    elif encoding == _S24:
+                        value = code[position] | code[position + 1] << 8 | code[position + 2] << 16
+                        position += 3
+                        branch_operands.append(len(operands))
+                        # Jumps are relative to the next instruction, the lookupswitch default to the lookupswitch
+                        base = start if opcode == LOOKUPSWITCH else position
+                        append_operand(base + (value - 0x1000000 if value & 0x800000 else value))
+                    elif encoding == _U8:
+                        append_operand(code[position])
+                        position += 1
+                    elif encoding == _S8:
+                        value = code[position]
+                        position += 1
+                        append_operand(value - 0x100 if value & 0x80 else value)
+                    elif encoding == _SWITCH:
+                        position = _read_switch(code, position, start, operands, branch_operands)
+        except IndexError:
+            raise ValueError(f'Instruction at byte {offsets[-1]} is truncated') from None
+        operand_starts.append(len(operands))
+
+        for operand in branch_operands:
+            target = operands[operand]
+            operands[operand] = index_by_offset[target] if 0 <= target < end else -1
+        return cls(offsets, bytes(opcodes), operand_starts, operands)
+
+    def __len__(self) -> int:
+        return len(self.opcodes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [InstructionView(self, position) for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('InstructionStream index out of range')
+        return InstructionView(self, index)
+
+    def __iter__(self) -> Iterator[InstructionView]:
+        for index in range(len(self)):
+            yield InstructionView(self, index)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, InstructionStream):
+            return self.offsets == other.offsets and self.opcodes == other.opcodes and self.operands == other.operands
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f'InstructionStream({len(self)} instructions)'
+
+    def index_of(self, offset: int) -> int:
+        """
+        Returns the index of the instruction starting at byte `offset`, or -1 if none starts there.
+        """
+        index = bisect_left(self.offsets, offset)
+        if index < len(self.offsets) and self.offsets[index] == offset:
+            return index
+        return -1
+
+    def targets(self, index: int) -> list[int]:
+        """
+        Returns the indexes of the instructions that instruction `index` can branch to.
+
+        These are the target of a jump or conditional branch and the default and case
+        targets of a lookupswitch, -1 for targets that are not the start of an instruction.
+        The next instruction is not included.
+        """
+        opcode = self.opcodes[index]
+        start = self.operand_starts[index]
+        if opcode == LOOKUPSWITCH:
+            return [self.operands[start], *self.operands[start + 2:self.operand_starts[index + 1]]]
+        if opcode in BRANCH_OPCODES:
+            return [self.operands[start]]
+        return []
+
+    def to_instructions(self) -> list[Instruction]:
+        """
+        Returns the instructions as Instruction objects.
+        """
+        return [view.to_instruction() for view in self]
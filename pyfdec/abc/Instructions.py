@@ -1,11 +1,20 @@
 from dataclasses import dataclass
 from enum import Enum
+from operator import methodcaller
+from typing import Callable, ClassVar
 
 from pyfdec.extended_buffer import ExtendedBuffer
 
 
 @dataclass
 class Instruction:
+    """
+    A decoded AVM2 instruction.
+
+    Decoded on its own, the JumpTarget, SwitchDefaultTarget and SwitchTargets arguments
+    are the byte offsets stored in the code. `MethodBodyInfo.code` resolves them to the
+    index of the target instruction in the body, or -1 if no instruction starts there.
+    """
 
     class ArgType(Enum):
         ByteLiteral = 1
@@ -25,575 +34,325 @@ class Instruction:
         SwitchTargets = 15
         Unknown = 16
 
+    # Name and operand layout of every opcode, indexed by the opcode
+    OPCODES: ClassVar[tuple[tuple[str, tuple[ArgType, ...]], ...]] = (
+        ('db', (ArgType.UByteLiteral,)),  # 0x00
+        ('bkpt', (ArgType.Unknown,)),  # 0x01
+        ('nop', ()),  # 0x02
+        ('throw', ()),  # 0x03
+        ('getsuper', (ArgType.Multiname,)),  # 0x04
+        ('setsuper', (ArgType.Multiname,)),  # 0x05
+        ('dxns', (ArgType.String,)),  # 0x06
+        ('dxnslate', ()),  # 0x07
+        ('kill', (ArgType.UintLiteral,)),  # 0x08
+        ('label', ()),  # 0x09
+        ('0x0A', (ArgType.Unknown,)),  # 0x0A
+        ('0x0B', (ArgType.Unknown,)),  # 0x0B
+        ('ifnlt', (ArgType.JumpTarget,)),  # 0x0C
+        ('ifnle', (ArgType.JumpTarget,)),  # 0x0D
+        ('ifngt', (ArgType.JumpTarget,)),  # 0x0E
+        ('ifnge', (ArgType.JumpTarget,)),  # 0x0F
+        ('jump', (ArgType.JumpTarget,)),  # 0x10
+        ('iftrue', (ArgType.JumpTarget,)),  # 0x11
+        ('iffalse', (ArgType.JumpTarget,)),  # 0x12
+        ('ifeq', (ArgType.JumpTarget,)),  # 0x13
+        ('ifne', (ArgType.JumpTarget,)),  # 0x14
+        ('iflt', (ArgType.JumpTarget,)),  # 0x15
+        ('ifle', (ArgType.JumpTarget,)),  # 0x16
+        ('ifgt', (ArgType.JumpTarget,)),  # 0x17
+        ('ifge', (ArgType.JumpTarget,)),  # 0x18
+        ('ifstricteq', (ArgType.JumpTarget,)),  # 0x19
+        ('ifstrictne', (ArgType.JumpTarget,)),  # 0x1A
+        ('lookupswitch', (ArgType.SwitchDefaultTarget, ArgType.SwitchTargets)),  # 0x1B
+        ('pushwith', ()),  # 0x1C
+        ('popscope', ()),  # 0x1D
+        ('nextname', ()),  # 0x1E
+        ('hasnext', ()),  # 0x1F
+        ('pushnull', ()),  # 0x20
+        ('pushundefined', ()),  # 0x21
+        ('pushuninitialized', (ArgType.Unknown,)),  # 0x22
+        ('nextvalue', ()),  # 0x23
+        ('pushbyte', (ArgType.ByteLiteral,)),  # 0x24
+        ('pushshort', (ArgType.IntLiteral,)),  # 0x25
+        ('pushtrue', ()),  # 0x26
+        ('pushfalse', ()),  # 0x27
+        ('pushnan', ()),  # 0x28
+        ('pop', ()),  # 0x29
+        ('dup', ()),  # 0x2A
+        ('swap', ()),  # 0x2B
+        ('pushstring', (ArgType.String,)),  # 0x2C
+        ('pushint', (ArgType.Int,)),  # 0x2D
+        ('pushuint', (ArgType.Uint,)),  # 0x2E
+        ('pushdouble', (ArgType.Double,)),  # 0x2F
+        ('pushscope', ()),  # 0x30
+        ('pushnamespace', (ArgType.Namespace,)),  # 0x31
+        ('hasnext2', (ArgType.UintLiteral, ArgType.UintLiteral)),  # 0x32
+        ('pushdecimal', (ArgType.Unknown,)),  # 0x33
+        ('pushdnan', (ArgType.Unknown,)),  # 0x34
+        ('li8', ()),  # 0x35
+        ('li16', ()),  # 0x36
+        ('li32', ()),  # 0x37
+        ('lf32', ()),  # 0x38
+        ('lf64', ()),  # 0x39
+        ('si8', ()),  # 0x3A
+        ('si16', ()),  # 0x3B
+        ('si32', ()),  # 0x3C
+        ('sf32', ()),  # 0x3D
+        ('sf64', ()),  # 0x3E
+        ('0x3F', (ArgType.Unknown,)),  # 0x3F
+        ('newfunction', (ArgType.Method,)),  # 0x40
+        ('call', (ArgType.UintLiteral,)),  # 0x41
+        ('construct', (ArgType.UintLiteral,)),  # 0x42
+        ('callmethod', (ArgType.UintLiteral, ArgType.UintLiteral)),  # 0x43
+        ('callstatic', (ArgType.Method, ArgType.UintLiteral)),  # 0x44
+        ('callsuper', (ArgType.Multiname, ArgType.UintLiteral)),  # 0x45
+        ('callproperty', (ArgType.Multiname, ArgType.UintLiteral)),  # 0x46
+        ('returnvoid', ()),  # 0x47
+        ('returnvalue', ()),  # 0x48
+        ('constructsuper', (ArgType.UintLiteral,)),  # 0x49
+        ('constructprop', (ArgType.Multiname, ArgType.UintLiteral)),  # 0x4A
+        ('callsuperid', (ArgType.Unknown,)),  # 0x4B
+        ('callproplex', (ArgType.Multiname, ArgType.UintLiteral)),  # 0x4C
+        ('callinterface', (ArgType.Unknown,)),  # 0x4D
+        ('callsupervoid', (ArgType.Multiname, ArgType.UintLiteral)),  # 0x4E
+        ('callpropvoid', (ArgType.Multiname, ArgType.UintLiteral)),  # 0x4F
+        ('sxi1', ()),  # 0x50
+        ('sxi8', ()),  # 0x51
+        ('sxi16', ()),  # 0x52
+        ('applytype', (ArgType.UintLiteral,)),  # 0x53
+        ('0x54', (ArgType.Unknown,)),  # 0x54
+        ('newobject', (ArgType.UintLiteral,)),  # 0x55
+        ('newarray', (ArgType.UintLiteral,)),  # 0x56
+        ('newactivation', ()),  # 0x57
+        ('newclass', (ArgType.Class,)),  # 0x58
+        ('getdescendants', (ArgType.Multiname,)),  # 0x59
+        ('newcatch', (ArgType.UintLiteral,)),  # 0x5A
+        ('deldescendants', (ArgType.Unknown,)),  # 0x5B
+        ('0x5C', (ArgType.Unknown,)),  # 0x5C
+        ('findpropstrict', (ArgType.Multiname,)),  # 0x5D
+        ('findproperty', (ArgType.Multiname,)),  # 0x5E
+        ('finddef', (ArgType.Multiname,)),  # 0x5F
+        ('getlex', (ArgType.Multiname,)),  # 0x60
+        ('setproperty', (ArgType.Multiname,)),  # 0x61
+        ('getlocal', (ArgType.UintLiteral,)),  # 0x62
+        ('setlocal', (ArgType.UintLiteral,)),  # 0x63
+        ('getglobalscope', ()),  # 0x64
+        ('getscopeobject', (ArgType.UByteLiteral,)),  # 0x65
+        ('getproperty', (ArgType.Multiname,)),  # 0x66
+        ('getouterscope', (ArgType.UintLiteral,)),  # 0x67
+        ('initproperty', (ArgType.Multiname,)),  # 0x68
+        ('setpropertylate', ()),  # 0x69
+        ('deleteproperty', (ArgType.Multiname,)),  # 0x6A
+        ('deletepropertylate', ()),  # 0x6B
+        ('getslot', (ArgType.UintLiteral,)),  # 0x6C
+        ('setslot', (ArgType.UintLiteral,)),  # 0x6D
+        ('getglobalslot', (ArgType.UintLiteral,)),  # 0x6E
+        ('setglobalslot', (ArgType.UintLiteral,)),  # 0x6F
+        ('convert_s', ()),  # 0x70
+        ('esc_xelem', ()),  # 0x71
+        ('esc_xattr', ()),  # 0x72
+        ('convert_i', ()),  # 0x73
+        ('convert_u', ()),  # 0x74
+        ('convert_d', ()),  # 0x75
+        ('convert_b', ()),  # 0x76
+        ('convert_o', ()),  # 0x77
+        ('checkfilter', ()),  # 0x78
+        ('convert_m', (ArgType.Unknown,)),  # 0x79
+        ('convert_m_p', (ArgType.Unknown,)),  # 0x7A
+        ('0x7B', (ArgType.Unknown,)),  # 0x7B
+        ('0x7C', (ArgType.Unknown,)),  # 0x7C
+        ('0x7D', (ArgType.Unknown,)),  # 0x7D
+        ('0x7E', (ArgType.Unknown,)),  # 0x7E
+        ('0x7F', (ArgType.Unknown,)),  # 0x7F
+        ('coerce', (ArgType.Multiname,)),  # 0x80
+        ('coerce_b', ()),  # 0x81
+        ('coerce_a', ()),  # 0x82
+        ('coerce_i', ()),  # 0x83
+        ('coerce_d', ()),  # 0x84
+        ('coerce_s', ()),  # 0x85
+        ('astype', (ArgType.Multiname,)),  # 0x86
+        ('astypelate', ()),  # 0x87
+        ('coerce_u', (ArgType.Unknown,)),  # 0x88
+        ('coerce_o', (ArgType.Unknown,)),  # 0x89
+        ('0x8A', (ArgType.Unknown,)),  # 0x8A
+        ('0x8B', (ArgType.Unknown,)),  # 0x8B
+        ('0x8C', (ArgType.Unknown,)),  # 0x8C
+        ('0x8D', (ArgType.Unknown,)),  # 0x8D
+        ('0x8E', (ArgType.Unknown,)),  # 0x8E
+        ('negate_p', (ArgType.Unknown,)),  # 0x8F
+        ('negate', ()),  # 0x90
+        ('increment', ()),  # 0x91
+        ('inclocal', (ArgType.UintLiteral,)),  # 0x92
+        ('decrement', ()),  # 0x93
+        ('declocal', (ArgType.UintLiteral,)),  # 0x94
+        ('typeof', ()),  # 0x95
+        ('not', ()),  # 0x96
+        ('bitnot', ()),  # 0x97
+        ('0x98', (ArgType.Unknown,)),  # 0x98
+        ('0x99', (ArgType.Unknown,)),  # 0x99
+        ('concat', (ArgType.Unknown,)),  # 0x9A
+        ('add_d', (ArgType.Unknown,)),  # 0x9B
+        ('increment_p', (ArgType.Unknown,)),  # 0x9C
+        ('inclocal_p', (ArgType.Unknown,)),  # 0x9D
+        ('decrement_p', (ArgType.Unknown,)),  # 0x9E
+        ('declocal_p', (ArgType.Unknown,)),  # 0x9F
+        ('add', ()),  # 0xA0
+        ('subtract', ()),  # 0xA1
+        ('multiply', ()),  # 0xA2
+        ('divide', ()),  # 0xA3
+        ('modulo', ()),  # 0xA4
+        ('lshift', ()),  # 0xA5
+        ('rshift', ()),  # 0xA6
+        ('urshift', ()),  # 0xA7
+        ('bitand', ()),  # 0xA8
+        ('bitor', ()),  # 0xA9
+        ('bitxor', ()),  # 0xAA
+        ('equals', ()),  # 0xAB
+        ('strictequals', ()),  # 0xAC
+        ('lessthan', ()),  # 0xAD
+        ('lessequals', ()),  # 0xAE
+        ('greaterthan', ()),  # 0xAF
+        ('greaterequals', ()),  # 0xB0
+        ('instanceof', ()),  # 0xB1
+        ('istype', (ArgType.Multiname,)),  # 0xB2
+        ('istypelate', ()),  # 0xB3
+        ('in', ()),  # 0xB4
+        ('add_p', (ArgType.Unknown,)),  # 0xB5
+        ('subtract_p', (ArgType.Unknown,)),  # 0xB6
+        ('multiply_p', (ArgType.Unknown,)),  # 0xB7
+        ('divide_p', (ArgType.Unknown,)),  # 0xB8
+        ('modulo_p', (ArgType.Unknown,)),  # 0xB9
+        ('0xBA', (ArgType.Unknown,)),  # 0xBA
+        ('0xBB', (ArgType.Unknown,)),  # 0xBB
+        ('0xBC', (ArgType.Unknown,)),  # 0xBC
+        ('0xBD', (ArgType.Unknown,)),  # 0xBD
+        ('0xBE', (ArgType.Unknown,)),  # 0xBE
+        ('0xBF', (ArgType.Unknown,)),  # 0xBF
+        ('increment_i', ()),  # 0xC0
+        ('decrement_i', ()),  # 0xC1
+        ('inclocal_i', (ArgType.UintLiteral,)),  # 0xC2
+        ('declocal_i', (ArgType.UintLiteral,)),  # 0xC3
+        ('negate_i', ()),  # 0xC4
+        ('add_i', ()),  # 0xC5
+        ('subtract_i', ()),  # 0xC6
+        ('multiply_i', ()),  # 0xC7
+        ('0xC8', (ArgType.Unknown,)),  # 0xC8
+        ('0xC9', (ArgType.Unknown,)),  # 0xC9
+        ('0xCA', (ArgType.Unknown,)),  # 0xCA
+        ('0xCB', (ArgType.Unknown,)),  # 0xCB
+        ('0xCC', (ArgType.Unknown,)),  # 0xCC
+        ('0xCD', (ArgType.Unknown,)),  # 0xCD
+        ('0xCE', (ArgType.Unknown,)),  # 0xCE
+        ('0xCF', (ArgType.Unknown,)),  # 0xCF
+        ('getlocal0', ()),  # 0xD0
+        ('getlocal1', ()),  # 0xD1
+        ('getlocal2', ()),  # 0xD2
+        ('getlocal3', ()),  # 0xD3
+        ('setlocal0', ()),  # 0xD4
+        ('setlocal1', ()),  # 0xD5
+        ('setlocal2', ()),  # 0xD6
+        ('setlocal3', ()),  # 0xD7
+        ('0xD8', (ArgType.Unknown,)),  # 0xD8
+        ('0xD9', (ArgType.Unknown,)),  # 0xD9
+        ('0xDA', (ArgType.Unknown,)),  # 0xDA
+        ('0xDB', (ArgType.Unknown,)),  # 0xDB
+        ('0xDC', (ArgType.Unknown,)),  # 0xDC
+        ('0xDD', (ArgType.Unknown,)),  # 0xDD
+        ('0xDE', (ArgType.Unknown,)),  # 0xDE
+        ('0xDF', (ArgType.Unknown,)),  # 0xDF
+        ('0xE0', (ArgType.Unknown,)),  # 0xE0
+        ('0xE1', (ArgType.Unknown,)),  # 0xE1
+        ('0xE2', (ArgType.Unknown,)),  # 0xE2
+        ('0xE3', (ArgType.Unknown,)),  # 0xE3
+        ('0xE4', (ArgType.Unknown,)),  # 0xE4
+        ('0xE5', (ArgType.Unknown,)),  # 0xE5
+        ('0xE6', (ArgType.Unknown,)),  # 0xE6
+        ('0xE7', (ArgType.Unknown,)),  # 0xE7
+        ('0xE8', (ArgType.Unknown,)),  # 0xE8
+        ('0xE9', (ArgType.Unknown,)),  # 0xE9
+        ('0xEA', (ArgType.Unknown,)),  # 0xEA
+        ('0xEB', (ArgType.Unknown,)),  # 0xEB
+        ('0xEC', (ArgType.Unknown,)),  # 0xEC
+        ('0xED', (ArgType.Unknown,)),  # 0xED
+        ('0xEE', (ArgType.Unknown,)),  # 0xEE
+        ('debug', (ArgType.UByteLiteral, ArgType.String, ArgType.UByteLiteral, ArgType.UintLiteral)),  # 0xEF
+        ('debugline', (ArgType.UintLiteral,)),  # 0xF0
+        ('debugfile', (ArgType.String,)),  # 0xF1
+        ('bkptline', (ArgType.Unknown,)),  # 0xF2
+        ('timestamp', (ArgType.Unknown,)),  # 0xF3
+        ('0xF4', (ArgType.Unknown,)),  # 0xF4
+        ('0xF5', (ArgType.Unknown,)),  # 0xF5
+        ('0xF6', (ArgType.Unknown,)),  # 0xF6
+        ('0xF7', (ArgType.Unknown,)),  # 0xF7
+        ('0xF8', (ArgType.Unknown,)),  # 0xF8
+        ('0xF9', (ArgType.Unknown,)),  # 0xF9
+        ('0xFA', (ArgType.Unknown,)),  # 0xFA
+        ('0xFB', (ArgType.Unknown,)),  # 0xFB
+        ('0xFC', (ArgType.Unknown,)),  # 0xFC
+        ('0xFD', (ArgType.Unknown,)),  # 0xFD
+        ('0xFE', (ArgType.Unknown,)),  # 0xFE
+        ('0xFF', (ArgType.Unknown,)),  # 0xFF
+    )
+
     opcode: int
     arguments: list[tuple[ArgType, int | list[int] | None]]
 
     @classmethod
     def from_buffer(cls, buffer: ExtendedBuffer) -> 'Instruction':
         opcode = buffer.read_ui8()
-        _, arg_types = cls.get_info(opcode)
+        return cls(opcode, _OPERAND_DECODERS[opcode](buffer))
 
-        arguments: list[tuple['Instruction.ArgType', int | list[int] | None]] = []
-        for arg_type in arg_types:
-            value: int | list[int] | None = None
-            match arg_type:
-                case cls.ArgType.ByteLiteral:
-                    value = buffer.read_si8()
-                case cls.ArgType.UByteLiteral:
-                    value = buffer.read_ui8()
-                case cls.ArgType.IntLiteral:
-                    value = buffer.read_encoded_si32()
-                case cls.ArgType.UintLiteral:
-                    value = buffer.read_encoded_u32()
-                case cls.ArgType.Int:
-                    value = buffer.read_encoded_u30()
-                case cls.ArgType.Uint:
-                    value = buffer.read_encoded_u30()
-                case cls.ArgType.Double:
-                    value = buffer.read_encoded_u30()
-                case cls.ArgType.String:
-                    value = buffer.read_encoded_u30()
-                case cls.ArgType.Namespace:
-                    value = buffer.read_encoded_u30()
-                case cls.ArgType.Multiname:
-                    value = buffer.read_encoded_u30()
-                case cls.ArgType.Class:
-                    value = buffer.read_encoded_u30()
-                case cls.ArgType.Method:
-                    value = buffer.read_encoded_u30()
+    @classmethod
+    def get_info(cls, opcode: int) -> tuple[str, tuple[ArgType, ...]]:
+        return cls.OPCODES[opcode]
 
-                # TODO: convert relative byte offset to instruction offset
-                case cls.ArgType.JumpTarget:
-                    buffer.read_si24()
-                case cls.ArgType.SwitchDefaultTarget:
-                    buffer.read_si24()
-                case cls.ArgType.SwitchTargets:
-                    target_count = buffer.read_encoded_u30() + 1
-                    value = [buffer.read_si24() for _ in range(target_count)]
 
-                case cls.ArgType.Unknown:
-                    value = None
-                    pass
-                case _:
-                    raise NotImplementedError(f'Unimplemented arg type: {arg_type}')
-            arguments.append((arg_type, value))
+def _read_switch_targets(buffer: ExtendedBuffer) -> list[int]:
+    target_count = buffer.read_encoded_u30() + 1
+    return buffer.read_si24_array(target_count)
 
-        return cls(opcode, arguments)
 
-    @classmethod
-    def get_info(cls, opcode: int) -> tuple[str, list[ArgType]]:
-        match opcode:
-            case 0x00:
-                return ('db', [cls.ArgType.UByteLiteral])
-            case 0x01:
-                return ('bkpt', [cls.ArgType.Unknown])
-            case 0x02:
-                return ('nop', [])
-            case 0x03:
-                return ('throw', [])
-            case 0x04:
-                return ('getsuper', [cls.ArgType.Multiname])
-            case 0x05:
-                return ('setsuper', [cls.ArgType.Multiname])
-            case 0x06:
-                return ('dxns', [cls.ArgType.String])
-            case 0x07:
-                return ('dxnslate', [])
-            case 0x08:
-                return ('kill', [cls.ArgType.UintLiteral])
-            case 0x09:
-                return ('label', [])
-            case 0x0A:
-                return ('0x0A', [cls.ArgType.Unknown])
-            case 0x0B:
-                return ('0x0B', [cls.ArgType.Unknown])
-            case 0x0C:
-                return ('ifnlt', [cls.ArgType.JumpTarget])
-            case 0x0D:
-                return ('ifnle', [cls.ArgType.JumpTarget])
-            case 0x0E:
-                return ('ifngt', [cls.ArgType.JumpTarget])
-            case 0x0F:
-                return ('ifnge', [cls.ArgType.JumpTarget])
-            case 0x10:
-                return ('jump', [cls.ArgType.JumpTarget])
-            case 0x11:
-                return ('iftrue', [cls.ArgType.JumpTarget])
-            case 0x12:
-                return ('iffalse', [cls.ArgType.JumpTarget])
-            case 0x13:
-                return ('ifeq', [cls.ArgType.JumpTarget])
-            case 0x14:
-                return ('ifne', [cls.ArgType.JumpTarget])
-            case 0x15:
-                return ('iflt', [cls.ArgType.JumpTarget])
-            case 0x16:
-                return ('ifle', [cls.ArgType.JumpTarget])
-            case 0x17:
-                return ('ifgt', [cls.ArgType.JumpTarget])
-            case 0x18:
-                return ('ifge', [cls.ArgType.JumpTarget])
-            case 0x19:
-                return ('ifstricteq', [cls.ArgType.JumpTarget])
-            case 0x1A:
-                return ('ifstrictne', [cls.ArgType.JumpTarget])
-            case 0x1B:
-                return ('lookupswitch', [cls.ArgType.SwitchDefaultTarget, cls.ArgType.SwitchTargets])
-            case 0x1C:
-                return ('pushwith', [])
-            case 0x1D:
-                return ('popscope', [])
-            case 0x1E:
-                return ('nextname', [])
-            case 0x1F:
-                return ('hasnext', [])
-            case 0x20:
-                return ('pushnull', [])
-            case 0x21:
-                return ('pushundefined', [])
-            case 0x22:
-                return ('pushuninitialized', [cls.ArgType.Unknown])
-            case 0x23:
-                return ('nextvalue', [])
-            case 0x24:
-                return ('pushbyte', [cls.ArgType.ByteLiteral])
-            case 0x25:
-                return ('pushshort', [cls.ArgType.IntLiteral])
-            case 0x26:
-                return ('pushtrue', [])
-            case 0x27:
-                return ('pushfalse', [])
-            case 0x28:
-                return ('pushnan', [])
-            case 0x29:
-                return ('pop', [])
-            case 0x2A:
-                return ('dup', [])
-            case 0x2B:
-                return ('swap', [])
-            case 0x2C:
-                return ('pushstring', [cls.ArgType.String])
-            case 0x2D:
-                return ('pushint', [cls.ArgType.Int])
-            case 0x2E:
-                return ('pushuint', [cls.ArgType.Uint])
-            case 0x2F:
-                return ('pushdouble', [cls.ArgType.Double])
-            case 0x30:
-                return ('pushscope', [])
-            case 0x31:
-                return ('pushnamespace', [cls.ArgType.Namespace])
-            case 0x32:
-                return ('hasnext2', [cls.ArgType.UintLiteral, cls.ArgType.UintLiteral])
-            case 0x33:
-                return ('pushdecimal', [cls.ArgType.Unknown])
-            case 0x34:
-                return ('pushdnan', [cls.ArgType.Unknown])
-            case 0x35:
-                return ('li8', [])
-            case 0x36:
-                return ('li16', [])
-            case 0x37:
-                return ('li32', [])
-            case 0x38:
-                return ('lf32', [])
-            case 0x39:
-                return ('lf64', [])
-            case 0x3A:
-                return ('si8', [])
-            case 0x3B:
-                return ('si16', [])
-            case 0x3C:
-                return ('si32', [])
-            case 0x3D:
-                return ('sf32', [])
-            case 0x3E:
-                return ('sf64', [])
-            case 0x3F:
-                return ('0x3F', [cls.ArgType.Unknown])
-            case 0x40:
-                return ('newfunction', [cls.ArgType.Method])
-            case 0x41:
-                return ('call', [cls.ArgType.UintLiteral])
-            case 0x42:
-                return ('construct', [cls.ArgType.UintLiteral])
-            case 0x43:
-                return ('callmethod', [cls.ArgType.UintLiteral, cls.ArgType.UintLiteral])
-            case 0x44:
-                return ('callstatic', [cls.ArgType.Method, cls.ArgType.UintLiteral])
-            case 0x45:
-                return ('callsuper', [cls.ArgType.Multiname, cls.ArgType.UintLiteral])
-            case 0x46:
-                return ('callproperty', [cls.ArgType.Multiname, cls.ArgType.UintLiteral])
-            case 0x47:
-                return ('returnvoid', [])
-            case 0x48:
-                return ('returnvalue', [])
-            case 0x49:
-                return ('constructsuper', [cls.ArgType.UintLiteral])
-            case 0x4A:
-                return ('constructprop', [cls.ArgType.Multiname, cls.ArgType.UintLiteral])
-            case 0x4B:
-                return ('callsuperid', [cls.ArgType.Unknown])
-            case 0x4C:
-                return ('callproplex', [cls.ArgType.Multiname, cls.ArgType.UintLiteral])
-            case 0x4D:
-                return ('callinterface', [cls.ArgType.Unknown])
-            case 0x4E:
-                return ('callsupervoid', [cls.ArgType.Multiname, cls.ArgType.UintLiteral])
-            case 0x4F:
-                return ('callpropvoid', [cls.ArgType.Multiname, cls.ArgType.UintLiteral])
-            case 0x50:
-                return ('sxi1', [])
-            case 0x51:
-                return ('sxi8', [])
-            case 0x52:
-                return ('sxi16', [])
-            case 0x53:
-                return ('applytype', [cls.ArgType.UintLiteral])
-            case 0x54:
-                return ('0x54', [cls.ArgType.Unknown])
-            case 0x55:
-                return ('newobject', [cls.ArgType.UintLiteral])
-            case 0x56:
-                return ('newarray', [cls.ArgType.UintLiteral])
-            case 0x57:
-                return ('newactivation', [])
-            case 0x58:
-                return ('newclass', [cls.ArgType.Class])
-            case 0x59:
-                return ('getdescendants', [cls.ArgType.Multiname])
-            case 0x5A:
-                return ('newcatch', [cls.ArgType.UintLiteral])
-            case 0x5B:
-                return ('deldescendants', [cls.ArgType.Unknown])
-            case 0x5C:
-                return ('0x5C', [cls.ArgType.Unknown])
-            case 0x5D:
-                return ('findpropstrict', [cls.ArgType.Multiname])
-            case 0x5E:
-                return ('findproperty', [cls.ArgType.Multiname])
-            case 0x5F:
-                return ('finddef', [cls.ArgType.Multiname])
-            case 0x60:
-                return ('getlex', [cls.ArgType.Multiname])
-            case 0x61:
-                return ('setproperty', [cls.ArgType.Multiname])
-            case 0x62:
-                return ('getlocal', [cls.ArgType.UintLiteral])
-            case 0x63:
-                return ('setlocal', [cls.ArgType.UintLiteral])
-            case 0x64:
-                return ('getglobalscope', [])
-            case 0x65:
-                return ('getscopeobject', [cls.ArgType.UByteLiteral])
-            case 0x66:
-                return ('getproperty', [cls.ArgType.Multiname])
-            case 0x67:
-                return ('getouterscope', [cls.ArgType.UintLiteral])
-            case 0x68:
-                return ('initproperty', [cls.ArgType.Multiname])
-            case 0x69:
-                return ('setpropertylate', [])
-            case 0x6A:
-                return ('deleteproperty', [cls.ArgType.Multiname])
-            case 0x6B:
-                return ('deletepropertylate', [])
-            case 0x6C:
-                return ('getslot', [cls.ArgType.UintLiteral])
-            case 0x6D:
-                return ('setslot', [cls.ArgType.UintLiteral])
-            case 0x6E:
-                return ('getglobalslot', [cls.ArgType.UintLiteral])
-            case 0x6F:
-                return ('setglobalslot', [cls.ArgType.UintLiteral])
-            case 0x70:
-                return ('convert_s', [])
-            case 0x71:
-                return ('esc_xelem', [])
-            case 0x72:
-                return ('esc_xattr', [])
-            case 0x73:
-                return ('convert_i', [])
-            case 0x74:
-                return ('convert_u', [])
-            case 0x75:
-                return ('convert_d', [])
-            case 0x76:
-                return ('convert_b', [])
-            case 0x77:
-                return ('convert_o', [])
-            case 0x78:
-                return ('checkfilter', [])
-            case 0x79:
-                return ('convert_m', [cls.ArgType.Unknown])
-            case 0x7A:
-                return ('convert_m_p', [cls.ArgType.Unknown])
-            case 0x7B:
-                return ('0x7B', [cls.ArgType.Unknown])
-            case 0x7C:
-                return ('0x7C', [cls.ArgType.Unknown])
-            case 0x7D:
-                return ('0x7D', [cls.ArgType.Unknown])
-            case 0x7E:
-                return ('0x7E', [cls.ArgType.Unknown])
-            case 0x7F:
-                return ('0x7F', [cls.ArgType.Unknown])
-            case 0x80:
-                return ('coerce', [cls.ArgType.Multiname])
-            case 0x81:
-                return ('coerce_b', [])
-            case 0x82:
-                return ('coerce_a', [])
-            case 0x83:
-                return ('coerce_i', [])
-            case 0x84:
-                return ('coerce_d', [])
-            case 0x85:
-                return ('coerce_s', [])
-            case 0x86:
-                return ('astype', [cls.ArgType.Multiname])
-            case 0x87:
-                return ('astypelate', [])
-            case 0x88:
-                return ('coerce_u', [cls.ArgType.Unknown])
-            case 0x89:
-                return ('coerce_o', [cls.ArgType.Unknown])
-            case 0x8A:
-                return ('0x8A', [cls.ArgType.Unknown])
-            case 0x8B:
-                return ('0x8B', [cls.ArgType.Unknown])
-            case 0x8C:
-                return ('0x8C', [cls.ArgType.Unknown])
-            case 0x8D:
-                return ('0x8D', [cls.ArgType.Unknown])
-            case 0x8E:
-                return ('0x8E', [cls.ArgType.Unknown])
-            case 0x8F:
-                return ('negate_p', [cls.ArgType.Unknown])
-            case 0x90:
-                return ('negate', [])
-            case 0x91:
-                return ('increment', [])
-            case 0x92:
-                return ('inclocal', [cls.ArgType.UintLiteral])
-            case 0x93:
-                return ('decrement', [])
-            case 0x94:
-                return ('declocal', [cls.ArgType.UintLiteral])
-            case 0x95:
-                return ('typeof', [])
-            case 0x96:
-                return ('not', [])
-            case 0x97:
-                return ('bitnot', [])
-            case 0x98:
-                return ('0x98', [cls.ArgType.Unknown])
-            case 0x99:
-                return ('0x99', [cls.ArgType.Unknown])
-            case 0x9A:
-                return ('concat', [cls.ArgType.Unknown])
-            case 0x9B:
-                return ('add_d', [cls.ArgType.Unknown])
-            case 0x9C:
-                return ('increment_p', [cls.ArgType.Unknown])
-            case 0x9D:
-                return ('inclocal_p', [cls.ArgType.Unknown])
-            case 0x9E:
-                return ('decrement_p', [cls.ArgType.Unknown])
-            case 0x9F:
-                return ('declocal_p', [cls.ArgType.Unknown])
-            case 0xA0:
-                return ('add', [])
-            case 0xA1:
-                return ('subtract', [])
-            case 0xA2:
-                return ('multiply', [])
-            case 0xA3:
-                return ('divide', [])
-            case 0xA4:
-                return ('modulo', [])
-            case 0xA5:
-                return ('lshift', [])
-            case 0xA6:
-                return ('rshift', [])
-            case 0xA7:
-                return ('urshift', [])
-            case 0xA8:
-                return ('bitand', [])
-            case 0xA9:
-                return ('bitor', [])
-            case 0xAA:
-                return ('bitxor', [])
-            case 0xAB:
-                return ('equals', [])
-            case 0xAC:
-                return ('strictequals', [])
-            case 0xAD:
-                return ('lessthan', [])
-            case 0xAE:
-                return ('lessequals', [])
-            case 0xAF:
-                return ('greaterthan', [])
-            case 0xB0:
-                return ('greaterequals', [])
-            case 0xB1:
-                return ('instanceof', [])
-            case 0xB2:
-                return ('istype', [cls.ArgType.Multiname])
-            case 0xB3:
-                return ('istypelate', [])
-            case 0xB4:
-                return ('in', [])
-            case 0xB5:
-                return ('add_p', [cls.ArgType.Unknown])
-            case 0xB6:
-                return ('subtract_p', [cls.ArgType.Unknown])
-            case 0xB7:
-                return ('multiply_p', [cls.ArgType.Unknown])
-            case 0xB8:
-                return ('divide_p', [cls.ArgType.Unknown])
-            case 0xB9:
-                return ('modulo_p', [cls.ArgType.Unknown])
-            case 0xBA:
-                return ('0xBA', [cls.ArgType.Unknown])
-            case 0xBB:
-                return ('0xBB', [cls.ArgType.Unknown])
-            case 0xBC:
-                return ('0xBC', [cls.ArgType.Unknown])
-            case 0xBD:
-                return ('0xBD', [cls.ArgType.Unknown])
-            case 0xBE:
-                return ('0xBE', [cls.ArgType.Unknown])
-            case 0xBF:
-                return ('0xBF', [cls.ArgType.Unknown])
-            case 0xC0:
-                return ('increment_i', [])
-            case 0xC1:
-                return ('decrement_i', [])
-            case 0xC2:
-                return ('inclocal_i', [cls.ArgType.UintLiteral])
-            case 0xC3:
-                return ('declocal_i', [cls.ArgType.UintLiteral])
-            case 0xC4:
-                return ('negate_i', [])
-            case 0xC5:
-                return ('add_i', [])
-            case 0xC6:
-                return ('subtract_i', [])
-            case 0xC7:
-                return ('multiply_i', [])
-            case 0xC8:
-                return ('0xC8', [cls.ArgType.Unknown])
-            case 0xC9:
-                return ('0xC9', [cls.ArgType.Unknown])
-            case 0xCA:
-                return ('0xCA', [cls.ArgType.Unknown])
-            case 0xCB:
-                return ('0xCB', [cls.ArgType.Unknown])
-            case 0xCC:
-                return ('0xCC', [cls.ArgType.Unknown])
-            case 0xCD:
-                return ('0xCD', [cls.ArgType.Unknown])
-            case 0xCE:
-                return ('0xCE', [cls.ArgType.Unknown])
-            case 0xCF:
-                return ('0xCF', [cls.ArgType.Unknown])
-            case 0xD0:
-                return ('getlocal0', [])
-            case 0xD1:
-                return ('getlocal1', [])
-            case 0xD2:
-                return ('getlocal2', [])
-            case 0xD3:
-                return ('getlocal3', [])
-            case 0xD4:
-                return ('setlocal0', [])
-            case 0xD5:
-                return ('setlocal1', [])
-            case 0xD6:
-                return ('setlocal2', [])
-            case 0xD7:
-                return ('setlocal3', [])
-            case 0xD8:
-                return ('0xD8', [cls.ArgType.Unknown])
-            case 0xD9:
-                return ('0xD9', [cls.ArgType.Unknown])
-            case 0xDA:
-                return ('0xDA', [cls.ArgType.Unknown])
-            case 0xDB:
-                return ('0xDB', [cls.ArgType.Unknown])
-            case 0xDC:
-                return ('0xDC', [cls.ArgType.Unknown])
-            case 0xDD:
-                return ('0xDD', [cls.ArgType.Unknown])
-            case 0xDE:
-                return ('0xDE', [cls.ArgType.Unknown])
-            case 0xDF:
-                return ('0xDF', [cls.ArgType.Unknown])
-            case 0xE0:
-                return ('0xE0', [cls.ArgType.Unknown])
-            case 0xE1:
-                return ('0xE1', [cls.ArgType.Unknown])
-            case 0xE2:
-                return ('0xE2', [cls.ArgType.Unknown])
-            case 0xE3:
-                return ('0xE3', [cls.ArgType.Unknown])
-            case 0xE4:
-                return ('0xE4', [cls.ArgType.Unknown])
-            case 0xE5:
-                return ('0xE5', [cls.ArgType.Unknown])
-            case 0xE6:
-                return ('0xE6', [cls.ArgType.Unknown])
-            case 0xE7:
-                return ('0xE7', [cls.ArgType.Unknown])
-            case 0xE8:
-                return ('0xE8', [cls.ArgType.Unknown])
-            case 0xE9:
-                return ('0xE9', [cls.ArgType.Unknown])
-            case 0xEA:
-                return ('0xEA', [cls.ArgType.Unknown])
-            case 0xEB:
-                return ('0xEB', [cls.ArgType.Unknown])
-            case 0xEC:
-                return ('0xEC', [cls.ArgType.Unknown])
-            case 0xED:
-                return ('0xED', [cls.ArgType.Unknown])
-            case 0xEE:
-                return ('0xEE', [cls.ArgType.Unknown])
-            case 0xEF:
-                return ('debug', [cls.ArgType.UByteLiteral, cls.ArgType.String, cls.ArgType.UByteLiteral, cls.ArgType.UintLiteral])
-            case 0xF0:
-                return ('debugline', [cls.ArgType.UintLiteral])
-            case 0xF1:
-                return ('debugfile', [cls.ArgType.String])
-            case 0xF2:
-                return ('bkptline', [cls.ArgType.Unknown])
-            case 0xF3:
-                return ('timestamp', [cls.ArgType.Unknown])
-            case 0xF4:
-                return ('0xF4', [cls.ArgType.Unknown])
-            case 0xF5:
-                return ('0xF5', [cls.ArgType.Unknown])
-            case 0xF6:
-                return ('0xF6', [cls.ArgType.Unknown])
-            case 0xF7:
-                return ('0xF7', [cls.ArgType.Unknown])
-            case 0xF8:
-                return ('0xF8', [cls.ArgType.Unknown])
-            case 0xF9:
-                return ('0xF9', [cls.ArgType.Unknown])
-            case 0xFA:
-                return ('0xFA', [cls.ArgType.Unknown])
-            case 0xFB:
-                return ('0xFB', [cls.ArgType.Unknown])
-            case 0xFC:
-                return ('0xFC', [cls.ArgType.Unknown])
-            case 0xFD:
-                return ('0xFD', [cls.ArgType.Unknown])
-            case 0xFE:
-                return ('0xFE', [cls.ArgType.Unknown])
-            case 0xFF:
-                return ('0xFF', [cls.ArgType.Unknown])
-            case _:
-                raise NotImplementedError(f'opcode {cls.opcode} is not implemented')
+_OPERAND_READERS: dict[Instruction.ArgType, Callable[[ExtendedBuffer], int | list[int] | None]] = {
+    Instruction.ArgType.ByteLiteral: methodcaller('read_si8'),
+    Instruction.ArgType.UByteLiteral: methodcaller('read_ui8'),
+    Instruction.ArgType.IntLiteral: methodcaller('read_encoded_si32'),
+    Instruction.ArgType.UintLiteral: methodcaller('read_encoded_u32'),
+    Instruction.ArgType.Int: methodcaller('read_encoded_u30'),
+    Instruction.ArgType.Uint: methodcaller('read_encoded_u30'),
+    Instruction.ArgType.Double: methodcaller('read_encoded_u30'),
+    Instruction.ArgType.String: methodcaller('read_encoded_u30'),
+    Instruction.ArgType.Namespace: methodcaller('read_encoded_u30'),
+    Instruction.ArgType.Multiname: methodcaller('read_encoded_u30'),
+    Instruction.ArgType.Class: methodcaller('read_encoded_u30'),
+    Instruction.ArgType.Method: methodcaller('read_encoded_u30'),
+    Instruction.ArgType.JumpTarget: methodcaller('read_si24'),
+    Instruction.ArgType.SwitchDefaultTarget: methodcaller('read_si24'),
+    Instruction.ArgType.SwitchTargets: _read_switch_targets,
+    Instruction.ArgType.Unknown: lambda buffer: None,
+}
+
+OperandDecoder = Callable[[ExtendedBuffer], list[tuple[Instruction.ArgType, int | list[int] | None]]]
+
+
+def _operand_decoder(arg_types: tuple[Instruction.ArgType, ...]) -> OperandDecoder:
+    """
+    Returns a function that reads the operands of one layout, the common short layouts skip the loop.
+    """
+    readers = tuple((arg_type, _OPERAND_READERS[arg_type]) for arg_type in arg_types)
+    if not readers:
+        return lambda buffer: []
+    if len(readers) == 1:
+        ((arg_type, read),) = readers
+        return lambda buffer: [(arg_type, read(buffer))]
+    if len(readers) == 2:
+        (first_type, read_first), (second_type, read_second) = readers
+        return lambda buffer: [(first_type, read_first(buffer)), (second_type, read_second(buffer))]
+    return lambda buffer: [(arg_type, read(buffer)) for arg_type, read in readers]
+
+
+# Opcodes with the same layout share one decoder
+_LAYOUT_DECODERS: dict[tuple[Instruction.ArgType, ...], OperandDecoder] = {}
+for _, _arg_types in Instruction.OPCODES:
+    if _arg_types not in _LAYOUT_DECODERS:
+        _LAYOUT_DECODERS[_arg_types] = _operand_decoder(_arg_types)
+_OPERAND_DECODERS: tuple[OperandDecoder, ...] = tuple(_LAYOUT_DECODERS[arg_types] for _, arg_types in Instruction.OPCODES)
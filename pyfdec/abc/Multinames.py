@@ -110,7 +110,7 @@ class TypeName(BaseMultiname):
     def from_buffer(cls, buffer: ExtendedBuffer) -> 'TypeName':
         name = buffer.read_encoded_u30()
         param_count = buffer.read_encoded_u30()
-        params = [buffer.read_encoded_u30() for _ in range(param_count)]
+        params = buffer.read_encoded_u30_array(param_count)
         return cls(name, params)
 
 
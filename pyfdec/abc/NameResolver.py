@@ -0,0 +1,95 @@
+import sys
+from typing import TYPE_CHECKING
+
+from pyfdec.abc.Multinames import BaseMultiname
+
+if TYPE_CHECKING:
+    from pyfdec.abc.ABCFile import ABCFile
+
+_QNAME_KINDS = frozenset((BaseMultiname.MultinameKind.QName.value, BaseMultiname.MultinameKind.QNameA.value))
+_NAME_ONLY_KINDS = frozenset((
+    BaseMultiname.MultinameKind.RTQName.value,
+    BaseMultiname.MultinameKind.RTQNameA.value,
+    BaseMultiname.MultinameKind.Multiname.value,
+    BaseMultiname.MultinameKind.MultinameA.value,
+))
+_TYPE_NAME = BaseMultiname.MultinameKind.TypeName.value
+
+
+class NameResolver:
+    """
+    Formats the names of the constant pool of an ABC file, every name is resolved once and interned.
+
+    All methods take constant pool indexes, index 0 stands for no name or any name.
+    Multinames are formatted as `namespace::name` for QNames in a named namespace, as
+    their name for the other kinds with a name, as `*` for the ones whose name is only
+    known at runtime and as `base.<param, ...>` for TypeNames.
+
+    Args:
+        cpool (ABCFile.CPoolInfo): The constant pool to resolve names in.
+    """
+
+    def __init__(self, cpool: 'ABCFile.CPoolInfo'):
+        self.cpool: 'ABCFile.CPoolInfo' = cpool
+        self._strings: list[str | None] = [None] * (len(cpool.strings) + 1)
+        self._strings[0] = ''
+        self._namespaces: list[str | None] = [None] * (len(cpool.namespaces) + 1)
+        self._namespaces[0] = ''
+        self._namespace_sets: list[str | None] = [None] * (len(cpool.namespace_sets) + 1)
+        self._namespace_sets[0] = '[]'
+        self._multinames: list[str | None] = [None] * (len(cpool.multinames) + 1)
+        self._multinames[0] = '*'
+
+    def string(self, index: int) -> str:
+        name = self._strings[index]
+        if name is None:
+            name = self._strings[index] = sys.intern(self.cpool.strings[index - 1])
+        return name
+
+    def namespace(self, index: int) -> str:
+        name = self._namespaces[index]
+        if name is None:
+            name = self._namespaces[index] = self.string(self.cpool.namespaces[index - 1].name)
+        return name
+
+    def namespace_set(self, index: int) -> str:
+        name = self._namespace_sets[index]
+        if name is None:
+            namespaces = ', '.join(self.namespace(namespace) for namespace in self.cpool.namespace_sets[index - 1])
+            name = self._namespace_sets[index] = sys.intern(f'[{namespaces}]')
+        return name
+
+    def multiname(self, index: int) -> str:
+        name = self._multinames[index]
+        if name is not None:
+            return name
+
+        multinames = self.cpool.multinames
+        position = index - 1
+        kind = multinames.kinds[position]
+        if kind in _QNAME_KINDS:
+            namespace = self.namespace(multinames.namespace(position))
+            name = self.string(multinames.name(position))
+            if namespace:
+                name = sys.intern(f'{namespace}::{name}')
+        elif kind in _NAME_ONLY_KINDS:
+            name = self.string(multinames.name(position))
+        elif kind == _TYPE_NAME:
+            # A TypeName that contains itself is broken, it resolves to * inside itself
+            self._multinames[index] = '*'
+            operands = multinames.operands_of(position)
+            params = ', '.join(self.multiname(param) for param in operands[1:])
+            name = sys.intern(f'{self.multiname(operands[0])}.<{params}>')
+        else:
+            name = '*'
+        self._multinames[index] = name
+        return name
+
+    def multinames(self) -> list[str]:
+        """
+        Resolves all multinames in one pass, the result is indexed by constant pool index.
+        """
+        for index in range(1, len(self._multinames)):
+            if self._multinames[index] is None:
+                self.multiname(index)
+        return list(self._multinames)  # type: ignore
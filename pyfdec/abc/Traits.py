@@ -136,6 +136,6 @@ class TraitInfo:
         metadata = None
         if attributes & TraitAttributes.Metadata:
             metadata_count = buffer.read_encoded_u30()
-            metadata = [buffer.read_encoded_u30() for _ in range(metadata_count)]
+            metadata = buffer.read_encoded_u30_array(metadata_count)
 
         return cls(name, attributes, kind, trait, metadata)
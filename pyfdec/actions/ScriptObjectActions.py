@@ -31,7 +31,7 @@ class ActionConstantPool(Action):
     @classmethod
     def from_buffer(cls, buffer: ExtendedBuffer) -> 'ActionConstantPool':
         count = buffer.read_ui16()
-        constantPool = [buffer.read_string() for _ in range(count)]
+        constantPool = buffer.read_strings(count)
         return cls(constantPool)
 
 
@@ -50,7 +50,7 @@ class ActionDefineFunction(Action):
     def from_buffer(cls, buffer: ExtendedBuffer) -> 'ActionDefineFunction':
         function_name = buffer.read_string()
         param_count = buffer.read_ui16()
-        params = [buffer.read_string() for _ in range(param_count)]
+        params = buffer.read_strings(param_count)
         code = buffer.subbuffer(buffer.read_ui16())
         return cls(function_name, params, code)
 
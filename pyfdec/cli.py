@@ -0,0 +1,156 @@
+"""
+Command line interface that summarizes SWF files as JSON lines.
+
+Every file is parsed completely in a worker process and reported as one JSON object
+with the header, a tag histogram, ABC statistics and the time it took. A file that
+fails to parse is reported with its error and does not stop the others.
+"""
+import argparse
+import collections
+import dataclasses
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Iterator
+
+from pyfdec.swf import Swf
+from pyfdec.swf_cache import SwfCache
+from pyfdec.tags.Tag import Tag
+
+
+def _abc_stats(tag: Any) -> dict[str, Any]:
+    abc = tag.ABCData
+    return {
+        'name': getattr(tag, 'name', None),
+        'version': f'{abc.major_version}.{abc.minor_version}',
+        'ints': len(abc.cpool.ints),
+        'uints': len(abc.cpool.uints),
+        'doubles': len(abc.cpool.doubles),
+        'strings': len(abc.cpool.strings),
+        'namespaces': len(abc.cpool.namespaces),
+        'namespace_sets': len(abc.cpool.namespace_sets),
+        'multinames': len(abc.cpool.multinames),
+        'methods': len(abc.methods),
+        'metadata': len(abc.metadata),
+        'classes': len(abc.classes),
+        'scripts': len(abc.scripts),
+        'method_bodies': len(abc.method_bodies),
+    }
+
+
+def summarize(path: str, cache_directory: str | None = None) -> dict[str, Any]:
+    """
+    Parses the SWF file at `path` and returns its summary, errors are returned instead of raised.
+
+    Args:
+        path (str): Path of the SWF file.
+        cache_directory (str | None): Directory of a SwfCache to load the tags from.
+    """
+    start = time.perf_counter()
+    try:
+        cache = None if cache_directory is None else SwfCache(cache_directory)
+        swf = Swf.from_path(path, cache=cache)
+        tags: collections.Counter[str] = collections.Counter({swf.fileAttributes.tag_type.name: 1})
+        sprite_tags: collections.Counter[str] = collections.Counter()
+        abc = []
+        for tag in swf.tags:
+            tags[tag.tag_type.name] += 1
+            if tag.tag_type == Tag.TagTypes.DefineSprite:
+                for sprite_tag in tag.tags:  # type: ignore
+                    sprite_tags[sprite_tag.tag_type.name] += 1
+                    if sprite_tag.tag_type in (Tag.TagTypes.DoABC, Tag.TagTypes.DoABC2):
+                        abc.append(_abc_stats(sprite_tag))
+            elif tag.tag_type in (Tag.TagTypes.DoABC, Tag.TagTypes.DoABC2):
+                abc.append(_abc_stats(tag))
+    except Exception as error:
+        return _failure(path, error, time.perf_counter() - start)
+
+    header = swf.header
+    return {
+        'path': path,
+        'ok': True,
+        'header': {
+            'compression': header.compression.name,
+            'version': header.version,
+            'fileLength': header.fileLength,
+            'frameSize': dataclasses.asdict(header.frameSize),
+            'frameRate': header.frameRate,
+            'frameCount': header.frameCount,
+        },
+        'fileAttributes': dataclasses.asdict(swf.fileAttributes),
+        'tags': dict(tags),
+        'spriteTags': dict(sprite_tags),
+        'abc': abc,
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def _failure(path: str, error: BaseException, seconds: float) -> dict[str, Any]:
+    return {'path': path, 'ok': False, 'error': f'{type(error).__name__}: {error}', 'seconds': seconds}
+
+
+def expand_paths(patterns: list[str]) -> list[str]:
+    """
+    Expands glob patterns (`**` included), plain paths are kept even if they do not exist.
+    """
+    paths = []
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            matches = sorted(glob.glob(pattern, recursive=True))
+            if not matches:
+                print(f'pyfdec: no files match {pattern}', file=sys.stderr)
+            paths.extend(matches)
+        else:
+            paths.append(pattern)
+    return paths
+
+
+def summarize_all(paths: list[str], jobs: int = 1, ordered: bool = True, cache_directory: str | None = None) -> Iterator[dict[str, Any]]:
+    """
+    Yields the summaries of `paths`, parsed on `jobs` worker processes.
+
+    Args:
+        paths (list[str]): The SWF files.
+        jobs (int): Number of worker processes, 1 parses in this process.
+        ordered (bool): Yield the summaries in the order of `paths` instead of as soon as they are done.
+        cache_directory (str | None): Directory of a SwfCache to load the tags from.
+    """
+    if jobs == 1:
+        for path in paths:
+            yield summarize(path, cache_directory)
+        return
+
+    with ProcessPoolExecutor(jobs) as executor:
+        futures = {executor.submit(summarize, path, cache_directory): path for path in paths}
+        for future in (futures if ordered else as_completed(futures)):
+            try:
+                yield future.result()
+            except Exception as error:
+                # The worker process died, summarize itself never raises
+                yield _failure(futures[future], error, 0.0)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='pyfdec', description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('paths', nargs='+', help='SWF files or glob patterns, quote patterns to expand them here')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1, help='number of worker processes (default: all cores)')
+    order = parser.add_mutually_exclusive_group()
+    order.add_argument('--ordered', dest='ordered', action='store_true', default=True, help='print the files in input order (default)')
+    order.add_argument('--unordered', dest='ordered', action='store_false', help='print every file as soon as it is done')
+    parser.add_argument('--cache', metavar='DIRECTORY', help='load and store parsed files in this cache directory')
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+
+    failed = False
+    for record in summarize_all(expand_paths(args.paths), args.jobs, args.ordered, args.cache):
+        failed |= not record['ok']
+        print(json.dumps(record), flush=True)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
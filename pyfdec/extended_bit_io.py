@@ -1,28 +1,45 @@
-from pyfdec.bitio import BitIO
+from pyfdec.extended_buffer import ExtendedBuffer
 
 
-class ExtendedBitIO(BitIO):
+class ExtendedBitIO:
+    """
+    MSB-first bit reader on top of an ExtendedBuffer.
 
-    def write(self, bits):
-        return super().write(bits)
+    Bits are kept in an integer accumulator that is refilled with whole bytes from the
+    wrapped buffer. Only the bytes needed to satisfy a read are pulled, so the buffer
+    position always points at the first byte that has not been touched yet, and plain
+    buffer reads can be interleaved with bit reads after a byte boundary.
+    """
+    __slots__ = ('_stream', '_accumulator', '_bit_count')
+
+    def __init__(self, stream: ExtendedBuffer):
+        self._stream: ExtendedBuffer = stream
+        self._accumulator: int = 0
+        self._bit_count: int = 0
+
+    def _fill(self, length: int) -> None:
+        byte_count = (length - self._bit_count + 7) >> 3
+        data = self._stream.read(byte_count)
+        if len(data) != byte_count:
+            raise EOFError(f'Tried to read {byte_count} bytes, but only {len(data)} are left')
+        self._accumulator = (self._accumulator << (byte_count << 3)) | int.from_bytes(data, byteorder='big')
+        self._bit_count += byte_count << 3
 
     def read_unsigned(self, length: int) -> int:
         if length == 0:
             return 0
-        data = self.read(length)
-        val = 0
-        for bit in data:
-            val = (val << 1) | bit
-        return val
+        if length > self._bit_count:
+            self._fill(length)
+        self._bit_count -= length
+        value = self._accumulator >> self._bit_count
+        self._accumulator &= (1 << self._bit_count) - 1
+        return value
 
     def read_signed(self, length: int) -> int:
         if length == 0:
             return 0
-        data = self.read(length)
-        val = 0
-        for bit in data[1:]:
-            val = (val << 1) | bit
-        return val if data[0] == 0 else val - (1 << (length - 1))
+        value = self.read_unsigned(length)
+        return value - (1 << length) if value >> (length - 1) else value
 
     def read_fixed(self, length: int) -> float:
         if length == 0:
@@ -30,13 +47,22 @@ class ExtendedBitIO(BitIO):
         return self.read_unsigned(length) / (1 << 16)
 
     def read_bool(self) -> bool:
-        return self.read(1)[0] == 1
+        return self.read_unsigned(1) == 1
 
     def padding(self, length: int) -> None:
         if length == 0:
             return
-        self.read(length)
+        self.read_unsigned(length)
 
     def align(self) -> None:
-        while len(self._buffer) % 8 != 0:
-            self.read(1)
+        self._accumulator = 0
+        self._bit_count = 0
+
+    def close(self) -> None:
+        self.align()
+
+    def __enter__(self) -> 'ExtendedBitIO':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -1,5 +1,50 @@
 import io
 import struct
+from functools import lru_cache
+
+_SI8 = struct.Struct('<b')
+_SI16 = struct.Struct('<h')
+_SI32 = struct.Struct('<i')
+_UI16 = struct.Struct('<H')
+_UI32 = struct.Struct('<I')
+_UI64 = struct.Struct('<Q')
+
+_STRING_CHUNK_SIZE = 256
+
+
+@lru_cache(maxsize=256)
+def _array_struct(typecode: str, count: int) -> struct.Struct:
+    return struct.Struct(f'<{count}{typecode}')
+
+
+def _decode_encoded_u32s(data, position: int, count: int) -> tuple[list[int], int]:
+    """
+    Decodes `count` consecutive EncodedU32 values from `data` starting at `position`.
+
+    Returns the values and the position after the last one. Raises IndexError when
+    `data` ends before the last value is complete.
+    """
+    values: list[int] = []
+    append = values.append
+    for _ in range(count):
+        byte = data[position]
+        position += 1
+        if byte < 0x80:
+            append(byte)
+            continue
+        value = byte & 0x7F
+        shift = 7
+        while True:
+            byte = data[position]
+            position += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+        if value & 0x100000000:
+            raise ValueError('EncodedU32 value is too large')
+        append(value)
+    return values, position
 
 
 # FIXME: Missing RawIOBase impl
@@ -56,11 +101,51 @@ class ExtendedBuffer(io.BytesIO):
     def read_fixed(self) -> float:
         return float(self.read_ui32() / (1 << 16))
 
+    def _read_array(self, typecode: str, count: int) -> list:
+        layout = _array_struct(typecode, count)
+        return list(layout.unpack(self.read(layout.size)))
+
+    def read_ui8_array(self, count: int) -> list[int]:
+        return list(self.read(count))
+
+    def read_si8_array(self, count: int) -> list[int]:
+        return self._read_array('b', count)
+
+    def read_ui16_array(self, count: int) -> list[int]:
+        return self._read_array('H', count)
+
+    def read_si16_array(self, count: int) -> list[int]:
+        return self._read_array('h', count)
+
+    def read_si24_array(self, count: int) -> list[int]:
+        data = self.read(count * 3)
+        return [int.from_bytes(data[i:i + 3], byteorder='little', signed=True) for i in range(0, count * 3, 3)]
+
+    def read_ui32_array(self, count: int) -> list[int]:
+        return self._read_array('I', count)
+
+    def read_si32_array(self, count: int) -> list[int]:
+        return self._read_array('i', count)
+
+    def read_f32_array(self, count: int) -> list[float]:
+        return self._read_array('f', count)
+
+    def read_f64_array(self, count: int) -> list[float]:
+        return self._read_array('d', count)
+
     def read_string(self) -> str:
-        data = b''
-        while (byte := self.read(1)) != b'\x00':
-            data += byte
-        return data.decode('utf-8')
+        chunks = []
+        while chunk := self.read(_STRING_CHUNK_SIZE):
+            end = chunk.find(b'\x00')
+            if end >= 0:
+                chunks.append(chunk[:end])
+                self.seek(end + 1 - len(chunk), io.SEEK_CUR)
+                break
+            chunks.append(chunk)
+        return b''.join(chunks).decode('utf-8')
+
+    def read_strings(self, count: int) -> list[str]:
+        return [self.read_string() for _ in range(count)]
 
     def read_encoded_u32(self) -> int:
         value = 0
@@ -80,3 +165,261 @@ class ExtendedBuffer(io.BytesIO):
 
     def read_encoded_si32(self) -> int:
         return val - 0x100000000 if (val := self.read_encoded_u32()) & 0x80000000 else val
+
+    def read_encoded_u32_array(self, count: int) -> list[int]:
+        # An EncodedU32 takes at most 5 bytes, give back what was read ahead
+        start = self.tell()
+        data = self.read(count * 5)
+        try:
+            values, end = _decode_encoded_u32s(data, 0, count)
+        except IndexError:
+            self.seek(start)
+            return [self.read_encoded_u32() for _ in range(count)]
+        self.seek(start + end)
+        return values
+
+    def read_encoded_u30_array(self, count: int) -> list[int]:
+        return [value & 0x3FFFFFFF for value in self.read_encoded_u32_array(count)]
+
+    def read_encoded_si32_array(self, count: int) -> list[int]:
+        return [value - 0x100000000 if value & 0x80000000 else value for value in self.read_encoded_u32_array(count)]
+
+
+class ExtendedBufferView(ExtendedBuffer):
+    """
+    Read-only ExtendedBuffer over a memoryview of existing data.
+
+    `subbuffer` hands out views over a slice of the same memory instead of copying, so
+    nested tag, ABC and image buffers all share the storage of the outermost buffer.
+    Keeping any sub view alive keeps that whole storage alive.
+
+    Args:
+        data (bytes | bytearray | memoryview | mmap): The data to read from, it is not copied.
+    """
+
+    def __init__(self, data=b''):
+        super().__init__()
+        self._view: memoryview = memoryview(data).cast('B')
+        self._position: int = 0
+        # Object the view was created from and the offset of the view in it, used to
+        # scan for string terminators with `find` instead of byte by byte
+        self._source = data if hasattr(data, 'find') else None
+        self._base: int = 0
+
+    def __reduce__(self):
+        # Memoryviews can not be pickled, send a copy of the viewed bytes instead
+        return (_restore_view, (self._view.tobytes(), self._position))
+
+    def readable(self) -> bool:
+        return True
+
+    def writable(self) -> bool:
+        return False
+
+    def seekable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        raise io.UnsupportedOperation('write')
+
+    def truncate(self, size=None) -> int:
+        raise io.UnsupportedOperation('truncate')
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f'Invalid whence ({whence})')
+        if position < 0:
+            raise ValueError(f'Negative seek position {position}')
+        self._position = position
+        return position
+
+    def read(self, size: int | None = -1) -> bytes:
+        start = min(self._position, len(self._view))
+        end = len(self._view) if size is None or size < 0 else min(start + size, len(self._view))
+        self._position = end
+        return self._view[start:end].tobytes()
+
+    read1 = read
+
+    def readinto(self, target) -> int:
+        data = self.read(len(memoryview(target)))
+        memoryview(target).cast('B')[:len(data)] = data
+        return len(data)
+
+    readinto1 = readinto
+
+    def readline(self, size: int | None = -1) -> bytes:
+        start = min(self._position, len(self._view))
+        end = len(self._view) if size is None or size < 0 else min(start + size, len(self._view))
+        line = self._view[start:end].tobytes()
+        newline = line.find(b'\n')
+        if newline >= 0:
+            line = line[:newline + 1]
+        self._position = start + len(line)
+        return line
+
+    def readlines(self, hint: int | None = -1) -> list[bytes]:
+        lines = []
+        total = 0
+        while line := self.readline():
+            lines.append(line)
+            total += len(line)
+            if hint is not None and 0 < hint <= total:
+                break
+        return lines
+
+    def __iter__(self) -> 'ExtendedBufferView':
+        return self
+
+    def __next__(self) -> bytes:
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+
+    def writelines(self, lines) -> None:
+        raise io.UnsupportedOperation('write')
+
+    def getbuffer(self) -> memoryview:
+        return self._view
+
+    def getvalue(self) -> bytes:
+        return self._view.tobytes()
+
+    def subbuffer(self, size: int) -> 'ExtendedBufferView':
+        start = min(self._position, len(self._view))
+        end = min(start + size, len(self._view))
+        self._position = end
+        view = ExtendedBufferView(self._view[start:end])
+        view._source = self._source
+        view._base = self._base + start
+        return view
+
+    def bytes_left(self) -> int:
+        return max(len(self._view) - self._position, 0)
+
+    def read_string(self) -> str:
+        if self._source is None:
+            return super().read_string()
+        return self.read_strings(1)[0]
+
+    def read_strings(self, count: int) -> list[str]:
+        if self._source is None:
+            return super().read_strings(count)
+        find = self._source.find
+        view = self._view
+        base = self._base
+        limit = base + len(view)
+        position = self._position
+        strings = []
+        for _ in range(count):
+            end = find(b'\x00', base + position, limit) - base
+            if end < 0:
+                end = len(view)
+            strings.append(str(view[position:end], 'utf-8'))
+            position = end + 1
+        self._position = min(position, len(view))
+        return strings
+
+    def read_encoded_u32(self) -> int:
+        view = self._view
+        position = self._position
+        try:
+            byte = view[position]
+            value = byte & 0x7F
+            shift = 7
+            while byte & 0x80:
+                position += 1
+                byte = view[position]
+                value |= (byte & 0x7F) << shift
+                shift += 7
+        except IndexError:
+            return super().read_encoded_u32()
+        self._position = position + 1
+        if value & 0x100000000:
+            raise ValueError('EncodedU32 value is too large')
+        return value
+
+    def read_encoded_u32_array(self, count: int) -> list[int]:
+        try:
+            values, self._position = _decode_encoded_u32s(self._view, self._position, count)
+        except IndexError:
+            return super().read_encoded_u32_array(count)
+        return values
+
+    def _read_array(self, typecode: str, count: int) -> list:
+        layout = _array_struct(typecode, count)
+        values = list(layout.unpack_from(self._view, self._position))
+        self._position += layout.size
+        return values
+
+    def read_si8(self) -> int:
+        try:
+            value = _SI8.unpack_from(self._view, self._position)[0]
+        except struct.error:
+            return super().read_si8()
+        self._position += 1
+        return value
+
+    def read_ui8(self) -> int:
+        try:
+            value = self._view[self._position]
+        except IndexError:
+            return super().read_ui8()
+        self._position += 1
+        return value
+
+    def read_si16(self) -> int:
+        try:
+            value = _SI16.unpack_from(self._view, self._position)[0]
+        except struct.error:
+            return super().read_si16()
+        self._position += 2
+        return value
+
+    def read_si32(self) -> int:
+        try:
+            value = _SI32.unpack_from(self._view, self._position)[0]
+        except struct.error:
+            return super().read_si32()
+        self._position += 4
+        return value
+
+    def read_ui16(self) -> int:
+        try:
+            value = _UI16.unpack_from(self._view, self._position)[0]
+        except struct.error:
+            return super().read_ui16()
+        self._position += 2
+        return value
+
+    def read_ui32(self) -> int:
+        try:
+            value = _UI32.unpack_from(self._view, self._position)[0]
+        except struct.error:
+            return super().read_ui32()
+        self._position += 4
+        return value
+
+    def read_ui64(self) -> int:
+        try:
+            value = _UI64.unpack_from(self._view, self._position)[0]
+        except struct.error:
+            return super().read_ui64()
+        self._position += 8
+        return value
+
+
+def _restore_view(data: bytes, position: int) -> ExtendedBufferView:
+    view = ExtendedBufferView(data)
+    view.seek(position)
+    return view
@@ -0,0 +1,158 @@
+import io
+import lzma
+import struct
+import zlib
+from abc import ABC, abstractmethod
+
+from pyfdec.extended_buffer import ExtendedBuffer, ExtendedBufferView
+
+CHUNK_SIZE = 1 << 16
+
+
+class InflatingBuffer(ExtendedBuffer, ABC):
+    """
+    Forward-only ExtendedBuffer that decompresses its source on demand.
+
+    Only the bytes needed to satisfy a read get decompressed, and bytes in front of the
+    current position are dropped once more output is needed, so memory stays in the
+    order of the largest tag instead of the whole decompressed file. Subbuffers are
+    materialized into their own ExtendedBufferView.
+
+    Args:
+        source (ExtendedBuffer): Buffer positioned at the start of the compressed data.
+        length (int | None): Expected decompressed length, used by `bytes_left`.
+    """
+
+    def __new__(cls, *args, **kwargs):
+        # BytesIO creates instances without the abstract method check of object
+        if cls.__abstractmethods__:
+            missing = ', '.join(sorted(cls.__abstractmethods__))
+            raise TypeError(f'Can not instantiate abstract class {cls.__name__} without an implementation for {missing}')
+        return super().__new__(cls, *args, **kwargs)
+
+    def __init__(self, source: ExtendedBuffer, length: int | None = None):
+        super().__init__()
+        self._source: ExtendedBuffer = source
+        self._length: int | None = length
+        self._data: bytearray = bytearray()
+        self._offset: int = 0  # absolute position of self._data[0]
+        self._position: int = 0
+        self._eof: bool = False
+
+    @abstractmethod
+    def _decompress(self, size: int) -> bytes:
+        """
+        Returns up to `size` more decompressed bytes, or b'' once the stream is exhausted.
+        """
+
+    def _fill(self, end: int | None) -> None:
+        while not self._eof and (end is None or self._offset + len(self._data) < end):
+            consumed = self._position - self._offset
+            if consumed > 0:
+                del self._data[:consumed]
+                self._offset = self._position
+            missing = CHUNK_SIZE if end is None else end - self._offset - len(self._data)
+            chunk = self._decompress(max(missing, CHUNK_SIZE))
+            if not chunk:
+                self._eof = True
+            self._data += chunk
+
+    def readable(self) -> bool:
+        return True
+
+    def writable(self) -> bool:
+        return False
+
+    def seekable(self) -> bool:
+        return False
+
+    def write(self, data) -> int:
+        raise io.UnsupportedOperation('write')
+
+    def truncate(self, size=None) -> int:
+        raise io.UnsupportedOperation('truncate')
+
+    def getbuffer(self) -> memoryview:
+        raise io.UnsupportedOperation('getbuffer')
+
+    def getvalue(self) -> bytes:
+        raise io.UnsupportedOperation('getvalue')
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence != io.SEEK_SET:
+            raise io.UnsupportedOperation('seek relative to the end of an inflating buffer')
+        if offset < self._offset:
+            raise io.UnsupportedOperation('seek to data that has already been released')
+        self._fill(offset)
+        self._position = min(offset, self._offset + len(self._data))
+        return self._position
+
+    def read(self, size: int | None = -1) -> bytes:
+        end = None if size is None or size < 0 else self._position + size
+        self._fill(end)
+        start = self._position - self._offset
+        data = bytes(self._data[start:] if end is None else self._data[start:end - self._offset])
+        self._position += len(data)
+        return data
+
+    read1 = read
+
+    def subbuffer(self, size: int) -> ExtendedBufferView:
+        return ExtendedBufferView(self.read(size))
+
+    def bytes_left(self) -> int:
+        if self._length is None:
+            self._fill(None)
+            return self._offset + len(self._data) - self._position
+        return max(self._length - self._position, 0)
+
+
+class ZlibInflatingBuffer(InflatingBuffer):
+    """
+    InflatingBuffer for zlib compressed (CWS) SWF bodies built on `zlib.decompressobj`.
+    """
+
+    def __init__(self, source: ExtendedBuffer, length: int | None = None):
+        super().__init__(source, length)
+        self._decompressor = zlib.decompressobj()
+
+    def _decompress(self, size: int) -> bytes:
+        while not self._decompressor.eof:
+            data = self._decompressor.unconsumed_tail or self._source.read(CHUNK_SIZE)
+            if not data:
+                return self._decompressor.flush()
+            output = self._decompressor.decompress(data, size)
+            if output:
+                return output
+        return b''
+
+
+class LzmaInflatingBuffer(InflatingBuffer):
+    """
+    InflatingBuffer for LZMA compressed (ZWS) SWF bodies built on `lzma.LZMADecompressor`.
+
+    The source has to be positioned at the 5 LZMA property bytes. They are combined with
+    the decompressed length into the header of the .lzma format the decompressor expects.
+    """
+
+    def __init__(self, source: ExtendedBuffer, length: int):
+        super().__init__(source, length)
+        self._decompressor = lzma.LZMADecompressor(format=lzma.FORMAT_ALONE)
+        self._header: bytes = source.read(5) + struct.pack('<Q', length)
+
+    def _decompress(self, size: int) -> bytes:
+        while not self._decompressor.eof:
+            data = b''
+            if self._decompressor.needs_input:
+                data, self._header = self._header + self._source.read(CHUNK_SIZE), b''
+                if not data:
+                    return b''
+            output = self._decompressor.decompress(data, size)
+            if output:
+                return output
+        return b''
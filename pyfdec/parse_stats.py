@@ -0,0 +1,72 @@
+from dataclasses import asdict, dataclass, field
+
+from pyfdec.tags.Tag import Tag
+
+
+@dataclass
+class TagStats:
+    """
+    Totals of all tags of one type.
+
+    Attributes:
+        count (int): Number of tags, including the ones that were not selected and returned as RawTag.
+        size (int): Sum of the body lengths in bytes.
+        seconds (float): Time spent in the decoder. Parts that are decoded lazily, like the
+            tags of a sprite or the records of a shape, are not included.
+        allocations (int): Memory blocks still allocated after the decoder returned, roughly
+            the number of objects the decoded tags consist of.
+    """
+    count: int = 0
+    size: int = 0
+    seconds: float = 0.0
+    allocations: int = 0
+
+
+@dataclass
+class ParseStats:
+    """
+    Per tag type statistics filled in by the tag dispatch while the tags of a Swf are decoded.
+
+    Pass an instance to `Swf.from_buffer` to collect them, the same instance can be passed
+    for several files to aggregate over all of them.
+    """
+    tags: dict[Tag.TagTypes, TagStats] = field(default_factory=dict)
+
+    def record(self, tag_type: Tag.TagTypes, size: int, seconds: float, allocations: int) -> None:
+        stats = self.tags.get(tag_type)
+        if stats is None:
+            stats = self.tags[tag_type] = TagStats()
+        stats.count += 1
+        stats.size += size
+        stats.seconds += seconds
+        stats.allocations += allocations
+
+    def merge(self, other: 'ParseStats') -> None:
+        """
+        Adds the totals of `other` to this instance.
+        """
+        for tag_type, other_stats in other.tags.items():
+            stats = self.tags.get(tag_type)
+            if stats is None:
+                stats = self.tags[tag_type] = TagStats()
+            stats.count += other_stats.count
+            stats.size += other_stats.size
+            stats.seconds += other_stats.seconds
+            stats.allocations += other_stats.allocations
+
+    @property
+    def total(self) -> TagStats:
+        total = TagStats()
+        for stats in self.tags.values():
+            total.count += stats.count
+            total.size += stats.size
+            total.seconds += stats.seconds
+            total.allocations += stats.allocations
+        return total
+
+    def as_dict(self) -> dict[str, dict[str, int | float]]:
+        """
+        Returns the statistics keyed by tag type name, ordered by decode time, for exporting them.
+        """
+        ordered = sorted(self.tags.items(), key=lambda item: item[1].seconds, reverse=True)
+        return {tag_type.name: asdict(stats) for tag_type, stats in ordered}
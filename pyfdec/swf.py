@@ -1,52 +1,67 @@
+import contextlib
+import importlib
+import io
 import lzma
+import mmap
+import os
 import struct
 import zlib
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Generator
+from types import GeneratorType
+from typing import TYPE_CHECKING, Any, Collection, Generator
 
-from pyfdec.extended_buffer import ExtendedBuffer
+from pyfdec.extended_buffer import ExtendedBuffer, ExtendedBufferView
+from pyfdec.inflating_buffer import LzmaInflatingBuffer, ZlibInflatingBuffer
+from pyfdec.parse_stats import ParseStats
 from pyfdec.record_types.geometric_types import Rect
-from pyfdec.tags.CSMTextSettings import CSMTextSettings
-from pyfdec.tags.DefineBits import DefineBits
-from pyfdec.tags.DefineBitsJPEG2 import DefineBitsJPEG2
-from pyfdec.tags.DefineBitsJPEG3 import DefineBitsJPEG3
-from pyfdec.tags.DefineBitsJPEG4 import DefineBitsJPEG4
-from pyfdec.tags.DefineEditText import DefineEditText
-from pyfdec.tags.DefineFontAlignZones import DefineFontAlignZones
-from pyfdec.tags.DefineFontName import DefineFontName
-from pyfdec.tags.DefineSceneAndFrameLabelData import DefineSceneAndFrameLabelData
-from pyfdec.tags.DefineShape import DefineShape
-from pyfdec.tags.DefineShape2 import DefineShape2
-from pyfdec.tags.DefineShape3 import DefineShape3
-from pyfdec.tags.DefineShape4 import DefineShape4
-from pyfdec.tags.DefineSprite import DefineSprite
-from pyfdec.tags.DoABC import DoABC
-from pyfdec.tags.DoABC2 import DoABC2
-from pyfdec.tags.EnableDebugger import EnableDebugger
-from pyfdec.tags.EnableDebugger2 import EnableDebugger2
-from pyfdec.tags.End import End
-from pyfdec.tags.ExportAssets import ExportAssets
+from pyfdec.tag_index import TagIndex
+from pyfdec.tag_registry import TAG_REGISTRY
 from pyfdec.tags.FileAttributes import FileAttributes
-from pyfdec.tags.FrameLabel import FrameLabel
-from pyfdec.tags.ImportAssets import ImportAssets
-from pyfdec.tags.JPEGTables import JPEGTables
-from pyfdec.tags.Metadata import Metadata
-from pyfdec.tags.PlaceObject import PlaceObject
-from pyfdec.tags.PlaceObject2 import PlaceObject2
-from pyfdec.tags.PlaceObject3 import PlaceObject3
-from pyfdec.tags.Protect import Protect
-from pyfdec.tags.RemoveObject import RemoveObject
-from pyfdec.tags.RemoveObject2 import RemoveObject2
-from pyfdec.tags.ScriptLimits import ScriptLimits
-from pyfdec.tags.SetBackgroundColor import SetBackgroundColor
-from pyfdec.tags.SetTabIndex import SetTabIndex
-from pyfdec.tags.ShowFrame import ShowFrame
-from pyfdec.tags.StartSound import StartSound
-from pyfdec.tags.StartSound2 import StartSound2
-from pyfdec.tags.SymbolClass import SymbolClass
+from pyfdec.tags.RawTag import RawTag
 from pyfdec.tags.Tag import Tag, TagHeader
-from pyfdec.tags.Unknown import Unknown
+
+if TYPE_CHECKING:
+    # concurrent.futures pulls in logging, it is only needed once an executor is passed in
+    from concurrent.futures import Executor, Future
+
+    from pyfdec.swf_cache import SwfCache
+
+# Tag types worth the round trip to another process in `Swf.get_tag_list_parallel`
+PARALLEL_TAG_TYPES = frozenset(
+    tag_type.value for tag_type in (
+        Tag.TagTypes.DoABC,
+        Tag.TagTypes.DoABC2,
+        Tag.TagTypes.DefineShape,
+        Tag.TagTypes.DefineShape2,
+        Tag.TagTypes.DefineShape3,
+        Tag.TagTypes.DefineShape4,
+        Tag.TagTypes.DefineSprite,
+        Tag.TagTypes.DefineBits,
+        Tag.TagTypes.DefineBitsJPEG2,
+        Tag.TagTypes.DefineBitsJPEG3,
+        Tag.TagTypes.DefineBitsJPEG4,
+        Tag.TagTypes.DefineBitsLossless,
+        Tag.TagTypes.DefineBitsLossless2,
+    )
+)
+# Smaller tags are decoded inline, sending them would cost more than decoding them
+PARALLEL_MIN_TAG_LENGTH = 1 << 12
+SHAPE_TAG_TYPES = frozenset(
+    tag_type.value for tag_type in (
+        Tag.TagTypes.DefineShape,
+        Tag.TagTypes.DefineShape2,
+        Tag.TagTypes.DefineShape3,
+        Tag.TagTypes.DefineShape4,
+    )
+)
+
+
+def __getattr__(name: str):
+    # The tag classes used to be imported here, load them on first access instead
+    if name in Tag.TagTypes.__members__ and TAG_REGISTRY.lookup(Tag.TagTypes[name]) is not None:
+        return getattr(importlib.import_module(f'pyfdec.tags.{name}'), name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 @dataclass
@@ -65,20 +80,29 @@ class SwfHeader:
     frameCount: int
 
     @classmethod
-    def from_buffer(cls, buffer: ExtendedBuffer) -> tuple['SwfHeader', ExtendedBuffer]:
+    def from_buffer(cls, buffer: ExtendedBuffer, streaming: bool = False) -> tuple['SwfHeader', ExtendedBuffer]:
         compression = cls.CompressionLevel(buffer.read(3))
         version = buffer.read_ui8()
         fileLength = buffer.read_ui32()
 
         # Handle compression
-        if compression == cls.CompressionLevel.ZLIB:
+        if compression == cls.CompressionLevel.ZLIB and streaming:
+            # Inflate lazily while the tags are read
+            buffer = ZlibInflatingBuffer(buffer, fileLength - 8)
+        elif compression == cls.CompressionLevel.ZLIB:
             file = buffer.read()
 
             # Decompress data
             decompressed = zlib.decompress(file)
 
             # Construct new buffer
-            buffer = ExtendedBuffer(decompressed)
+            buffer = ExtendedBufferView(decompressed)
+        elif compression == cls.CompressionLevel.LZMA and streaming:
+            # Compressed size is never used
+            _compressed_size = buffer.read_ui32()  # noqa: F841
+
+            # Decompress lazily while the tags are read
+            buffer = LzmaInflatingBuffer(buffer, fileLength - 8)
         elif compression == cls.CompressionLevel.LZMA:
             # Compressed size is never used
             _compressed_size = buffer.read_ui32()  # noqa: F841
@@ -91,7 +115,7 @@ class SwfHeader:
             decompressed = lzma.decompress(lzmaFile)
 
             # Reconstruct header
-            buffer = ExtendedBuffer(decompressed)
+            buffer = ExtendedBufferView(decompressed)
 
         frameSize = Rect.from_buffer(buffer)
         frameRate = buffer.read_fixed8()
@@ -109,106 +133,285 @@ class Swf:
     header: SwfHeader
     fileAttributes: FileAttributes
     tags: Generator[Tag, Any, None]
+    # Decompressed body and the offset of the first tag in it, used by `index`
+    buffer: ExtendedBuffer | None = field(default=None, repr=False, compare=False)
+    tagsOffset: int = field(default=0, repr=False, compare=False)
+    # Statistics of the decoded tags if they were requested in `from_buffer`
+    stats: ParseStats | None = field(default=None, repr=False, compare=False)
+    _index: TagIndex | None = field(default=None, init=False, repr=False, compare=False)
+    # File mapped by `from_path`, released by `close`
+    _mapping: mmap.mmap | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __enter__(self) -> 'Swf':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stops decoding the remaining tags and releases the file mapped by `from_path`.
+
+        The mapping is closed right away unless decoded tags still reference it, for example
+        the code of a DoABC tag, then it is closed once the last of them is released.
+        """
+        if isinstance(self.tags, GeneratorType):
+            self.tags.close()
+        self.buffer = None
+        self._index = None
+        if self._mapping is not None:
+            with contextlib.suppress(BufferError):
+                self._mapping.close()
+            self._mapping = None
 
     @staticmethod
-    def get_tag_list(buffer: ExtendedBuffer):
+    def decode_tag(
+        tag_type: Tag.TagTypes,
+        tag_buffer: ExtendedBuffer,
+        include: Collection[Tag.TagTypes] | None = None,
+        exclude: Collection[Tag.TagTypes] | None = None,
+        stats: ParseStats | None = None,
+    ) -> Tag:
+        """
+        Decodes a single tag body with the decoder registered in TAG_REGISTRY, or wraps it in a RawTag
+        if it is not selected by `include` and `exclude`.
+        """
+        return TAG_REGISTRY.decode(tag_type, tag_buffer, include, exclude, stats)
+
+    @classmethod
+    def get_tag_list(
+        cls,
+        buffer: ExtendedBuffer,
+        include: Collection[Tag.TagTypes] | None = None,
+        exclude: Collection[Tag.TagTypes] | None = None,
+        stats: ParseStats | None = None,
+    ) -> Generator[Tag, Any, None]:
         while True:
             tag_header = TagHeader.from_buffer(buffer)
 
             tag_buffer = buffer.subbuffer(tag_header.tag_length)
-            match tag_header.tag_type:
-                case Tag.TagTypes.CSMTextSettings:
-                    yield CSMTextSettings.from_buffer(tag_buffer)
-                case Tag.TagTypes.DefineBits:
-                    yield DefineBits.from_buffer(tag_buffer)
-                case Tag.TagTypes.DefineBitsJPEG2:
-                    yield DefineBitsJPEG2.from_buffer(tag_buffer)
-                case Tag.TagTypes.DefineBitsJPEG3:
-                    yield DefineBitsJPEG3.from_buffer(tag_buffer)
-                case Tag.TagTypes.DefineBitsJPEG4:
-                    yield DefineBitsJPEG4.from_buffer(tag_buffer)
-                case Tag.TagTypes.DefineEditText:
-                    yield DefineEditText.from_buffer(tag_buffer)
-                case Tag.TagTypes.DefineFontAlignZones:
-                    yield DefineFontAlignZones.from_buffer(tag_buffer)
-                case Tag.TagTypes.DefineFontName:
-                    yield DefineFontName.from_buffer(tag_buffer)
-                case Tag.TagTypes.DefineSceneAndFrameLabelData:
-                    yield DefineSceneAndFrameLabelData.from_buffer(tag_buffer)
-                case Tag.TagTypes.DefineShape:
-                    yield DefineShape.from_buffer(tag_buffer)
-                case Tag.TagTypes.DefineShape2:
-                    yield DefineShape2.from_buffer(tag_buffer)
-                case Tag.TagTypes.DefineShape3:
-                    yield DefineShape3.from_buffer(tag_buffer)
-                case Tag.TagTypes.DefineShape4:
-                    yield DefineShape4.from_buffer(tag_buffer)
-                case Tag.TagTypes.DefineSprite:
-                    yield DefineSprite.from_buffer(tag_buffer)
-                case Tag.TagTypes.DoABC:
-                    yield DoABC.from_buffer(tag_buffer)
-                case Tag.TagTypes.DoABC2:
-                    yield DoABC2.from_buffer(tag_buffer)
-                case Tag.TagTypes.EnableDebugger:
-                    yield EnableDebugger.from_buffer(tag_buffer)
-                case Tag.TagTypes.EnableDebugger2:
-                    yield EnableDebugger2.from_buffer(tag_buffer)
-                case Tag.TagTypes.ExportAssets:
-                    yield ExportAssets.from_buffer(tag_buffer)
-                case Tag.TagTypes.FileAttributes:
-                    yield FileAttributes.from_buffer(tag_buffer)
-                case Tag.TagTypes.FrameLabel:
-                    yield FrameLabel.from_buffer(tag_buffer)
-                case Tag.TagTypes.ImportAssets:
-                    yield ImportAssets.from_buffer(tag_buffer)
-                case Tag.TagTypes.JPEGTables:
-                    yield JPEGTables.from_buffer(tag_buffer)
-                case Tag.TagTypes.Metadata:
-                    yield Metadata.from_buffer(tag_buffer)
-                case Tag.TagTypes.PlaceObject:
-                    yield PlaceObject.from_buffer(tag_buffer)
-                case Tag.TagTypes.PlaceObject2:
-                    yield PlaceObject2.from_buffer(tag_buffer)
-                case Tag.TagTypes.PlaceObject3:
-                    yield PlaceObject3.from_buffer(tag_buffer)
-                case Tag.TagTypes.Protect:
-                    yield Protect.from_buffer(tag_buffer)
-                case Tag.TagTypes.RemoveObject:
-                    yield RemoveObject.from_buffer(tag_buffer)
-                case Tag.TagTypes.RemoveObject2:
-                    yield RemoveObject2.from_buffer(tag_buffer)
-                case Tag.TagTypes.ScriptLimits:
-                    yield ScriptLimits.from_buffer(tag_buffer)
-                case Tag.TagTypes.SetBackgroundColor:
-                    yield SetBackgroundColor.from_buffer(tag_buffer)
-                case Tag.TagTypes.SetTabIndex:
-                    yield SetTabIndex.from_buffer(tag_buffer)
-                case Tag.TagTypes.ShowFrame:
-                    yield ShowFrame.from_buffer(tag_buffer)
-                case Tag.TagTypes.StartSound:
-                    yield StartSound.from_buffer(tag_buffer)
-                case Tag.TagTypes.StartSound2:
-                    yield StartSound2.from_buffer(tag_buffer)
-                case Tag.TagTypes.SymbolClass:
-                    yield SymbolClass.from_buffer(tag_buffer)
-                case Tag.TagTypes.Unknown:
-                    yield Unknown.from_buffer(tag_buffer)
-                case Tag.TagTypes.End:
-                    yield End.from_buffer(tag_buffer)
-                    break
-                case _:
-                    raise NotImplementedError(f'Unimplemented tag: {tag_header.tag_type}')
+            yield cls.decode_tag(tag_header.tag_type, tag_buffer, include, exclude, stats)
+            if tag_header.tag_type == Tag.TagTypes.End:
+                break
+
+    @classmethod
+    def get_tag_list_parallel(
+        cls,
+        buffer: ExtendedBuffer,
+        executor: 'Executor',
+        include: Collection[Tag.TagTypes] | None = None,
+        exclude: Collection[Tag.TagTypes] | None = None,
+        stats: ParseStats | None = None,
+        max_pending: int | None = None,
+    ) -> Generator[Tag, Any, None]:
+        """
+        Yields the same tags as `get_tag_list`, but decodes the expensive ones on `executor`.
+
+        The tag boundaries are indexed first, then the selected tags of PARALLEL_TAG_TYPES with
+        at least PARALLEL_MIN_TAG_LENGTH bytes are submitted in file order, at most `max_pending`
+        at a time, so only the bodies of those tags are copied for the workers at once. The
+        remaining tags are decoded inline while the results are handed out in file order. The
+        workers collect their own statistics, they are merged into `stats` as the results are
+        handed out.
+
+        Args:
+            max_pending (int | None): Number of submitted tags that were not handed out yet, twice
+                the number of CPUs if None.
+        """
+        if max_pending is None:
+            max_pending = 2 * (os.cpu_count() or 1)
+        index = TagIndex.from_buffer(buffer, buffer.tell())
+        parallel = [
+            position for position, (tag_code, length) in enumerate(zip(index.tagCodes, index.lengths))
+            if tag_code in PARALLEL_TAG_TYPES and length >= PARALLEL_MIN_TAG_LENGTH and Tag.is_selected(Tag.TagTypes(tag_code), include, exclude)
+        ]
+        next_parallel = 0
+        futures: dict[int, 'Future'] = {}
+
+        try:
+            for position, entry in enumerate(index):
+                while next_parallel < len(parallel) and len(futures) < max_pending:
+                    submitted = parallel[next_parallel]
+                    next_parallel += 1
+                    tag_type = Tag.TagTypes(index.tagCodes[submitted])
+                    futures[submitted] = executor.submit(_decode_tag_data, tag_type, index.read(submitted), include, exclude, stats is not None)
+                if position in futures:
+                    tag, tag_stats = futures.pop(position).result()
+                    if stats is not None:
+                        stats.merge(tag_stats)
+                    yield tag
+                else:
+                    yield cls.decode_tag(entry.tag_type, index.subbuffer(position), include, exclude, stats)
+        finally:
+            for future in futures.values():
+                future.cancel()
 
     @classmethod
-    def from_buffer(cls, buffer: ExtendedBuffer):
+    def from_buffer(
+        cls,
+        buffer: ExtendedBuffer,
+        streaming: bool = False,
+        include: Collection[Tag.TagTypes] | None = None,
+        exclude: Collection[Tag.TagTypes] | None = None,
+        executor: 'Executor | None' = None,
+        cache: 'SwfCache | None' = None,
+        stats: ParseStats | None = None,
+    ):
+        """
+        Parses the SWF header and the FileAttributes tag, the remaining tags are decoded lazily.
+
+        Tags that are not selected by `include` and `exclude` are not decoded but returned as
+        RawTag holding the undecoded body. The selection also applies to the tags of sprites,
+        a DefineSprite that is not included but not excluded either is decoded if `include`
+        selects tags that can appear in it. End and FileAttributes are always decoded.
+
+        Args:
+            buffer (ExtendedBuffer): The SWF file.
+            streaming (bool): Decompress the body on demand while `tags` is consumed instead of up front.
+            include (Collection[TagTypes] | None): Only decode these tag types, None decodes all types.
+            exclude (Collection[TagTypes] | None): Never decode these tag types.
+            executor (Executor | None): Decode the expensive tags in parallel on this executor, usually a
+                ProcessPoolExecutor, see `get_tag_list_parallel`. Can not be combined with a streaming body.
+            cache (SwfCache | None): Load the tags from this cache, see `from_cache`.
+            stats (ParseStats | None): Collect per tag type statistics here while the tags are decoded.
+        """
+        if cache is not None:
+            return cls.from_cache(buffer, cache, streaming, include, exclude, executor, stats)
 
-        header, buffer = SwfHeader.from_buffer(buffer)
+        header, buffer = SwfHeader.from_buffer(buffer, streaming)
+        if executor is not None and not buffer.seekable():
+            raise io.UnsupportedOperation('a streaming Swf can not be decoded in parallel, load it with streaming=False')
+        tagsOffset = buffer.tell()
 
         tag_header = TagHeader.from_buffer(buffer)
         tag_buffer = buffer.subbuffer(tag_header.tag_length)
         fileAttributes: FileAttributes = FileAttributes.from_buffer(tag_buffer)
 
-        tags: Generator[Tag, Any, None] = cls.get_tag_list(buffer)
+        tags: Generator[Tag, Any, None]
+        if executor is None:
+            tags = cls.get_tag_list(buffer, include, exclude, stats)
+        else:
+            tags = cls.get_tag_list_parallel(buffer, executor, include, exclude, stats)
 
         # Implement check that fileAttributes is defined
-        return cls(header, fileAttributes, tags)
+        return cls(header, fileAttributes, tags, buffer, tagsOffset, stats)
+
+    def index(self) -> TagIndex:
+        """
+        Returns the header-only index of all tags in this file, it is built on first use.
+
+        Raises:
+            io.UnsupportedOperation: If the file was loaded with `streaming`, the released
+                data can not be revisited, or from a cache that does not hold the body.
+        """
+        if self._index is None:
+            if self.buffer is None:
+                raise io.UnsupportedOperation('a Swf loaded from a cache can not be indexed')
+            if not self.buffer.seekable():
+                raise io.UnsupportedOperation('a streaming Swf can not be indexed, load it with streaming=False')
+            self._index = TagIndex.from_buffer(self.buffer, self.tagsOffset)
+        return self._index
+
+    @classmethod
+    def from_cache(
+        cls,
+        buffer: ExtendedBuffer,
+        cache: 'SwfCache',
+        streaming: bool = False,
+        include: Collection[Tag.TagTypes] | None = None,
+        exclude: Collection[Tag.TagTypes] | None = None,
+        executor: 'Executor | None' = None,
+        stats: ParseStats | None = None,
+    ) -> 'Swf':
+        """
+        Returns the tags stored in `cache` for the file in `buffer`, or parses and stores them.
+
+        On a hit the file is only hashed, neither decompressed nor decoded. On a miss all tags
+        are decoded up front so they can be stored. The other arguments are used on a miss,
+        see `from_buffer`. A Swf loaded from the cache has no body to `index`, and nothing is
+        added to `stats` as no tag is decoded.
+        """
+        data = buffer.getbuffer()[buffer.tell():]
+        key = cache.key(data, include, exclude)
+        del data
+
+        entry = cache.get(key)
+        if entry is not None:
+            header, fileAttributes, tags = entry
+            return cls(header, fileAttributes, (tag for tag in tags), stats=stats)
+
+        swf = cls.from_buffer(buffer, streaming, include, exclude, executor, stats=stats)
+        tags = [_materialize(tag) for tag in swf.tags]
+        cache.put(key, (swf.header, swf.fileAttributes, tags))
+        swf.tags = (tag for tag in tags)
+        return swf
+
+    @classmethod
+    def from_path(
+        cls,
+        path: str | os.PathLike,
+        streaming: bool = False,
+        include: Collection[Tag.TagTypes] | None = None,
+        exclude: Collection[Tag.TagTypes] | None = None,
+        executor: 'Executor | None' = None,
+        cache: 'SwfCache | None' = None,
+        stats: ParseStats | None = None,
+    ) -> 'Swf':
+        """
+        Parses a SWF file from disk without reading it into memory first.
+
+        The file is memory-mapped read-only, so uncompressed (FWS) files are decoded straight
+        from the page cache and only the pages of the tags that are actually consumed get loaded.
+        Use the returned Swf as a context manager or `close` it to release the mapping.
+
+        Args:
+            path (str | os.PathLike): Path of the SWF file.
+            streaming (bool): Decompress the body on demand, see `from_buffer`.
+            include (Collection[TagTypes] | None): Only decode these tag types, see `from_buffer`.
+            exclude (Collection[TagTypes] | None): Never decode these tag types, see `from_buffer`.
+            executor (Executor | None): Decode the expensive tags on this executor, see `from_buffer`.
+            cache (SwfCache | None): Load the tags from this cache, see `from_cache`.
+            stats (ParseStats | None): Collect per tag type statistics here, see `from_buffer`.
+        """
+        with open(path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                # An empty file can not be mapped, fail like any other file without a header
+                return cls.from_buffer(ExtendedBufferView(b''), streaming, include, exclude, executor, cache, stats)
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            swf = cls.from_buffer(ExtendedBufferView(mapping), streaming, include, exclude, executor, cache, stats)
+        except BaseException:
+            with contextlib.suppress(BufferError):
+                mapping.close()
+            raise
+        if swf.buffer is None:
+            # Loaded from the cache, nothing references the file
+            mapping.close()
+        else:
+            swf._mapping = mapping
+        return swf
+
+
+def _materialize(tag: Tag) -> Tag:
+    """
+    Replaces the lazily decoded parts of a tag with lists, generators can not be pickled.
+    """
+    if isinstance(tag, RawTag):
+        return tag
+    if tag.tag_type == Tag.TagTypes.DefineSprite:
+        tag.tags = [_materialize(sprite_tag) for sprite_tag in tag.tags]  # type: ignore
+    elif tag.tag_type.value in SHAPE_TAG_TYPES:
+        tag.shapes.shapeRecords = list(tag.shapes.shapeRecords)  # type: ignore
+    return tag
+
+
+def _decode_tag_data(
+    tag_type: Tag.TagTypes,
+    data: bytes,
+    include: Collection[Tag.TagTypes] | None,
+    exclude: Collection[Tag.TagTypes] | None,
+    collect_stats: bool,
+) -> tuple[Tag, ParseStats | None]:
+    # Runs in the worker processes of `Swf.get_tag_list_parallel`
+    stats = ParseStats() if collect_stats else None
+    return _materialize(Swf.decode_tag(tag_type, ExtendedBufferView(data), include, exclude, stats)), stats
@@ -0,0 +1,134 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from functools import lru_cache
+from typing import Any, Collection
+
+import pyfdec
+from pyfdec.tags.Tag import Tag
+
+
+@lru_cache(maxsize=1)
+def cache_schema() -> str:
+    """
+    Returns a hash of the pyfdec sources, the classes of all cached objects are defined in them.
+
+    Any change to the package changes the schema, so entries are never loaded into classes
+    whose layout differs from the one they were pickled with.
+    """
+    package = os.path.dirname(os.path.abspath(pyfdec.__file__))
+    paths: list[str] = []
+    for directory, _, files in os.walk(package):
+        paths.extend(os.path.join(directory, name) for name in files if name.endswith('.py'))
+    digest = hashlib.sha256(pyfdec.__version__.encode())
+    for path in sorted(paths):
+        digest.update(f':{os.path.relpath(path, package)}:'.encode())
+        with open(path, 'rb') as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+class SwfCache:
+    """
+    Directory of pickled parse results keyed by a hash of the parsed file.
+
+    Entries are written once and never modified. The modification time of an entry is
+    refreshed on every hit, and once the directory grows past `max_size` the entries
+    that were used the longest time ago are removed first.
+
+    Args:
+        directory (str | os.PathLike | None): Where the entries are stored, defaults to `$XDG_CACHE_HOME/pyfdec`.
+        max_size (int): Size in bytes the directory is trimmed to after storing an entry.
+    """
+
+    def __init__(self, directory: str | os.PathLike | None = None, max_size: int = 1 << 30):
+        if directory is None:
+            directory = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'pyfdec')
+        self.directory: str = os.fspath(directory)
+        self.max_size: int = max_size
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def key(
+        data,
+        include: Collection[Tag.TagTypes] | None = None,
+        exclude: Collection[Tag.TagTypes] | None = None,
+    ) -> str:
+        """
+        Returns the cache key for parsing `data` with the given tag selection.
+
+        The key covers the `cache_schema`, so entries written by other versions of pyfdec
+        are never returned.
+
+        Args:
+            data (bytes | memoryview): The complete SWF file.
+            include (Collection[TagTypes] | None): The included tag types.
+            exclude (Collection[TagTypes] | None): The excluded tag types.
+        """
+        digest = hashlib.sha256(cache_schema().encode())
+        for selection in (include, exclude):
+            codes = 'all' if selection is None else ','.join(str(code) for code in sorted(tag_type.value for tag_type in selection))
+            digest.update(f':{codes}'.encode())
+        digest.update(b':')
+        digest.update(data)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.pickle')
+
+    def get(self, key: str) -> Any | None:
+        """
+        Returns the entry stored for `key`, or None if there is none.
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as file:
+                value = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Damaged entry or one whose classes moved or changed, treat it as a miss and let the next store replace it
+            os.remove(path)
+            return None
+        os.utime(path)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Stores `value` for `key` and evicts the least recently used entries if the cache is too big.
+        """
+        # Write to a temporary file first, so concurrent readers never see a partial entry
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, self._path(key))
+        except BaseException:
+            os.remove(temporary)
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Removes the least recently used entries until the cache fits into `max_size`.
+        """
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.pickle'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        size = sum(entry[1] for entry in entries)
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            size -= entry_size
+
+    def clear(self) -> None:
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.pickle'):
+                os.remove(entry.path)
@@ -0,0 +1,165 @@
+import io
+from array import array
+from dataclasses import dataclass, field
+from typing import ClassVar, Iterator
+
+from pyfdec.extended_buffer import ExtendedBuffer
+from pyfdec.tag_registry import TAG_REGISTRY
+from pyfdec.tags.Tag import Tag
+
+
+@dataclass
+class TagIndex:
+    """
+    Table of the type, body offset and body length of every tag in a SWF body.
+
+    Only the tag headers are read while building the index, bodies are skipped. Single
+    tags can then be decoded by position or by the character ID they define without
+    decoding the tags in front of them. Offsets are relative to the decompressed buffer
+    the tags are read from, the entries are kept in arrays to stay compact for files
+    with many tags.
+    """
+
+    @dataclass
+    class Entry:
+        tag_code: int
+        offset: int
+        length: int
+
+        @property
+        def tag_type(self) -> Tag.TagTypes:
+            return Tag.TagTypes(self.tag_code)
+
+    # Tags that start with the ID of the character they define
+    CHARACTER_TAG_TYPES: ClassVar[frozenset[int]] = frozenset(
+        tag_type.value for tag_type in (
+            Tag.TagTypes.DefineShape,
+            Tag.TagTypes.DefineShape2,
+            Tag.TagTypes.DefineShape3,
+            Tag.TagTypes.DefineShape4,
+            Tag.TagTypes.DefineMorphShape,
+            Tag.TagTypes.DefineMorphShape2,
+            Tag.TagTypes.DefineBits,
+            Tag.TagTypes.DefineBitsJPEG2,
+            Tag.TagTypes.DefineBitsJPEG3,
+            Tag.TagTypes.DefineBitsJPEG4,
+            Tag.TagTypes.DefineBitsLossless,
+            Tag.TagTypes.DefineBitsLossless2,
+            Tag.TagTypes.DefineButton,
+            Tag.TagTypes.DefineButton2,
+            Tag.TagTypes.DefineEditText,
+            Tag.TagTypes.DefineFont,
+            Tag.TagTypes.DefineFont2,
+            Tag.TagTypes.DefineFont3,
+            Tag.TagTypes.DefineFont4,
+            Tag.TagTypes.DefineText,
+            Tag.TagTypes.DefineText2,
+            Tag.TagTypes.DefineSound,
+            Tag.TagTypes.DefineSprite,
+            Tag.TagTypes.DefineVideoStream,
+            Tag.TagTypes.DefineBinaryData,
+        )
+    )
+
+    buffer: ExtendedBuffer = field(repr=False)
+    tagCodes: array = field(default_factory=lambda: array('H'))
+    offsets: array = field(default_factory=lambda: array('Q'))
+    lengths: array = field(default_factory=lambda: array('I'))
+    _characters: dict[int, int] | None = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_buffer(cls, buffer: ExtendedBuffer, offset: int = 0) -> 'TagIndex':
+        """
+        Scans the tag headers starting at `offset` up to the End tag or the end of the buffer.
+
+        The position of the buffer is restored afterwards, so an index can be built while
+        the tags of the same buffer are being decoded.
+
+        Args:
+            buffer (ExtendedBuffer): Seekable buffer holding the (decompressed) tags.
+            offset (int): Offset of the first tag header.
+        """
+        index = cls(buffer)
+        position = buffer.tell()
+        try:
+            buffer.seek(offset)
+            end = offset + buffer.bytes_left()
+            while offset + 2 <= end:
+                tag_code_and_length = buffer.read_ui16()
+                tag_code = tag_code_and_length >> 6
+                length = tag_code_and_length & 0x3F
+                if length == 0x3F:
+                    length = buffer.read_ui32()
+                offset = buffer.tell()
+                index.tagCodes.append(tag_code)
+                index.offsets.append(offset)
+                index.lengths.append(length)
+                if tag_code == Tag.TagTypes.End.value:
+                    break
+                offset = buffer.seek(length, io.SEEK_CUR)
+        finally:
+            buffer.seek(position)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.tagCodes)
+
+    def __getitem__(self, position: int) -> Entry:
+        return self.Entry(self.tagCodes[position], self.offsets[position], self.lengths[position])
+
+    def __iter__(self) -> Iterator[Entry]:
+        for tag_code, offset, length in zip(self.tagCodes, self.offsets, self.lengths):
+            yield self.Entry(tag_code, offset, length)
+
+    def subbuffer(self, position: int) -> ExtendedBuffer:
+        """
+        Returns the undecoded body of the tag at `position` in the index.
+        """
+        previous = self.buffer.tell()
+        try:
+            self.buffer.seek(self.offsets[position])
+            return self.buffer.subbuffer(self.lengths[position])
+        finally:
+            self.buffer.seek(previous)
+
+    def read(self, position: int) -> bytes:
+        """
+        Returns a copy of the body of the tag at `position` in the index.
+        """
+        previous = self.buffer.tell()
+        try:
+            self.buffer.seek(self.offsets[position])
+            return self.buffer.read(self.lengths[position])
+        finally:
+            self.buffer.seek(previous)
+
+    def decode(self, position: int) -> Tag:
+        """
+        Decodes the tag at `position` in the index.
+        """
+        return TAG_REGISTRY.decode(self[position].tag_type, self.subbuffer(position))
+
+    def character_position(self, character_id: int) -> int:
+        """
+        Returns the position of the tag that defines `character_id`.
+
+        Raises:
+            KeyError: If no tag in the index defines the character.
+        """
+        if self._characters is None:
+            self._characters = {}
+            previous = self.buffer.tell()
+            try:
+                for position, (tag_code, offset, length) in enumerate(zip(self.tagCodes, self.offsets, self.lengths)):
+                    if tag_code in self.CHARACTER_TAG_TYPES and length >= 2:
+                        self.buffer.seek(offset)
+                        self._characters.setdefault(self.buffer.read_ui16(), position)
+            finally:
+                self.buffer.seek(previous)
+        return self._characters[character_id]
+
+    def decode_character(self, character_id: int) -> Tag:
+        """
+        Decodes the tag that defines `character_id`.
+        """
+        return self.decode(self.character_position(character_id))
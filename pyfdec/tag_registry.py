@@ -0,0 +1,239 @@
+import importlib
+import sys
+import time
+from typing import TYPE_CHECKING, Callable, Collection
+
+from pyfdec.extended_buffer import ExtendedBuffer
+from pyfdec.tags.RawTag import RawTag
+from pyfdec.tags.Tag import Tag
+
+if TYPE_CHECKING:
+    from pyfdec.parse_stats import ParseStats
+
+TagDecoder = Callable[..., Tag]
+
+
+class TagRegistry:
+    """
+    Maps tag types to the callables that decode their bodies.
+
+    Decoders are called with the tag body as their only argument, container decoders
+    (DefineSprite) additionally get the `include` and `exclude` selection and the ParseStats
+    to pass on to their own tags. A decoder can also be registered as the name of a module in
+    `pyfdec.tags`, the module is then only imported when the first tag of the type is
+    decoded and its tag class' `from_buffer` is used. A registry with a parent falls back to the decoders of the parent, so
+    overriding a decoder in TAG_REGISTRY also overrides it in SPRITE_TAG_REGISTRY. The
+    `allowed` set restricts which tag types may appear in the context of the registry at all.
+
+    Args:
+        parent (TagRegistry | None): Registry to look up decoders in that are not registered here.
+        allowed (Collection[TagTypes] | None): The tag types valid in this context, None allows all types.
+        context (str | None): Name of the context used in error messages.
+    """
+
+    def __init__(
+        self,
+        parent: 'TagRegistry | None' = None,
+        allowed: Collection[Tag.TagTypes] | None = None,
+        context: str | None = None,
+    ):
+        self._parent: TagRegistry | None = parent
+        self._allowed: frozenset[int] | None = None if allowed is None else frozenset(tag_type.value for tag_type in allowed)
+        self._context: str | None = context
+        # tag code -> (decoder or module name, is container)
+        self._decoders: dict[int, tuple[TagDecoder | str, bool]] = {}
+        # tag code -> (decoder, is container) of the decoders registered here that were resolved
+        self._resolved: dict[int, tuple[TagDecoder, bool]] = {}
+        # tag code -> registry the container decodes its tags with
+        self._children: dict[int, TagRegistry | None] = {}
+
+    def register(
+        self,
+        tag_type: Tag.TagTypes,
+        decoder: TagDecoder | str,
+        container: bool = False,
+        children: 'TagRegistry | None' = None,
+    ) -> None:
+        """
+        Registers `decoder` for `tag_type`, replacing the decoder that was registered before.
+
+        Args:
+            tag_type (TagTypes): Type of the tag.
+            decoder (TagDecoder | str): Called with the tag body, usually the `from_buffer` of a Tag class,
+                or the name of the `pyfdec.tags` module to import it from on first use.
+            container (bool): The decoder also takes the `include` and `exclude` selection and the ParseStats.
+            children (TagRegistry | None): Registry a container decodes its tags with. A container that is
+                not selected itself is still decoded if `include` selects a tag type its tags can have.
+        """
+        self._decoders[tag_type.value] = (decoder, container)
+        self._children[tag_type.value] = children
+        self._resolved.pop(tag_type.value, None)
+
+    def unregister(self, tag_type: Tag.TagTypes) -> None:
+        del self._decoders[tag_type.value]
+        del self._children[tag_type.value]
+        self._resolved.pop(tag_type.value, None)
+
+    def selects_any(self, include: Collection[Tag.TagTypes] | None) -> bool:
+        """
+        Checks if `include` selects any of the tag types allowed in the context of this registry.
+        """
+        if include is None or self._allowed is None:
+            return include is None or bool(include)
+        return any(tag_type.value in self._allowed for tag_type in include)
+
+    def _descends(self, tag_type: Tag.TagTypes, include: Collection[Tag.TagTypes] | None, exclude: Collection[Tag.TagTypes] | None) -> bool:
+        # Containers are decoded for their tags unless they are excluded explicitly
+        if exclude is not None and tag_type in exclude:
+            return False
+        registry: TagRegistry | None = self
+        while registry is not None and tag_type.value not in registry._decoders:
+            registry = registry._parent
+        children = None if registry is None else registry._children.get(tag_type.value)
+        return children is not None and children.selects_any(include)
+
+    def lookup(self, tag_type: Tag.TagTypes) -> tuple[TagDecoder, bool] | None:
+        """
+        Returns the decoder registered for `tag_type` and if it is a container decoder.
+        """
+        code = tag_type.value
+        resolved = self._resolved.get(code)
+        if resolved is not None:
+            return resolved
+        entry = self._decoders.get(code)
+        if entry is None:
+            return None if self._parent is None else self._parent.lookup(tag_type)
+        decoder, container = entry
+        if isinstance(decoder, str):
+            module = importlib.import_module(f'pyfdec.tags.{decoder}')
+            decoder = getattr(module, decoder).from_buffer
+        resolved = self._resolved[code] = (decoder, container)
+        return resolved
+
+    def decode(
+        self,
+        tag_type: Tag.TagTypes,
+        buffer: ExtendedBuffer,
+        include: Collection[Tag.TagTypes] | None = None,
+        exclude: Collection[Tag.TagTypes] | None = None,
+        stats: 'ParseStats | None' = None,
+    ) -> Tag:
+        """
+        Decodes a tag body, or wraps it in a RawTag if it is not selected by `include` and `exclude`.
+
+        Args:
+            tag_type (TagTypes): Type of the tag.
+            buffer (ExtendedBuffer): The tag body.
+            include (Collection[TagTypes] | None): Only decode these tag types, None decodes all types.
+            exclude (Collection[TagTypes] | None): Never decode these tag types.
+            stats (ParseStats | None): Record the size, decode time and allocations of the tag here.
+
+        Raises:
+            ValueError: If the tag type is not allowed in the context of this registry.
+            NotImplementedError: If no decoder is registered for the tag type.
+        """
+        if stats is None:
+            return self._decode(tag_type, buffer, include, exclude, None)
+
+        size = buffer.bytes_left()
+        blocks = sys.getallocatedblocks()
+        start = time.perf_counter()
+        tag = self._decode(tag_type, buffer, include, exclude, stats)
+        stats.record(tag_type, size, time.perf_counter() - start, sys.getallocatedblocks() - blocks)
+        return tag
+
+    def _decode(
+        self,
+        tag_type: Tag.TagTypes,
+        buffer: ExtendedBuffer,
+        include: Collection[Tag.TagTypes] | None,
+        exclude: Collection[Tag.TagTypes] | None,
+        stats: 'ParseStats | None',
+    ) -> Tag:
+        code = tag_type.value
+        if code != 0 and not Tag.is_selected(tag_type, include, exclude) and not self._descends(tag_type, include, exclude):
+            return RawTag.from_buffer(buffer, tag_type)
+        if self._allowed is not None and code not in self._allowed:
+            raise ValueError(f'{self._context} Unsupported Tag: {tag_type}')
+
+        entry = self._resolved.get(code)
+        if entry is None:
+            entry = self.lookup(tag_type)
+        if entry is None:
+            context = '' if self._context is None else f'{self._context} '
+            raise NotImplementedError(f'{context}Unimplemented tag: {tag_type}')
+
+        decoder, container = entry
+        if container:
+            return decoder(buffer, include, exclude, stats)
+        return decoder(buffer)
+
+
+# The tag classes live in modules of the same name in `pyfdec.tags`, which are imported on first use
+TAG_REGISTRY = TagRegistry()
+for tag_type in (
+    Tag.TagTypes.CSMTextSettings,
+    Tag.TagTypes.DefineBits,
+    Tag.TagTypes.DefineBitsJPEG2,
+    Tag.TagTypes.DefineBitsJPEG3,
+    Tag.TagTypes.DefineBitsJPEG4,
+    Tag.TagTypes.DefineEditText,
+    Tag.TagTypes.DefineFontAlignZones,
+    Tag.TagTypes.DefineFontName,
+    Tag.TagTypes.DefineSceneAndFrameLabelData,
+    Tag.TagTypes.DefineShape,
+    Tag.TagTypes.DefineShape2,
+    Tag.TagTypes.DefineShape3,
+    Tag.TagTypes.DefineShape4,
+    Tag.TagTypes.DoABC,
+    Tag.TagTypes.DoABC2,
+    Tag.TagTypes.EnableDebugger,
+    Tag.TagTypes.EnableDebugger2,
+    Tag.TagTypes.End,
+    Tag.TagTypes.ExportAssets,
+    Tag.TagTypes.FileAttributes,
+    Tag.TagTypes.FrameLabel,
+    Tag.TagTypes.ImportAssets,
+    Tag.TagTypes.JPEGTables,
+    Tag.TagTypes.Metadata,
+    Tag.TagTypes.PlaceObject,
+    Tag.TagTypes.PlaceObject2,
+    Tag.TagTypes.PlaceObject3,
+    Tag.TagTypes.Protect,
+    Tag.TagTypes.RemoveObject,
+    Tag.TagTypes.RemoveObject2,
+    Tag.TagTypes.ScriptLimits,
+    Tag.TagTypes.SetBackgroundColor,
+    Tag.TagTypes.SetTabIndex,
+    Tag.TagTypes.ShowFrame,
+    Tag.TagTypes.StartSound,
+    Tag.TagTypes.StartSound2,
+    Tag.TagTypes.SymbolClass,
+    Tag.TagTypes.Unknown,
+):
+    TAG_REGISTRY.register(tag_type, tag_type.name)
+
+# Control and action tags that may appear inside a DefineSprite
+SPRITE_TAG_REGISTRY = TagRegistry(
+    TAG_REGISTRY,
+    allowed=(
+        Tag.TagTypes.ShowFrame,
+        Tag.TagTypes.PlaceObject,
+        Tag.TagTypes.PlaceObject2,
+        Tag.TagTypes.PlaceObject3,
+        Tag.TagTypes.RemoveObject,
+        Tag.TagTypes.RemoveObject2,
+        Tag.TagTypes.StartSound,
+        Tag.TagTypes.FrameLabel,
+        Tag.TagTypes.SoundStreamHead,
+        Tag.TagTypes.SoundStreamHead2,
+        Tag.TagTypes.SoundStreamBlock,
+        Tag.TagTypes.DoAction,
+        Tag.TagTypes.DoInitAction,
+        Tag.TagTypes.DoABC,
+        Tag.TagTypes.DoABC2,
+        Tag.TagTypes.End,
+    ),
+    context='DefineSprite'
+)
+TAG_REGISTRY.register(Tag.TagTypes.DefineSprite, Tag.TagTypes.DefineSprite.name, container=True, children=SPRITE_TAG_REGISTRY)
@@ -21,7 +21,7 @@ class DefineBits(Tag):
     @classmethod
     def from_buffer(cls, buffer: ExtendedBuffer) -> 'DefineBits':
         characterID = buffer.read_ui16()
-        imageData = ExtendedBuffer(buffer.read())
+        imageData = buffer.subbuffer(buffer.bytes_left())
         return cls(characterID, imageData)
 
 
@@ -16,7 +16,8 @@ class ExportAssets(Tag):
         count = buffer.read_ui16()
         id_and_name = {}
         for _ in range(count):
-            id_and_name[buffer.read_ui16()] = buffer.read_string()
+            tag_id = buffer.read_ui16()
+            id_and_name[tag_id] = buffer.read_string()
         return cls(id_and_name)
 
 
@@ -13,7 +13,7 @@ class JPEGTables(Tag):
 
     @classmethod
     def from_buffer(cls, buffer: ExtendedBuffer) -> 'JPEGTables':
-        jpegData = ExtendedBuffer(buffer.read())
+        jpegData = buffer.subbuffer(buffer.bytes_left())
         return cls(jpegData)
 
 
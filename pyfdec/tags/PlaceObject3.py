@@ -33,7 +33,7 @@ class PlaceObject3(PlaceObject2):
 
             @classmethod
             def from_buffer(cls, buffer: ExtendedBuffer) -> 'PlaceObject3.Filter.ColorMatrixFilter':
-                matrix = [buffer.read_f32() for _ in range(20)]
+                matrix = buffer.read_f32_array(20)
                 return cls(matrix)
 
         @dataclass
@@ -53,7 +53,7 @@ class PlaceObject3(PlaceObject2):
                 matrixY = buffer.read_ui8()
                 divisor = buffer.read_f32()
                 bias = buffer.read_f32()
-                matrix = [buffer.read_f32() for _ in range(matrixX * matrixY)]
+                matrix = buffer.read_f32_array(matrixX * matrixY)
                 defaultColor = RGBA.from_buffer(buffer)
                 with ExtendedBitIO(buffer) as bits:
                     bits.padding(6)
@@ -220,7 +220,7 @@ class PlaceObject3(PlaceObject2):
             def from_buffer(cls, buffer: ExtendedBuffer) -> 'PlaceObject3.Filter.GradientGlowFilter':
                 numColors = buffer.read_ui8()
                 gradientColors = [RGBA.from_buffer(buffer) for _ in range(numColors)]
-                gradientRatio = [buffer.read_ui8() for _ in range(numColors)]
+                gradientRatio = buffer.read_ui8_array(numColors)
                 blurX = buffer.read_fixed()
                 blurY = buffer.read_fixed()
                 angle = buffer.read_fixed()
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+from pyfdec.extended_buffer import ExtendedBuffer
+from pyfdec.tags.Tag import Tag
+
+
+@dataclass
+class RawTag(Tag):
+    """
+    Placeholder for a tag that was not selected for decoding.
+
+    Attributes:
+        tag_type (TagTypes): Type (id) of the skipped tag.
+        data (ExtendedBuffer): The undecoded tag body, a view into the SWF data where the source allows it.
+    """
+    tag_type: Tag.TagTypes  # type: ignore[misc]
+    data: ExtendedBuffer
+
+    @classmethod
+    def from_buffer(cls, buffer: ExtendedBuffer, tag_type: Tag.TagTypes = Tag.TagTypes.Unknown) -> 'RawTag':
+        return cls(tag_type, buffer)
+
+
+Tag.register(RawTag)
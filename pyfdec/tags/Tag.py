@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import ClassVar
+from typing import ClassVar, Collection
 
 from pyfdec.extended_buffer import ExtendedBuffer
 
@@ -97,6 +97,25 @@ class Tag(ABC):
             buffer (ExtendedBuffer): The first number.
         """
 
+    @classmethod
+    def is_selected(
+        cls,
+        tag_type: TagTypes,
+        include: Collection[TagTypes] | None = None,
+        exclude: Collection[TagTypes] | None = None,
+    ) -> bool:
+        """
+        Checks if tags of `tag_type` should be decoded for the given include and exclude sets.
+
+        Args:
+            tag_type (TagTypes): Type of the tag.
+            include (Collection[TagTypes] | None): Only these types are decoded, None selects all types.
+            exclude (Collection[TagTypes] | None): These types are never decoded.
+        """
+        if include is not None and tag_type not in include:
+            return False
+        return exclude is None or tag_type not in exclude
+
 
 @dataclass
 class TagHeader:
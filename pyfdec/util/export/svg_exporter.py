@@ -4,7 +4,7 @@ from pyfdec.tags.DefineShape import DefineShape
 
 
 class SvgExporter:
-    svg = ET.Element('svg')
+    svg: ET.Element
 
     class Cursor:
         _x: float = 0
@@ -51,6 +51,7 @@ class SvgExporter:
         return path
 
     def __init__(self, defineShapeTag: DefineShape):
+        self.svg = ET.Element('svg')
         self.populateSvgHeader()
         viewport = defineShapeTag.shapeBounds
         self.svg.attrib['width'] = f'{(viewport.xmax-viewport.xmin)/20}px'
@@ -0,0 +1,243 @@
+import pickle
+from unittest import TestCase
+
+from pyfdec.abc.ABCFile import ABCFile
+from pyfdec.abc.ControlFlowGraph import BasicBlock
+from pyfdec.abc.Instructions import Instruction
+from pyfdec.abc.InstructionStream import InstructionStream
+from pyfdec.abc.Traits import ClassTrait, MethodTrait, TraitAttributes, TraitInfo, TraitType
+from pyfdec.extended_buffer import ExtendedBuffer, ExtendedBufferView
+
+# method 0, max stack 1, 1 local, scope depth 0 to 1, code: getlocal0, returnvoid, no exceptions and traits
+METHOD_BODY = b'\x00\x01\x01\x00\x01' + b'\x02\xd0\x47' + b'\x00\x00'
+# pushbyte -1, callproperty 3 1, debug 1 2 0 300, lookupswitch 11 [0 11], returnvoid
+CODE = b'\x24\xff' + b'\x46\x03\x01' + b'\xef\x01\x02\x00\xac\x02' + b'\x1b\x0b\x00\x00\x01\x00\x00\x00\x0b\x00\x00' + b'\x47'
+# No numbers, strings: flash.display, MovieClip, __AS3__.vec, Vector, int, x
+CPOOL = b'\x00\x00\x00' + b'\x07' + b''.join(
+    bytes([len(string)]) + string for string in (b'flash.display', b'MovieClip', b'__AS3__.vec', b'Vector', b'int', b'x')
+)
+CPOOL += b'\x04\x16\x01\x16\x03\x16\x00'  # namespaces: flash.display, __AS3__.vec, ''
+CPOOL += b'\x02\x02\x01\x02'  # namespace sets: [flash.display, __AS3__.vec]
+# flash.display::MovieClip, __AS3__.vec::Vector, int, Vector.<int>, Multiname x, MultinameL
+CPOOL += b'\x07' + b'\x07\x01\x02' + b'\x07\x02\x04' + b'\x07\x03\x05' + b'\x1d\x02\x01\x03' + b'\x09\x06\x01' + b'\x1b\x01'
+
+
+class TestMethodBodyInfo(TestCase):
+
+    def test_lazy_code(self):
+        data = bytearray(METHOD_BODY)
+        body = ABCFile.MethodBodyInfo.from_buffer(ExtendedBufferView(data))
+        self.assertIsNone(body._code)
+        # The code is a view, not a copy
+        data[6] = 0xD1
+        self.assertEqual([instruction.opcode for instruction in body.code], [0xD1, 0x47])
+        self.assertIs(body.code, body.code)
+
+    def test_copying_buffer(self):
+        body = ABCFile.MethodBodyInfo.from_buffer(ExtendedBuffer(METHOD_BODY))
+        self.assertEqual([instruction.opcode for instruction in body.code], [0xD0, 0x47])
+
+    def test_pickle(self):
+        body = ABCFile.MethodBodyInfo.from_buffer(ExtendedBufferView(METHOD_BODY))
+        body.code
+        restored = pickle.loads(pickle.dumps(body))
+        self.assertIsNone(restored._code)
+        self.assertEqual(restored, body)
+        self.assertEqual(restored.code, body.code)
+
+
+class TestInstruction(TestCase):
+
+    def test_opcode_table(self):
+        self.assertEqual(len(Instruction.OPCODES), 256)
+        self.assertEqual(Instruction.get_info(0x46), ('callproperty', (Instruction.ArgType.Multiname, Instruction.ArgType.UintLiteral)))
+        self.assertEqual(Instruction.get_info(0x47), ('returnvoid', ()))
+
+    def test_from_buffer(self):
+        buffer = ExtendedBufferView(CODE)
+        instructions = []
+        while buffer.bytes_left():
+            instructions.append(Instruction.from_buffer(buffer))
+        ArgType = Instruction.ArgType
+        self.assertEqual(
+            instructions, [
+                Instruction(0x24, [(ArgType.ByteLiteral, -1)]),
+                Instruction(0x46, [(ArgType.Multiname, 3), (ArgType.UintLiteral, 1)]),
+                Instruction(0xEF, [(ArgType.UByteLiteral, 1), (ArgType.String, 2), (ArgType.UByteLiteral, 0), (ArgType.UintLiteral, 300)]),
+                Instruction(0x1B, [(ArgType.SwitchDefaultTarget, 11), (ArgType.SwitchTargets, [0, 11])]),
+                Instruction(0x47, []),
+            ]
+        )
+
+
+class TestInstructionStream(TestCase):
+
+    def test_arrays(self):
+        stream = InstructionStream.from_bytes(CODE)
+        self.assertEqual(len(stream), 5)
+        self.assertEqual(list(stream.offsets), [0, 2, 5, 11, 22])
+        self.assertEqual(stream.opcodes, bytes([0x24, 0x46, 0xEF, 0x1B, 0x47]))
+        self.assertEqual(list(stream.operand_starts), [0, 1, 3, 7, 11, 11])
+        self.assertEqual(list(stream.operands), [-1, 3, 1, 1, 2, 0, 300, 4, 2, 3, 4])
+
+    def test_views(self):
+        stream = InstructionStream.from_bytes(CODE)
+        view = stream[1]
+        self.assertEqual((view.offset, view.opcode, view.name), (2, 0x46, 'callproperty'))
+        self.assertEqual(list(view.operands), [3, 1])
+        self.assertEqual(stream[-1].name, 'returnvoid')
+        self.assertEqual([view.name for view in stream[:2]], ['pushbyte', 'callproperty'])
+
+    def test_to_instructions(self):
+        buffer = ExtendedBufferView(CODE)
+        instructions = []
+        while buffer.bytes_left():
+            instructions.append(Instruction.from_buffer(buffer))
+        # The branch targets are resolved to instruction indexes
+        instructions[3] = Instruction(0x1B, [(Instruction.ArgType.SwitchDefaultTarget, 4), (Instruction.ArgType.SwitchTargets, [3, 4])])
+        self.assertEqual(InstructionStream.from_bytes(CODE).to_instructions(), instructions)
+
+    def test_targets(self):
+        # jump to returnvoid, jump to the first jump, returnvoid, iftrue into the middle of the first jump
+        stream = InstructionStream.from_bytes(b'\x10\x04\x00\x00' + b'\x10\xf8\xff\xff' + b'\x47' + b'\x11\xf6\xff\xff')
+        self.assertEqual([stream.targets(index) for index in range(len(stream))], [[2], [0], [], [-1]])
+        self.assertEqual(stream[1].arguments, [(Instruction.ArgType.JumpTarget, 0)])
+        self.assertEqual(stream.index_of(4), 1)
+        self.assertEqual(stream.index_of(5), -1)
+
+    def test_large_uint_literal(self):
+        # debugline 0xFFFFFFFF
+        stream = InstructionStream.from_bytes(b'\xf0\xff\xff\xff\xff\x0f')
+        self.assertEqual(stream[0].arguments, [(Instruction.ArgType.UintLiteral, 0xFFFFFFFF)])
+
+    def test_truncated(self):
+        with self.assertRaises(ValueError):
+            InstructionStream.from_bytes(b'\x47\x46\x03')
+
+    def test_too_large(self):
+        # pushint with bit 33 set in the fifth byte
+        with self.assertRaises(ValueError):
+            InstructionStream.from_bytes(b'\x2d\xff\xff\xff\xff\x20')
+
+
+class TestControlFlowGraph(TestCase):
+
+    def test_blocks(self):
+        # getlocal0, iffalse to returnvoid, pushbyte 1, pop, returnvoid, with a handler for pushbyte and pop at returnvoid
+        code = b'\xd0' + b'\x12\x03\x00\x00' + b'\x24\x01' + b'\x29' + b'\x47'
+        data = b'\x00\x01\x01\x00\x01' + bytes([len(code)]) + code + b'\x01\x05\x08\x08\x00\x00' + b'\x00'
+        body = ABCFile.MethodBodyInfo.from_buffer(ExtendedBufferView(data))
+        graph = body.control_flow_graph
+        self.assertEqual(
+            graph.blocks, [
+                BasicBlock(0, 2, successors=[1, 2]),
+                BasicBlock(2, 4, successors=[2], predecessors=[0], handlers=[2]),
+                BasicBlock(4, 5, predecessors=[0, 1]),
+            ]
+        )
+        self.assertEqual(list(graph.block_of), [0, 0, 1, 1, 2])
+        self.assertIs(body.control_flow_graph, graph)
+
+    def test_switch(self):
+        data = b'\x00\x01\x01\x00\x01' + bytes([len(CODE)]) + CODE + b'\x00\x00'
+        graph = ABCFile.MethodBodyInfo.from_buffer(ExtendedBufferView(data)).control_flow_graph
+        self.assertEqual([(block.start, block.end) for block in graph.blocks], [(0, 3), (3, 4), (4, 5)])
+        self.assertEqual(graph.blocks[1].successors, [2, 1])
+        self.assertEqual(graph.blocks[1].predecessors, [0, 1])
+
+
+class TestNameResolver(TestCase):
+
+    def setUp(self):
+        cpool = ABCFile.CPoolInfo.from_buffer(ExtendedBufferView(CPOOL))
+        self.abc = ABCFile(16, 46, cpool, [], [], [], [], [], [])
+
+    def test_multiname(self):
+        names = self.abc.names
+        self.assertIs(self.abc.names, names)
+        self.assertEqual(names.multiname(0), '*')
+        self.assertEqual(names.multiname(1), 'flash.display::MovieClip')
+        self.assertEqual(names.multiname(3), 'int')
+        self.assertEqual(names.multiname(4), '__AS3__.vec::Vector.<int>')
+        self.assertEqual(names.multiname(5), 'x')
+        self.assertEqual(names.multiname(6), '*')
+        self.assertIs(names.multiname(1), names.multiname(1))
+
+    def test_bulk(self):
+        self.assertEqual(
+            self.abc.names.multinames(), [
+                '*',
+                'flash.display::MovieClip',
+                '__AS3__.vec::Vector',
+                'int',
+                '__AS3__.vec::Vector.<int>',
+                'x',
+                '*',
+            ]
+        )
+
+    def test_namespaces(self):
+        self.assertEqual(self.abc.names.namespace(2), '__AS3__.vec')
+        self.assertEqual(self.abc.names.namespace_set(1), '[flash.display, __AS3__.vec]')
+
+    def test_recursive_type_name(self):
+        # TypeName 1 with itself as parameter
+        cpool = ABCFile.CPoolInfo.from_buffer(ExtendedBufferView(b'\x00\x00\x00\x00\x00\x00\x02\x1d\x00\x01\x01'))
+        self.assertEqual(ABCFile(16, 46, cpool, [], [], [], [], [], []).names.multiname(1), '*.<*>')
+
+
+class TestABCIndex(TestCase):
+
+    def setUp(self):
+        cpool = ABCFile.CPoolInfo.from_buffer(ExtendedBufferView(CPOOL))
+        getter = TraitInfo(5, TraitAttributes.Attrbute_None, TraitType.Getter, MethodTrait(0, 1), None)
+        setter = TraitInfo(5, TraitAttributes.Attrbute_None, TraitType.Setter, MethodTrait(0, 2), None)
+        instances = [
+            ABCFile.InstanceInfo(1, 0, ABCFile.InstanceInfo.InstanceFlags(0), None, [], 0, [getter, setter]),
+            ABCFile.InstanceInfo(2, 0, ABCFile.InstanceInfo.InstanceFlags(0), None, [], 3, []),
+        ]
+        classes = [ABCFile.ClassInfo(4, []), ABCFile.ClassInfo(5, [])]
+        class_trait = TraitInfo(1, TraitAttributes.Attrbute_None, TraitType.Class, ClassTrait(0, 1), None)
+        scripts = [ABCFile.ScriptInfo(6, []), ABCFile.ScriptInfo(6, [class_trait])]
+        bodies = [ABCFile.MethodBodyInfo.from_buffer(ExtendedBufferView(METHOD_BODY.replace(b'\x00', b'\x02', 1)))]
+        self.abc = ABCFile(16, 46, cpool, [], [], instances, classes, scripts, bodies)
+
+    def test_index(self):
+        index = self.abc.index()
+        self.assertIs(self.abc.index(), index)
+        self.assertIs(index.body(2), self.abc.method_bodies[0])
+        self.assertIsNone(index.body(0))
+        self.assertEqual(index.find_class('__AS3__.vec::Vector'), (self.abc.instances[1], self.abc.classes[1]))
+        self.assertIsNone(index.find_class('Vector'))
+        self.assertEqual([trait.kind for trait in index.traits(0, 'x')], [TraitType.Getter, TraitType.Setter])
+        self.assertEqual(index.traits(0, 'x', static=True), [])
+        self.assertEqual(index.script_classes, [[], [1]])
+
+
+class TestCrossReferences(TestCase):
+
+    def setUp(self):
+        cpool = ABCFile.CPoolInfo.from_buffer(ExtendedBufferView(CPOOL))
+        # pushstring 1, getlex 3, newclass 0, newfunction 1, returnvoid
+        code = b'\x2c\x01' + b'\x60\x03' + b'\x58\x00' + b'\x40\x01' + b'\x47'
+        bodies = [
+            ABCFile.MethodBodyInfo.from_buffer(ExtendedBufferView(b'\x00\x01\x01\x00\x01' + bytes([len(CODE)]) + CODE + b'\x00\x00')),
+            ABCFile.MethodBodyInfo.from_buffer(ExtendedBufferView(b'\x01\x01\x01\x00\x01' + bytes([len(code)]) + code + b'\x00\x00')),
+        ]
+        self.abc = ABCFile(16, 46, cpool, [], [], [], [], [], bodies)
+
+    def test_uses(self):
+        references = self.abc.cross_references()
+        self.assertIs(self.abc.cross_references(), references)
+        self.assertEqual(references.multinames.uses(3), [(0, 2), (1, 2)])
+        self.assertEqual(references.strings.uses(2), [(0, 5)])
+        self.assertEqual(references.strings.uses(1), [(1, 0)])
+        self.assertEqual(references.classes.uses(0), [(1, 4)])
+        self.assertEqual(references.methods.uses(1), [(1, 6)])
+        self.assertEqual(references.methods.count(1), 1)
+        self.assertEqual(references.multinames.uses(4), [])
+        self.assertEqual(references.multinames.uses(100), [])
+
+    def test_decoded_bodies_are_not_kept(self):
+        self.abc.cross_references()
+        self.assertIsNone(self.abc.method_bodies[1]._instructions)
@@ -0,0 +1,42 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+from pyfdec.cli import expand_paths, main, summarize
+
+
+class TestCli(TestCase):
+
+    def test_summarize(self):
+        record = summarize('tests/swf/Gfx_Ahsoka_Sword.swf')
+        self.assertTrue(record['ok'])
+        self.assertEqual(record['header']['compression'], 'ZLIB')
+        self.assertEqual(record['header']['fileLength'], 17980)
+        self.assertEqual(record['tags']['FileAttributes'], 1)
+        self.assertEqual(record['tags']['End'], 1)
+        self.assertEqual(len(record['abc']), record['tags'].get('DoABC', 0) + record['tags'].get('DoABC2', 0))
+
+    def test_failure_isolation(self):
+        with tempfile.TemporaryDirectory() as directory:
+            broken = os.path.join(directory, 'broken.swf')
+            with open(broken, 'wb') as file:
+                file.write(b'XWS\x0f')
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                code = main(['--jobs', '2', broken, os.path.join(directory, 'missing.swf')])
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(code, 1)
+        self.assertEqual([record['path'] for record in records], [broken, os.path.join(directory, 'missing.swf')])
+        self.assertFalse(any(record['ok'] for record in records))
+        self.assertTrue(records[1]['error'].startswith('FileNotFoundError'))
+
+    def test_expand_paths(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ('b.swf', 'a.swf', 'c.txt'):
+                open(os.path.join(directory, name), 'wb').close()
+            with contextlib.redirect_stderr(io.StringIO()):
+                paths = expand_paths([os.path.join(directory, '*.swf'), 'plain.swf', os.path.join(directory, '*.fla')])
+        self.assertEqual(paths, [os.path.join(directory, 'a.swf'), os.path.join(directory, 'b.swf'), 'plain.swf'])
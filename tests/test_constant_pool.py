@@ -0,0 +1,52 @@
+import pickle
+from unittest import TestCase
+
+from pyfdec.abc.ABCFile import ABCFile
+from pyfdec.abc.Multinames import BaseMultiname, Multiname, QName, RTQNameL, TypeName
+from pyfdec.extended_buffer import ExtendedBufferView
+
+
+class TestConstantPool(TestCase):
+
+    def setUp(self):
+        data = b'\x03\x05\xff\xff\xff\xff\x0f'  # ints: 5, -1
+        data += b'\x02\x07'  # uints: 7
+        data += b'\x02' + b'\x00\x00\x00\x00\x00\x00\xf8\x3f'  # doubles: 1.5
+        data += b'\x04\x00\x03Foo\x04b\xc3\xa4r'  # strings: '', 'Foo', 'bär'
+        data += b'\x02\x16\x01'  # namespaces: package ''
+        data += b'\x03\x02\x01\x02\x00'  # namespace sets: {1, 2}, {}
+        data += b'\x05\x07\x01\x02\x0e\x03\x01\x12\x1d\x01\x01\x01'  # multinames: QName, MultinameA, RTQNameLA, TypeName
+        self.cpool = ABCFile.CPoolInfo.from_buffer(ExtendedBufferView(data))
+
+    def test_numbers(self):
+        self.assertEqual(list(self.cpool.ints), [5, -1])
+        self.assertEqual(list(self.cpool.uints), [7])
+        self.assertEqual(list(self.cpool.doubles), [1.5])
+
+    def test_strings(self):
+        self.assertEqual(list(self.cpool.strings), ['', 'Foo', 'bär'])
+        self.assertEqual(self.cpool.strings[-1], 'bär')
+        self.assertEqual(self.cpool.strings[1:], ['Foo', 'bär'])
+        self.assertIn('Foo', self.cpool.strings)
+        with self.assertRaises(IndexError):
+            self.cpool.strings[3]
+
+    def test_namespace_sets(self):
+        self.assertEqual(list(self.cpool.namespace_sets), [[1, 2], []])
+
+    def test_multinames(self):
+        multinames = self.cpool.multinames
+        self.assertEqual(list(multinames), [QName(1, 2), Multiname(3, 1), RTQNameL(), TypeName(1, [1])])
+        self.assertEqual(multinames.kind(1), BaseMultiname.MultinameKind.MultinameA)
+        self.assertEqual([multinames.name(position) for position in range(len(multinames))], [2, 3, 0, 0])
+        self.assertEqual(multinames.namespace(0), 1)
+        self.assertEqual(multinames.namespace_set(1), 1)
+        self.assertEqual(list(multinames.operands_of(3)), [1, 1])
+
+    def test_unknown_multiname(self):
+        data = b'\x00\x00\x00\x00\x00\x00\x02\x42'
+        with self.assertRaises(ValueError):
+            ABCFile.CPoolInfo.from_buffer(ExtendedBufferView(data))
+
+    def test_pickle(self):
+        self.assertEqual(pickle.loads(pickle.dumps(self.cpool)), self.cpool)
@@ -1,7 +1,5 @@
 from unittest import TestCase
 
-from bitarray import bitarray
-
 from pyfdec.extended_bit_io import ExtendedBitIO
 from pyfdec.extended_buffer import ExtendedBuffer
 
@@ -12,16 +10,16 @@ class TestExtendedBitIO(TestCase):
         data = b'\x01\x02\x03\x04\x05'
         buffer = ExtendedBuffer(data)
         bits = ExtendedBitIO(buffer)
-        self.assertEqual(bits.read(1), bitarray('0'))
-        self.assertEqual(bits.read(7), bitarray('0000001'))
-        self.assertEqual(bits.read(16), bitarray('00000010 00000011'))
+        self.assertEqual(bits.read_unsigned(1), 0b0)
+        self.assertEqual(bits.read_unsigned(7), 0b0000001)
+        self.assertEqual(bits.read_unsigned(16), 0b00000010_00000011)
         self.assertEqual(buffer.read_ui8(), 4)
 
     def test_byte_alignment(self):
         data = b'\x01\x02\x03\x04\x05'
         buffer = ExtendedBuffer(data)
         bits = ExtendedBitIO(buffer)
-        self.assertEqual(bits.read(7), bitarray('0000000'))
+        self.assertEqual(bits.read_unsigned(7), 0b0000000)
         self.assertEqual(buffer.read_ui8(), 2)
 
     def test_read_unsigned(self):
@@ -53,3 +51,27 @@ class TestExtendedBitIO(TestCase):
         buffer = ExtendedBuffer(data)
         bits = ExtendedBitIO(buffer)
         self.assertEqual(bits.read_fixed(32), 4.75)
+
+    def test_align(self):
+        # 101 00000 00000110 00000111
+        # 5         6        7
+        data = b'\xA0\x06\x07'
+        buffer = ExtendedBuffer(data)
+        bits = ExtendedBitIO(buffer)
+        self.assertEqual(bits.read_unsigned(3), 5)
+        bits.align()
+        self.assertEqual(bits.read_unsigned(8), 6)
+        self.assertEqual(buffer.read_ui8(), 7)
+
+    def test_read_across_bytes(self):
+        # 10 111111 11111111 ... 11111111 0000 0000
+        # 2  -1 (70 bits spanning nine bytes)   0
+        data = b'\xBF' + b'\xFF' * 8 + b'\x00'
+        buffer = ExtendedBuffer(data)
+        bits = ExtendedBitIO(buffer)
+        self.assertEqual(bits.read_unsigned(2), 2)
+        self.assertEqual(bits.read_signed(70), -1)
+        self.assertEqual(bits.read_unsigned(4), 0)
+        bits.align()
+        with self.assertRaises(EOFError):
+            bits.read_bool()
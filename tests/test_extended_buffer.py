@@ -1,7 +1,9 @@
+import io
+import pickle
 from unittest import TestCase
 
 from pyfdec.extended_bit_io import ExtendedBitIO
-from pyfdec.extended_buffer import ExtendedBuffer
+from pyfdec.extended_buffer import ExtendedBuffer, ExtendedBufferView
 
 
 class TestExtendedBuffer(TestCase):
@@ -16,12 +18,69 @@ class TestExtendedBuffer(TestCase):
     def test_bitbuffer_position(self):
         buffer: ExtendedBuffer = ExtendedBuffer(b'Hello, World!')
         with ExtendedBitIO(buffer) as bits:
-            bits.read(8 * 7)  # 'Hello, '
+            bits.padding(8 * 7)  # 'Hello, '
         string = buffer.read(5)
         self.assertEqual(buffer.tell(), 12)
         self.assertEqual(string, b'World')
 
 
+class TestExtendedBufferView(TestCase):
+
+    def test_subbuffer_shares_memory(self):
+        data = bytearray(b'Hello, World!')
+        buffer = ExtendedBufferView(data)
+        buffer.read(7)
+        result = buffer.subbuffer(5)
+        self.assertIsInstance(result, ExtendedBufferView)
+        data[7] = ord('w')
+        self.assertEqual(result.read(), b'world')
+        self.assertEqual(buffer.read(1), b'!')
+        self.assertEqual(buffer.bytes_left(), 0)
+
+    def test_reading(self):
+        data = b'\xFF\x34\x12\x78\x56\x34\x12\x00\x00\xC0\xBFabc\x00\xC0\x01\x05'
+        buffer = ExtendedBufferView(data)
+        self.assertEqual(buffer.read_si8(), -1)
+        self.assertEqual(buffer.read_ui16(), 0x1234)
+        self.assertEqual(buffer.read_ui32(), 0x12345678)
+        self.assertEqual(buffer.read_f32(), -1.5)
+        self.assertEqual(buffer.read_string(), 'abc')
+        self.assertEqual(buffer.read_fixed8(), 1.75)
+        self.assertEqual(buffer.bytes_left(), 1)
+        self.assertEqual(buffer.read_ui16(), 0x05)
+        self.assertEqual(buffer.read_ui8(), 0)
+
+    def test_pickle(self):
+        buffer = ExtendedBufferView(b'\x00Hello, World!').subbuffer(6)
+        buffer.read(1)
+        result = pickle.loads(pickle.dumps(buffer))
+        self.assertIsInstance(result, ExtendedBufferView)
+        self.assertEqual(result.read(), b'Hello')
+
+    def test_seek(self):
+        buffer = ExtendedBufferView(b'\x01\x02\x03\x04')
+        sub = buffer.subbuffer(3)
+        self.assertEqual(sub.read(2), b'\x01\x02')
+        sub.seek(0, 0)
+        self.assertEqual(sub.read_ui8(), 1)
+        self.assertEqual(sub.seek(-1, 2), 2)
+        self.assertEqual(sub.read(), b'\x03')
+        self.assertEqual(buffer.read_ui8(), 4)
+
+    def test_inherited_readers(self):
+        buffer = ExtendedBufferView(b'\x00one\ntwo\nthree').subbuffer(14)
+        buffer.read(1)
+        self.assertEqual(buffer.readline(), b'one\n')
+        self.assertEqual(list(buffer), [b'two\n', b'three'])
+        buffer.seek(1)
+        self.assertEqual(buffer.readlines(), [b'one\n', b'two\n', b'three'])
+        buffer.seek(5)
+        target = bytearray(3)
+        self.assertEqual(buffer.readinto(target), 3)
+        self.assertEqual(target, b'two')
+        self.assertRaises(io.UnsupportedOperation, buffer.writelines, [b'four'])
+
+
 class TestReading(TestCase):
 
     def test_string(self):
@@ -30,6 +89,15 @@ class TestReading(TestCase):
         string = buffer.read_string()
         self.assertEqual(string, 'Hello, World!')
 
+    def test_strings(self):
+        data = b'\xFFfirst\x00\x00' + 'l\u00e4nger als 256 '.encode('utf-8') * 20 + b'\x00rest'
+        for buffer in (ExtendedBuffer(data), ExtendedBufferView(data), ExtendedBufferView(data).subbuffer(len(data))):
+            buffer.read_ui8()
+            self.assertEqual(buffer.read_strings(3), ['first', '', 'l\u00e4nger als 256 ' * 20])
+            self.assertEqual(buffer.read_ui8(), ord('r'))
+            self.assertEqual(buffer.read_string(), 'est')
+            self.assertEqual(buffer.bytes_left(), 0)
+
     def test_fixed8(self):
         # 00000001 11000000
         # 1.75
@@ -71,6 +139,21 @@ class TestReading(TestCase):
         self.assertEqual(buffer.read_f64(), -1.5)
 
 
+class TestArrayReading(TestCase):
+
+    def test_arrays(self):
+        data = b'\x01\xFF' + b'\x34\x12\xFF\xFF' + b'\xFE\xFF\xFF\x01\x00\x00' + b'\x00\x00\xC0\xBF\x00\x00\x80\x3F' \
+            + b'\x00\x00\x00\x00\x00\x00\xF8\xBF'
+        for buffer in (ExtendedBuffer(data), ExtendedBufferView(data)):
+            self.assertEqual(buffer.read_si8_array(2), [1, -1])
+            self.assertEqual(buffer.read_ui16_array(2), [0x1234, 0xFFFF])
+            self.assertEqual(buffer.read_si24_array(2), [-2, 1])
+            self.assertEqual(buffer.read_f32_array(2), [-1.5, 1.0])
+            self.assertEqual(buffer.read_f64_array(1), [-1.5])
+            self.assertEqual(buffer.read_ui32_array(0), [])
+            self.assertEqual(buffer.bytes_left(), 0)
+
+
 class TestEncodedU32(TestCase):
 
     def test_encodedu32_max(self):
@@ -180,3 +263,24 @@ class TestEncodedU32(TestCase):
         buffer = ExtendedBuffer(data)
         value = buffer.read_encoded_u32()
         self.assertEqual(value, 2604032399)
+
+    def test_encodedu32_array(self):
+        # 64, 3289, 2604032399, 127
+        data = b'\x40\xD9\x19\x8F\xC3\xD9\xD9\x09\x7F'
+        for buffer in (ExtendedBuffer(data), ExtendedBufferView(data)):
+            self.assertEqual(buffer.read_encoded_u32_array(3), [64, 3289, 2604032399])
+            self.assertEqual(buffer.tell(), 8)
+            self.assertEqual(buffer.read_encoded_u32_array(1), [127])
+            self.assertEqual(buffer.read_encoded_u32_array(0), [])
+
+        for buffer in (ExtendedBuffer(data), ExtendedBufferView(data)):
+            self.assertEqual(buffer.read_encoded_u30_array(4), [64, 3289, 2604032399 & 0x3FFFFFFF, 127])
+
+        for buffer in (ExtendedBuffer(data), ExtendedBufferView(data)):
+            self.assertEqual(buffer.read_encoded_si32_array(4), [64, 3289, 2604032399 - 0x100000000, 127])
+
+    def test_encodedu32_array_overflow(self):
+        data = b'\x40\xFF\xFF\xFF\xFF\x7F'
+        for buffer in (ExtendedBuffer(data), ExtendedBufferView(data)):
+            with self.assertRaises(ValueError):
+                buffer.read_encoded_u32_array(2)
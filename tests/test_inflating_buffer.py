@@ -0,0 +1,64 @@
+import io
+import lzma
+import random
+import zlib
+from unittest import TestCase
+
+from pyfdec.extended_buffer import ExtendedBuffer, ExtendedBufferView
+from pyfdec.inflating_buffer import CHUNK_SIZE, InflatingBuffer, LzmaInflatingBuffer, ZlibInflatingBuffer
+
+
+class TestZlibInflatingBuffer(TestCase):
+
+    def setUp(self):
+        self.data = random.Random(0).randbytes(CHUNK_SIZE * 8)
+        self.compressed = ExtendedBuffer(b'header' + zlib.compress(self.data))
+        self.compressed.read(6)
+
+    def test_reading(self):
+        buffer = ZlibInflatingBuffer(self.compressed, len(self.data))
+        self.assertEqual(buffer.read_ui8(), self.data[0])
+        self.assertEqual(buffer.read_ui16(), int.from_bytes(self.data[1:3], byteorder='little'))
+        self.assertEqual(buffer.tell(), 3)
+        self.assertEqual(buffer.bytes_left(), len(self.data) - 3)
+        self.assertEqual(buffer.read(), self.data[3:])
+        self.assertEqual(buffer.read(1), b'')
+
+    def test_inflates_on_demand(self):
+        buffer = ZlibInflatingBuffer(self.compressed, len(self.data))
+        buffer.read(10)
+        self.assertLess(self.compressed.tell(), len(self.compressed.getbuffer()))
+
+    def test_subbuffer(self):
+        buffer = ZlibInflatingBuffer(self.compressed)
+        buffer.seek(CHUNK_SIZE * 2 + 5)
+        result = buffer.subbuffer(CHUNK_SIZE * 2)
+        self.assertIsInstance(result, ExtendedBufferView)
+        self.assertEqual(result.read(), self.data[CHUNK_SIZE * 2 + 5:CHUNK_SIZE * 4 + 5])
+        self.assertEqual(buffer.bytes_left(), len(self.data) - CHUNK_SIZE * 4 - 5)
+        with self.assertRaises(io.UnsupportedOperation):
+            buffer.seek(0)
+
+
+class TestLzmaInflatingBuffer(TestCase):
+
+    def setUp(self):
+        self.data = random.Random(0).randbytes(CHUNK_SIZE * 8)
+        # SWF stores the 5 property bytes without the 8 byte size of the .lzma header
+        compressed = lzma.compress(self.data, format=lzma.FORMAT_ALONE)
+        self.compressed = ExtendedBuffer(compressed[:5] + compressed[13:])
+
+    def test_reading(self):
+        buffer = LzmaInflatingBuffer(self.compressed, len(self.data))
+        self.assertEqual(buffer.read_ui32(), int.from_bytes(self.data[:4], byteorder='little'))
+        self.assertEqual(buffer.subbuffer(CHUNK_SIZE * 3).read(), self.data[4:CHUNK_SIZE * 3 + 4])
+        self.assertLess(self.compressed.tell(), len(self.compressed.getbuffer()))
+        self.assertEqual(buffer.bytes_left(), len(self.data) - CHUNK_SIZE * 3 - 4)
+        self.assertEqual(buffer.read(), self.data[CHUNK_SIZE * 3 + 4:])
+        self.assertEqual(buffer.read(1), b'')
+
+
+class TestInflatingBuffer(TestCase):
+
+    def test_abstract(self):
+        self.assertRaises(TypeError, InflatingBuffer, ExtendedBuffer(b''))
@@ -0,0 +1,47 @@
+from unittest import TestCase
+
+from pyfdec.extended_buffer import ExtendedBufferView
+from pyfdec.parse_stats import ParseStats, TagStats
+from pyfdec.swf import Swf
+from pyfdec.tag_registry import TAG_REGISTRY
+from pyfdec.tags.Tag import Tag
+
+
+class TestParseStats(TestCase):
+
+    def test_record(self):
+        stats = ParseStats()
+        stats.record(Tag.TagTypes.ShowFrame, 0, 0.5, 2)
+        stats.record(Tag.TagTypes.ShowFrame, 0, 0.5, 2)
+        stats.record(Tag.TagTypes.DoABC2, 100, 2.0, 10)
+        self.assertEqual(stats.tags[Tag.TagTypes.ShowFrame], TagStats(2, 0, 1.0, 4))
+        self.assertEqual(stats.total, TagStats(3, 100, 3.0, 14))
+        self.assertEqual(list(stats.as_dict()), ['DoABC2', 'ShowFrame'])
+
+        other = ParseStats()
+        other.record(Tag.TagTypes.DoABC2, 50, 1.0, 5)
+        stats.merge(other)
+        self.assertEqual(stats.tags[Tag.TagTypes.DoABC2], TagStats(2, 150, 3.0, 15))
+
+    def test_sprite_tags(self):
+        # spriteID 1, 1 frame, ShowFrame, SetBackgroundColor, End
+        data = b'\x01\x00\x01\x00' + b'\x40\x00' + b'\x43\x02\x01\x02\x03' + b'\x00\x00'
+        stats = ParseStats()
+        sprite = TAG_REGISTRY.decode(Tag.TagTypes.DefineSprite, ExtendedBufferView(data), exclude={Tag.TagTypes.SetBackgroundColor}, stats=stats)
+        self.assertEqual(set(stats.tags), {Tag.TagTypes.DefineSprite})
+        self.assertEqual(stats.tags[Tag.TagTypes.DefineSprite].size, len(data))
+
+        # The tags of the sprite are counted once they are decoded, skipped tags included
+        list(sprite.tags)  # type: ignore
+        self.assertEqual(stats.tags[Tag.TagTypes.ShowFrame].count, 1)
+        self.assertEqual(stats.tags[Tag.TagTypes.SetBackgroundColor].size, 3)
+        self.assertEqual(stats.tags[Tag.TagTypes.End].count, 1)
+
+    def test_swf(self):
+        stats = ParseStats()
+        swf = Swf.from_path('tests/swf/Gfx_Ahsoka_Sword.swf', stats=stats)
+        tags = list(swf.tags)
+        self.assertIs(swf.stats, stats)
+        self.assertEqual(stats.tags[Tag.TagTypes.End].count, 1)
+        self.assertEqual(sum(tag_stats.count for tag_type, tag_stats in stats.tags.items()), len(tags))
+        self.assertIsNone(Swf.from_path('tests/swf/Gfx_Ahsoka_Sword.swf').stats)
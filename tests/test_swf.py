@@ -1,11 +1,21 @@
+import io
+import lzma
+import os
+import struct
+import tempfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from unittest import TestCase
 
-from pyfdec.extended_buffer import ExtendedBuffer
+from pyfdec.extended_buffer import ExtendedBuffer, ExtendedBufferView
 from pyfdec.record_types.geometric_types import Rect
 from pyfdec.swf import Swf, SwfHeader
 from pyfdec.tags.DefineShape import DefineShape
 from pyfdec.tags.DefineSprite import DefineSprite
 from pyfdec.tags.DoABC import DoABC
+from pyfdec.tags.End import End
+from pyfdec.tags.RawTag import RawTag
+from pyfdec.tags.ShowFrame import ShowFrame
 from pyfdec.tags.Tag import Tag
 
 
@@ -45,6 +55,157 @@ class TestSwfFile(TestCase):
                     for shaperecord in tag.shapes.shapeRecords:
                         self.assertTrue(isinstance(shaperecord, DefineShape.ShapeWithStyle.ShapeRecord))
 
+    def test_reading_from_path(self):
+        with open('tests/swf/Gfx_Ahsoka_Sword.swf', 'rb') as file:
+            data = file.read()
+        uncompressed = b'FWS' + data[3:8] + zlib.decompress(data[8:])
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'uncompressed.swf')
+            with open(path, 'wb') as file:
+                file.write(uncompressed)
+
+            swf = Swf.from_path(path)
+            expected = Swf.from_buffer(ExtendedBuffer(data))
+            self.assertEqual(swf.header.compression, SwfHeader.CompressionLevel.NONE)
+            self.assertEqual(swf.header.frameSize, expected.header.frameSize)
+            self.assertEqual(swf.fileAttributes, expected.fileAttributes)
+            self.assertEqual([tag.tag_type for tag in swf.tags], [tag.tag_type for tag in expected.tags])
+            swf.close()
+            self.assertIsNone(swf.buffer)
+
+    def test_closing_from_path(self):
+        body = b'\x00' + b'\x00\x18' + b'\x01\x00' + b'\x44\x11' + b'\x08\x00\x00\x00' + b'\x00\x00'
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'minimal.swf')
+            with open(path, 'wb') as file:
+                file.write(b'FWS\x0F' + struct.pack('<I', 8 + len(body)) + body)
+
+            with Swf.from_path(path) as swf:
+                mapping = swf._mapping
+                self.assertEqual([tag.tag_type for tag in swf.tags], [Tag.TagTypes.End])
+            self.assertTrue(mapping.closed)
+
+            with open(path, 'wb'):
+                pass
+            self.assertRaises(ValueError, Swf.from_path, path)
+
+    def test_reading_streaming(self):
+        with open('tests/swf/Gfx_Ahsoka_Sword.swf', 'rb') as file:
+            data = file.read()
+        swf = Swf.from_buffer(ExtendedBuffer(data), streaming=True)
+        expected = Swf.from_buffer(ExtendedBuffer(data))
+        self.assertEqual(swf.header, expected.header)
+        self.assertEqual(swf.fileAttributes, expected.fileAttributes)
+        self.assertEqual([tag.tag_type for tag in swf.tags], [tag.tag_type for tag in expected.tags])
+
+    def test_reading_streaming_lzma(self):
+        with open('tests/swf/Gfx_Ahsoka_Sword.swf', 'rb') as file:
+            data = file.read()
+        compressed = lzma.compress(zlib.decompress(data[8:]), format=lzma.FORMAT_ALONE)
+        data = b'ZWS' + data[3:8] + struct.pack('<I', len(compressed) - 13) + compressed[:5] + compressed[13:]
+
+        swf = Swf.from_buffer(ExtendedBuffer(data), streaming=True)
+        expected = Swf.from_buffer(ExtendedBuffer(data))
+        self.assertEqual(swf.header.compression, SwfHeader.CompressionLevel.LZMA)
+        self.assertEqual(swf.header, expected.header)
+        self.assertEqual([tag.tag_type for tag in swf.tags], [tag.tag_type for tag in expected.tags])
+
+    def test_reading_selected_tags(self):
+        with open('tests/swf/Gfx_Ahsoka_Sword.swf', 'rb') as file:
+            data = file.read()
+        expected = list(Swf.from_buffer(ExtendedBuffer(data)).tags)
+        included = list(Swf.from_buffer(ExtendedBuffer(data), include={Tag.TagTypes.DoABC, Tag.TagTypes.DoABC2}).tags)
+        excluded = list(Swf.from_buffer(ExtendedBuffer(data), exclude={Tag.TagTypes.DefineShape}).tags)
+        self.assertEqual([tag.tag_type for tag in included], [tag.tag_type for tag in expected])
+        self.assertEqual([tag.tag_type for tag in excluded], [tag.tag_type for tag in expected])
+        for tag in included:
+            if tag.tag_type in (Tag.TagTypes.DoABC, Tag.TagTypes.DoABC2, Tag.TagTypes.DefineSprite, Tag.TagTypes.End):
+                self.assertNotIsInstance(tag, RawTag)
+            else:
+                self.assertIsInstance(tag, RawTag)
+        for tag in excluded:
+            self.assertEqual(isinstance(tag, RawTag), tag.tag_type == Tag.TagTypes.DefineShape)
+
+    def test_tag_selection(self):
+        self.assertTrue(Tag.is_selected(Tag.TagTypes.DoABC))
+        self.assertTrue(Tag.is_selected(Tag.TagTypes.DoABC, include={Tag.TagTypes.DoABC}))
+        self.assertFalse(Tag.is_selected(Tag.TagTypes.DefineShape, include={Tag.TagTypes.DoABC}))
+        self.assertFalse(Tag.is_selected(Tag.TagTypes.DoABC, exclude={Tag.TagTypes.DoABC}))
+        self.assertFalse(Tag.is_selected(Tag.TagTypes.DoABC, include={Tag.TagTypes.DoABC}, exclude={Tag.TagTypes.DoABC}))
+
+    def test_sprite_selection(self):
+        # DefineSprite with spriteID 1, 1 frame, ShowFrame, SetBackgroundColor, End followed by End
+        data = b'\xCD\x09' + b'\x01\x00\x01\x00' + b'\x40\x00' + b'\x43\x02\x01\x02\x03' + b'\x00\x00' + b'\x00\x00'
+        sprite = next(Swf.get_tag_list(ExtendedBufferView(data), include={Tag.TagTypes.ShowFrame}))
+        self.assertIsInstance(sprite, DefineSprite)
+        self.assertEqual([type(tag) for tag in sprite.tags], [ShowFrame, RawTag, End])  # type: ignore
+
+        sprite = next(Swf.get_tag_list(ExtendedBufferView(data), include={Tag.TagTypes.SetBackgroundColor}))
+        self.assertIsInstance(sprite, RawTag)
+        exclude = {Tag.TagTypes.DefineSprite}
+        sprite = next(Swf.get_tag_list(ExtendedBufferView(data), include={Tag.TagTypes.ShowFrame}, exclude=exclude))
+        self.assertIsInstance(sprite, RawTag)
+
+    def test_index(self):
+        with open('tests/swf/Gfx_Ahsoka_Sword.swf', 'rb') as file:
+            data = file.read()
+        swf = Swf.from_buffer(ExtendedBuffer(data))
+        index = swf.index()
+        tags = [swf.fileAttributes, *swf.tags]
+        self.assertIs(swf.index(), index)
+        self.assertEqual(len(index), len(tags))
+        self.assertEqual([entry.tag_type for entry in index], [tag.tag_type for tag in tags])
+        self.assertEqual(index[0].tag_type, Tag.TagTypes.FileAttributes)
+        self.assertEqual(index[-1].tag_type, Tag.TagTypes.End)
+        self.assertEqual(index.decode(0), swf.fileAttributes)
+
+        shapes = [tag for tag in tags if isinstance(tag, DefineShape)]
+        shape = index.decode_character(shapes[-1].shapeID)
+        self.assertIsInstance(shape, DefineShape)
+        self.assertEqual(shape.shapeID, shapes[-1].shapeID)
+        self.assertEqual(shape.shapeBounds, shapes[-1].shapeBounds)
+        with self.assertRaises(KeyError):
+            index.character_position(0xFFFF)
+
+        streaming = Swf.from_buffer(ExtendedBuffer(data), streaming=True)
+        with self.assertRaises(io.UnsupportedOperation):
+            streaming.index()
+
+    def test_reading_parallel(self):
+        with open('tests/swf/Gfx_Ahsoka_Sword.swf', 'rb') as file:
+            data = file.read()
+        expected = list(Swf.from_buffer(ExtendedBuffer(data)).tags)
+        with ProcessPoolExecutor(2) as executor:
+            tags = list(Swf.from_buffer(ExtendedBuffer(data), executor=executor).tags)
+            with self.assertRaises(io.UnsupportedOperation):
+                Swf.from_buffer(ExtendedBuffer(data), streaming=True, executor=executor)
+        self.assertEqual([tag.tag_type for tag in tags], [tag.tag_type for tag in expected])
+        for tag, expected_tag in zip(tags, expected):
+            if isinstance(tag, DoABC):
+                self.assertEqual(tag.ABCData, expected_tag.ABCData)  # type: ignore
+
+    def test_parallel_pending(self):
+        # 10 DefineBits tags with long headers, each large enough to be decoded on the executor
+        image = b'\xBF\x01' + struct.pack('<I', 5000) + b'\x01\x00' + bytes(4998)
+        body = b'\x00' + b'\x00\x18' + b'\x01\x00' + b'\x44\x11' + b'\x08\x00\x00\x00' + image * 10 + b'\x00\x00'
+        data = b'FWS\x0F' + struct.pack('<I', 8 + len(body)) + body
+
+        class CountingExecutor(ThreadPoolExecutor):
+            submitted = 0
+
+            def submit(self, *args, **kwargs):
+                CountingExecutor.submitted += 1
+                return super().submit(*args, **kwargs)
+
+        with CountingExecutor(2) as executor:
+            tags = Swf.get_tag_list_parallel(ExtendedBufferView(data[19:]), executor, max_pending=2)
+            for handed_out in range(1, 11):
+                self.assertEqual(next(tags).tag_type, Tag.TagTypes.DefineBits)
+                self.assertLessEqual(CountingExecutor.submitted, handed_out + 2)
+            self.assertEqual(CountingExecutor.submitted, 10)
+            self.assertEqual([tag.tag_type for tag in tags], [Tag.TagTypes.End])
+
     def test_reading_bhair(self):
         # brawlhalla air version: 8.12
         with open('tests/swf/BrawlhallaAir.swf', 'rb') as file:
@@ -0,0 +1,69 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from pyfdec.extended_buffer import ExtendedBuffer
+from pyfdec.swf import Swf
+from pyfdec.swf_cache import SwfCache
+from pyfdec.tags.Tag import Tag
+
+
+class TestSwfCache(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = SwfCache(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_key(self):
+        key = SwfCache.key(b'FWS')
+        self.assertEqual(key, SwfCache.key(memoryview(b'FWS')))
+        self.assertNotEqual(key, SwfCache.key(b'CWS'))
+        self.assertNotEqual(key, SwfCache.key(b'FWS', include={Tag.TagTypes.DoABC}))
+        self.assertNotEqual(SwfCache.key(b'FWS', include={Tag.TagTypes.DoABC}), SwfCache.key(b'FWS', exclude={Tag.TagTypes.DoABC}))
+        self.assertEqual(
+            SwfCache.key(b'FWS', include=[Tag.TagTypes.DoABC, Tag.TagTypes.DoABC2]),
+            SwfCache.key(b'FWS', include=[Tag.TagTypes.DoABC2, Tag.TagTypes.DoABC]),
+        )
+
+    def test_get_put(self):
+        self.assertIsNone(self.cache.get('a'))
+        self.cache.put('a', [1, 2, 3])
+        self.assertEqual(self.cache.get('a'), [1, 2, 3])
+
+    def test_damaged_entry(self):
+        self.cache.put('a', [1, 2, 3])
+        with open(os.path.join(self.directory.name, 'a.pickle'), 'wb') as file:
+            file.write(b'\x80')
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+    def test_stale_entry(self):
+        with open(os.path.join(self.directory.name, 'a.pickle'), 'wb') as file:
+            file.write(b'cpyfdec.swf\nMovedClass\n(tR.')
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+    def test_eviction(self):
+        self.cache.put('a', bytes(1000))
+        self.cache.put('b', bytes(1000))
+        os.utime(os.path.join(self.directory.name, 'a.pickle'), (0, 0))
+        os.utime(os.path.join(self.directory.name, 'b.pickle'), (1, 1))
+        self.cache.get('a')
+        self.cache.max_size = 2500
+        self.cache.put('c', bytes(1000))
+        self.assertEqual(sorted(os.listdir(self.directory.name)), ['a.pickle', 'c.pickle'])
+
+    def test_swf(self):
+        with open('tests/swf/Gfx_Ahsoka_Sword.swf', 'rb') as file:
+            data = file.read()
+        expected = Swf.from_buffer(ExtendedBuffer(data), cache=self.cache)
+        expected_tags = list(expected.tags)
+        swf = Swf.from_buffer(ExtendedBuffer(data), cache=self.cache)
+        self.assertIsNone(swf.buffer)
+        self.assertEqual(swf.header, expected.header)
+        self.assertEqual(swf.fileAttributes, expected.fileAttributes)
+        self.assertEqual([tag.tag_type for tag in swf.tags], [tag.tag_type for tag in expected_tags])
+        self.assertEqual(len(os.listdir(self.directory.name)), 1)
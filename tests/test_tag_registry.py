@@ -0,0 +1,56 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+from pyfdec.extended_buffer import ExtendedBufferView
+from pyfdec.tag_registry import SPRITE_TAG_REGISTRY, TAG_REGISTRY, TagRegistry
+from pyfdec.tags.DefineSprite import DefineSprite
+from pyfdec.tags.RawTag import RawTag
+from pyfdec.tags.SetBackgroundColor import SetBackgroundColor
+from pyfdec.tags.ShowFrame import ShowFrame
+from pyfdec.tags.Tag import Tag
+
+
+class TestTagRegistry(TestCase):
+
+    def test_decode(self):
+        tag = TAG_REGISTRY.decode(Tag.TagTypes.SetBackgroundColor, ExtendedBufferView(b'\x01\x02\x03'))
+        self.assertIsInstance(tag, SetBackgroundColor)
+        tag = TAG_REGISTRY.decode(Tag.TagTypes.SetBackgroundColor, ExtendedBufferView(b'\x01\x02\x03'), exclude={Tag.TagTypes.SetBackgroundColor})
+        self.assertIsInstance(tag, RawTag)
+        with self.assertRaises(NotImplementedError):
+            TAG_REGISTRY.decode(Tag.TagTypes.DoAction, ExtendedBufferView(b''))
+
+    def test_override(self):
+        registry = TagRegistry(TAG_REGISTRY)
+        registry.register(Tag.TagTypes.ShowFrame, lambda buffer: RawTag(Tag.TagTypes.ShowFrame, buffer))
+        self.assertIsInstance(registry.decode(Tag.TagTypes.ShowFrame, ExtendedBufferView(b'')), RawTag)
+        self.assertIsInstance(TAG_REGISTRY.decode(Tag.TagTypes.ShowFrame, ExtendedBufferView(b'')), ShowFrame)
+        registry.unregister(Tag.TagTypes.ShowFrame)
+        self.assertIsInstance(registry.decode(Tag.TagTypes.ShowFrame, ExtendedBufferView(b'')), ShowFrame)
+
+    def test_sprite_allowlist(self):
+        self.assertIsInstance(SPRITE_TAG_REGISTRY.decode(Tag.TagTypes.ShowFrame, ExtendedBufferView(b'')), ShowFrame)
+        with self.assertRaises(ValueError):
+            SPRITE_TAG_REGISTRY.decode(Tag.TagTypes.SetBackgroundColor, ExtendedBufferView(b'\x01\x02\x03'))
+        with self.assertRaises(NotImplementedError):
+            SPRITE_TAG_REGISTRY.decode(Tag.TagTypes.DoAction, ExtendedBufferView(b''))
+
+    def test_sprite_tags(self):
+        # spriteID 1, 1 frame, ShowFrame, SetBackgroundColor, End
+        data = b'\x01\x00\x01\x00' + b'\x40\x00' + b'\x43\x02\x01\x02\x03' + b'\x00\x00'
+        sprite = TAG_REGISTRY.decode(Tag.TagTypes.DefineSprite, ExtendedBufferView(data), exclude={Tag.TagTypes.SetBackgroundColor})
+        self.assertIsInstance(sprite, DefineSprite)
+        self.assertEqual([tag.tag_type for tag in sprite.tags], [Tag.TagTypes.ShowFrame, Tag.TagTypes.SetBackgroundColor, Tag.TagTypes.End])
+
+        sprite = TAG_REGISTRY.decode(Tag.TagTypes.DefineSprite, ExtendedBufferView(data))
+        with self.assertRaises(ValueError):
+            list(sprite.tags)  # type: ignore
+
+    def test_lazy_imports(self):
+        # Only the modules needed to read the header are imported with pyfdec.swf
+        statement = 'import sys, pyfdec.swf; print(" ".join(sys.modules))'
+        modules = subprocess.run([sys.executable, '-c', statement], check=True, capture_output=True, text=True).stdout.split()
+        self.assertNotIn('pyfdec.tags.DoABC', modules)
+        self.assertNotIn('pyfdec.abc.ABCFile', modules)
+        self.assertNotIn('concurrent.futures', modules)